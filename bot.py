@@ -1,5 +1,5 @@
 import os
-from typing import Union
+from typing import Optional, Union
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
@@ -9,44 +9,86 @@ import sys
 import functools
 from discord import app_commands
 import json
+import hashlib
+import itertools
+import logging
+import logging.handlers
+import queue
 
 # Import database connection management
-from database.connection import initialize_database, get_pool, close_pool
+from database.connection import initialize_database, get_pool, get_pool_stats, close_pool
 from database.cache import close_redis, set_cache, get_redis_client
 from cachetools import TTLCache
 from lists import config
 
-prefix_cache = TTLCache(maxsize=1000, ttl=3600)
+try:
+    import uvloop
 
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
 
-class DualStream:
-    def __init__(self, original_stream, log_file):
-        self.original_stream = original_stream
-        self.log_file = log_file
+# When run as a script this module is __main__; register it as "bot" too so cogs that import from it
+# share this instance instead of executing a second copy with its own bot, log file and caches.
+if __name__ == "__main__":
+    sys.modules.setdefault("bot", sys.modules[__name__])
+
+# Sized to hold every guild; prefix changes arrive over pub/sub, so the TTL is only a backstop
+# for missed messages.
+prefix_cache = TTLCache(maxsize=100_000, ttl=86_400)
 
-    def write(self, data):
-        self.original_stream.write(data)
-        self.log_file.write(data)
-        self.log_file.flush()
+# Cache misses that arrive within this window are resolved with a single query.
+PREFIX_BATCH_WINDOW = 0.005
+_pending_prefixes: dict[int, asyncio.Future] = {}
+# A single statement text for every batch size, so asyncpg's statement cache serves it prepared.
+PREFIX_QUERY = "SELECT guild_id, prefix FROM guild_prefixes WHERE guild_id = ANY($1::bigint[])"
+_prefix_batch_task: Optional[asyncio.Task] = None
 
-    def flush(self):
-        self.original_stream.flush()
-        self.log_file.flush()
 
+log = logging.getLogger(__name__)
 
-log_file = open("bot.log", "a")
-sys.stdout = DualStream(sys.stdout, log_file)
-sys.stderr = DualStream(sys.stderr, log_file)
+LOG_FILE = "bot.log"
+LOG_FILE_MAX_BYTES = 10_000_000
+LOG_FILE_BACKUP_COUNT = 5
 
-print("Logging started.")
 
-intents = discord.Intents.all()
+def setup_logging() -> logging.handlers.QueueListener:
+    """Routes all log records through a queue so console and bot.log writes happen off the event loop."""
+    log_queue = queue.SimpleQueue()
+    formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT, encoding="utf-8"
+    )
+    file_handler.setFormatter(formatter)
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, file_handler)
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root_logger.setLevel(logging.INFO)
+    listener.start()
+    log.info("Logging started.")
+    return listener
+
+
+# Members back the Redis member caches, presences back aboutuser's status field, and message content backs the
+# prefix commands. Typing events are never handled, so skip them.
+intents = discord.Intents.default()
+intents.members = True
+intents.presences = True
+intents.message_content = True
+intents.typing = False
 
 
 class MyBot(commands.AutoShardedBot):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # on_ready fires again after every gateway reconnect; one-time startup work checks this.
+        self._ready_once = False
+
     async def is_owner(self, user: Union[discord.User, discord.Member]) -> bool:
         if user is not None and getattr(user, "id", None) is not None:
-            return user.id in config.Owners.__dict__.values()
+            return user.id in config.OwnerIds
         raise ValueError("User/User ID was None, or user object had no ID property")
 
 
@@ -58,49 +100,116 @@ async def get_prefix(bot, message):
     if guild_id in prefix_cache:
         return prefix_cache[guild_id]
 
+    future = _pending_prefixes.get(guild_id)
+    if future is None:
+        future = asyncio.get_running_loop().create_future()
+        _pending_prefixes[guild_id] = future
+        _schedule_prefix_flush()
+
+    # Shield the shared future so one cancelled caller doesn't fail the others.
+    return await asyncio.shield(future)
+
+
+def _schedule_prefix_flush():
+    """Starts a flush of the pending prefix lookups unless one is already waiting to run."""
+    global _prefix_batch_task
+    if _prefix_batch_task is None or _prefix_batch_task.done():
+        _prefix_batch_task = asyncio.create_task(_flush_prefix_batch())
+
+
+async def _fetch_prefixes(pool, guild_ids):
+    """Returns the resolved prefix for each guild ID, defaulting to "o!"."""
+    # pool.fetch acquires and releases a connection internally.
+    rows = await pool.fetch(PREFIX_QUERY, list(guild_ids))
+    stored = {row["guild_id"]: row["prefix"] for row in rows}
+    return {guild_id: stored.get(guild_id, "o!") for guild_id in guild_ids}
+
+
+async def _flush_prefix_batch():
+    """Resolves every pending prefix lookup with one query."""
+    global _pending_prefixes, _prefix_batch_task
+    batch = {}
+    try:
+        await asyncio.sleep(PREFIX_BATCH_WINDOW)
+        # Misses that arrive while this batch is being fetched go into a fresh dict for the next flush.
+        batch, _pending_prefixes = _pending_prefixes, {}
+
+        pool = await get_pool()
+        if not pool:
+            for future in batch.values():
+                if not future.done():
+                    future.set_result("o!")
+            return
+
+        prefixes = await _fetch_prefixes(pool, batch)
+
+        for guild_id, future in batch.items():
+            prefix_cache[guild_id] = prefixes[guild_id]
+            if not future.done():
+                future.set_result(prefixes[guild_id])
+    except asyncio.CancelledError:
+        for future in batch.values():
+            future.cancel()
+        raise
+    except Exception as e:
+        for future in batch.values():
+            if not future.done():
+                future.set_exception(e)
+    finally:
+        if _pending_prefixes:
+            # This task is still running, so schedule the next flush directly.
+            _prefix_batch_task = asyncio.create_task(_flush_prefix_batch())
+
+
+async def warm_prefix_cache():
+    """Preloads the prefix of every guild the bot is in, including default-prefix guilds."""
+    guild_ids = [guild.id for guild in bot.guilds]
+    if not guild_ids:
+        return
+
     pool = await get_pool()
     if not pool:
-        return "o!"
-
-    async with pool.acquire() as conn:
-        result = await conn.fetchval(
-            "SELECT value FROM guild_settings WHERE guild_id = $1 AND key = 'prefix'",
-            guild_id,
-        )
-        prefix = "o!"
-        if result:
-            # The value is stored as a JSON string, so we need to parse it.
-            prefix = json.loads(result)
+        log.warning("Database not available, skipping prefix cache warm-up.")
+        return
 
-        prefix_cache[guild_id] = prefix
-        return prefix
+    try:
+        prefixes = await _fetch_prefixes(pool, guild_ids)
+        prefix_cache.update(prefixes)
+        log.info(f"Warmed prefix cache for {len(prefixes)} guilds.")
+    except Exception as e:
+        log.error(f"Failed to warm prefix cache: {e}")
 
 
 async def prefix_update_listener():
     redis = await get_redis_client()
     if not redis:
-        print("Redis not available, prefix update listener will not run.")
+        log.warning("Redis not available, prefix update listener will not run.")
         return
 
     pubsub = redis.pubsub()
     await pubsub.subscribe("prefix_updates")
-    print("Subscribed to prefix_updates channel.")
+    log.info("Subscribed to prefix_updates channel.")
 
-    while True:
-        try:
-            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
-            if message and message["type"] == "message":
-                print(f"Received raw prefix update: {message['data']}")
+    try:
+        while True:
+            try:
+                # timeout=None blocks until the socket is readable instead of waking up to poll.
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+                if not message or message["type"] != "message":
+                    continue
+                log.info(f"Received raw prefix update: {message['data']}")
                 data = message["data"].decode("utf-8")
-                guild_id_str, new_prefix_json = data.split(":", 1)
+                # Messages are "<guild_id>:<prefix>" with the prefix as plain text.
+                guild_id_str, new_prefix = data.split(":", 1)
                 guild_id = int(guild_id_str)
-                new_prefix = json.loads(new_prefix_json)
                 prefix_cache[guild_id] = new_prefix
-                print(f"Updated prefix for guild {guild_id} to '{new_prefix}'")
-        except asyncio.CancelledError:
-            break
-        except Exception as e:
-            print(f"Error in prefix_update_listener: {e}")
+                log.info(f"Updated prefix for guild {guild_id} to '{new_prefix}'")
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                log.error(f"Error in prefix_update_listener: {e}")
+    finally:
+        await pubsub.unsubscribe("prefix_updates")
 
 
 bot = MyBot(command_prefix=get_prefix, intents=intents, help_command=None)
@@ -108,6 +217,18 @@ bot.launch_time = discord.utils.utcnow()
 
 ERROR_NOTIFICATION_USER_ID = config.Owners.ILIKEPANCAKES
 ERROR_NOTIFICATION_CHANNEL_ID = getattr(config, "ERROR_NOTIFICATION_CHANNEL_ID", None)
+# Resolved on the first error DM and reused, so error storms don't each cost a fetch_user request.
+_error_user: Optional[discord.abc.User] = None
+_error_user_lock = asyncio.Lock()
+
+
+# Notifications are cut to 1500 characters anyway, so deep discord.py/aiohttp stacks aren't formatted in full.
+# The limit is negative so the innermost frames, where the error was raised, are the ones kept.
+TRACEBACK_FRAME_LIMIT = 15
+
+
+def _format_traceback(error_type, error, error_traceback):
+    return "".join(traceback.format_exception(error_type, error, error_traceback, limit=-TRACEBACK_FRAME_LIMIT))
 
 
 def catch_exceptions(func):
@@ -116,14 +237,7 @@ def catch_exceptions(func):
         try:
             return await func(*args, **kwargs)
         except Exception as e:
-            tb_string = "".join(traceback.format_exception(type(e), e, e.__traceback__)).strip()
-
-            print(f"Uncaught exception in {func.__name__}:")
-            print(tb_string)
-
-            context = f"Function: {func.__name__}, Module: {func.__module__}"
-            if args and hasattr(args[0], "__class__"):
-                context += f", Class: {args[0].__class__.__name__}"
+            log.exception(f"Uncaught exception in {func.__name__}:")
 
             bot_instance = None
             if args and hasattr(args[0], "bot"):
@@ -134,6 +248,10 @@ def catch_exceptions(func):
                 bot_instance = bot
 
             if bot_instance:
+                context = f"Function: {func.__name__}, Module: {func.__module__}"
+                if args and hasattr(args[0], "__class__"):
+                    context += f", Class: {args[0].__class__.__name__}"
+                tb_string = _format_traceback(type(e), e, e.__traceback__).strip()
                 await send_error_dm(
                     bot_instance,
                     error_type=type(e).__name__,
@@ -147,51 +265,64 @@ def catch_exceptions(func):
     return wrapper
 
 
-async def load_cogs():
-    cogs_to_exclude = {
-        "aimod",  # Deprecated, functionality split into other cogs
+ALWAYS_EXCLUDED_COGS = frozenset(
+    {
         "ban_appeal_cog",  # Obsolete, functionality replaced by appeal_cog
     }
+)
+
+
+async def load_cogs():
+    cogs_to_exclude = set(ALWAYS_EXCLUDED_COGS)
     if not getattr(config, "LOAD_CONFIG_COG", True):
         cogs_to_exclude.add("config_cog")
     dashboard_cfg = getattr(config, "Dashboard", None)
     if not (dashboard_cfg and getattr(dashboard_cfg, "COMMAND_ENABLED", False)):
         cogs_to_exclude.add("dashboard_link_cog")
-    for filename in os.listdir("cogs"):
-        if filename.endswith(".py"):
-            cog_name = filename[:-3]
-            if cog_name in cogs_to_exclude or filename.startswith("_"):
-                continue
-            try:
-                await bot.load_extension(f"cogs.{cog_name}")
-                print(f"Loaded cog: {cog_name}")
-            except Exception as e:
-                print(f"Failed to load cog {cog_name}: {e}")
-                tb_string = "".join(traceback.format_exception(type(e), e, e.__traceback__))
-                try:
-                    await send_error_dm(
-                        bot,
-                        error_type=type(e).__name__,
-                        error_message=str(e),
-                        error_traceback=tb_string,
-                        context_info=f"Error loading cog: {cog_name}",
-                    )
-                except Exception as dm_error:
-                    print(f"Failed to send error DM for cog loading error: {dm_error}")
+    with os.scandir("cogs") as entries:
+        cog_names = [
+            entry.name[:-3]
+            for entry in entries
+            if entry.name.endswith(".py")
+            and not entry.name.startswith("_")
+            and entry.name[:-3] not in cogs_to_exclude
+            and entry.is_file()
+        ]
+    # Each cog reports its own failure, so one bad cog doesn't stop the others from loading.
+    await asyncio.gather(*(_load_cog(cog_name) for cog_name in cog_names))
+
+
+async def _load_cog(cog_name):
+    try:
+        await bot.load_extension(f"cogs.{cog_name}")
+        log.info(f"Loaded cog: {cog_name}")
+    except Exception as e:
+        log.error(f"Failed to load cog {cog_name}: {e}")
+        tb_string = _format_traceback(type(e), e, e.__traceback__)
+        try:
+            await send_error_dm(
+                bot,
+                error_type=type(e).__name__,
+                error_message=str(e),
+                error_traceback=tb_string,
+                context_info=f"Error loading cog: {cog_name}",
+            )
+        except Exception as dm_error:
+            log.error(f"Failed to send error DM for cog loading error: {dm_error}")
 
 
 async def send_error_dm(bot_instance, error_type, error_message, error_traceback=None, context_info=None):
     try:
-        error_content = f"**Error Type:** {error_type}\n"
-        error_content += f"**Error Message:** {error_message}\n"
+        parts = [f"**Error Type:** {error_type}", f"**Error Message:** {error_message}"]
 
         if context_info:
-            error_content += f"**Context:** {context_info}\n"
+            parts.append(f"**Context:** {context_info}")
 
         if error_traceback:
-            if len(error_traceback) > 1500:
-                error_traceback = error_traceback[:1500] + "...(truncated)"
-            error_content += f"**Traceback:**\n```\n{error_traceback.strip()}\n```"
+            truncated = "...(truncated)" if len(error_traceback) > 1500 else ""
+            parts.append(f"**Traceback:**\n```\n{(error_traceback[:1500] + truncated).strip()}\n```")
+
+        error_content = "\n".join(parts)
 
         if ERROR_NOTIFICATION_CHANNEL_ID:
             channel = bot_instance.get_channel(ERROR_NOTIFICATION_CHANNEL_ID)
@@ -201,28 +332,44 @@ async def send_error_dm(bot_instance, error_type, error_message, error_traceback
                 except Exception:
                     channel = None
             if not channel:
-                print(f"Could not find channel with ID {ERROR_NOTIFICATION_CHANNEL_ID} to send error notification")
+                log.warning(
+                    f"Could not find channel with ID {ERROR_NOTIFICATION_CHANNEL_ID} to send error notification"
+                )
                 return
             await channel.send(error_content)
             return
 
-        user = await bot_instance.fetch_user(ERROR_NOTIFICATION_USER_ID)
+        user = await _get_error_user(bot_instance)
         if not user:
-            print(f"Could not find user with ID {ERROR_NOTIFICATION_USER_ID} to send error notification")
+            log.warning(f"Could not find user with ID {ERROR_NOTIFICATION_USER_ID} to send error notification")
             return
 
         await user.send(error_content)
     except Exception as e:
-        print(f"Failed to send error DM: {e}")
+        global _error_user
+        _error_user = None
+        log.error(f"Failed to send error DM: {e}")
+
+
+async def _get_error_user(bot_instance):
+    """Returns the user that receives error DMs, fetching it only on the first call."""
+    global _error_user
+    if _error_user is None:
+        # Concurrent errors wait for a single lookup instead of each calling fetch_user.
+        async with _error_user_lock:
+            if _error_user is None:
+                _error_user = bot_instance.get_user(ERROR_NOTIFICATION_USER_ID) or await bot_instance.fetch_user(
+                    ERROR_NOTIFICATION_USER_ID
+                )
+    return _error_user
 
 
 @bot.event
 async def on_error(event, *args, **kwargs):
     error_type, error_value, error_traceback = sys.exc_info()
-    tb_string = "".join(traceback.format_exception(error_type, error_value, error_traceback))
+    tb_string = _format_traceback(error_type, error_value, error_traceback)
 
-    print(f"Error in event {event}:")
-    print(tb_string)
+    log.error(f"Error in event {event}:\n{tb_string}")
 
     context = f"Event: {event}"
     if args:
@@ -239,6 +386,68 @@ async def on_error(event, *args, **kwargs):
     )
 
 
+# User-facing messages for expected errors, keyed by error class. Errors without an entry
+# (including any parent class) are treated as unexpected and reported to the owner.
+_COMMAND_ERROR_MESSAGES = {
+    commands.CommandNotFound: lambda ctx, error: (
+        f"❌ Command `{ctx.invoked_with}` not found. Use `{ctx.prefix}help` to see available commands."
+    ),
+    commands.MissingRequiredArgument: lambda ctx, error: (
+        f"❌ Missing required argument: `{error.param.name}`. Use `{ctx.prefix}help {ctx.command}` for usage information."
+    ),
+    commands.BadArgument: lambda ctx, error: (
+        f"❌ Invalid argument provided. Use `{ctx.prefix}help {ctx.command}` for usage_information."
+    ),
+    commands.TooManyArguments: lambda ctx, error: (
+        f"❌ Too many arguments provided. Use `{ctx.prefix}help {ctx.command}` for usage information."
+    ),
+    commands.MissingPermissions: lambda ctx, error: (
+        f"❌ You don't have permission to use this command. Required permissions: {', '.join(error.missing_permissions)}"
+    ),
+    commands.BotMissingPermissions: lambda ctx, error: (
+        "❌ I don't have the required permissions to execute this command. "
+        f"Missing permissions: {', '.join(error.missing_permissions)}"
+    ),
+    commands.NoPrivateMessage: lambda ctx, error: "❌ This command cannot be used in private messages.",
+    commands.PrivateMessageOnly: lambda ctx, error: "❌ This command can only be used in private messages.",
+    commands.NotOwner: lambda ctx, error: "❌ This command can only be used by the bot owner.",
+    commands.CommandOnCooldown: lambda ctx, error: (
+        f"❌ Command is on cooldown. Try again in {error.retry_after:.2f} seconds."
+    ),
+    commands.DisabledCommand: lambda ctx, error: "❌ This command is currently disabled.",
+    commands.CheckFailure: lambda ctx, error: "❌ You don't have permission to use this command.",
+}
+
+_APP_COMMAND_ERROR_MESSAGES = {
+    app_commands.CommandNotFound: lambda interaction, error: f"❌ Command `{error.name}` not found.",
+    app_commands.MissingPermissions: lambda interaction, error: (
+        f"❌ You are missing the following required permissions: {', '.join(error.missing_permissions)}"
+    ),
+    app_commands.BotMissingPermissions: lambda interaction, error: (
+        "❌ I don't have the required permissions to execute this command. "
+        f"Missing permissions: {', '.join(error.missing_permissions)}"
+    ),
+    app_commands.NoPrivateMessage: lambda interaction, error: "❌ This command cannot be used in private messages.",
+    app_commands.CommandOnCooldown: lambda interaction, error: (
+        f"❌ This command is on cooldown. Try again in {error.retry_after:.2f} seconds."
+    ),
+    app_commands.CheckFailure: lambda interaction, error: "❌ You don't have permission to use this command.",
+    app_commands.TransformerError: lambda interaction, error: f"❌ Invalid input provided: {str(error)}",
+    commands.MissingRequiredArgument: lambda interaction, error: f"❌ Missing required argument: `{error.param.name}`.",
+    commands.BadArgument: lambda interaction, error: "❌ Invalid argument provided.",
+    commands.NotOwner: lambda interaction, error: "❌ This command can only be used by the bot owner.",
+}
+
+
+def _find_error_handler(handlers, error):
+    """Returns the message handler for the most specific class of ``error`` in ``handlers``."""
+    for error_class in type(error).__mro__:
+        handler = handlers.get(error_class)
+        if handler is not None:
+            return handler
+    return None
+
+
 @bot.event
 async def on_command_error(ctx, error):
     error = getattr(error, "original", error)
@@ -247,45 +456,9 @@ async def on_command_error(ctx, error):
     user_message = None
     should_notify_owner = True
 
-    if isinstance(error, commands.CommandNotFound):
-        user_message = f"❌ Command `{ctx.invoked_with}` not found. Use `{ctx.prefix}help` to see available commands."
-        should_notify_owner = False
-    elif isinstance(error, commands.MissingRequiredArgument):
-        user_message = f"❌ Missing required argument: `{error.param.name}`. Use `{ctx.prefix}help {ctx.command}` for usage information."
-        should_notify_owner = False
-    elif isinstance(error, commands.BadArgument):
-        user_message = f"❌ Invalid argument provided. Use `{ctx.prefix}help {ctx.command}` for usage_information."
-        should_notify_owner = False
-    elif isinstance(error, commands.TooManyArguments):
-        user_message = f"❌ Too many arguments provided. Use `{ctx.prefix}help {ctx.command}` for usage information."
-        should_notify_owner = False
-    elif isinstance(error, commands.MissingPermissions):
-        missing_perms = ", ".join(error.missing_permissions)
-        user_message = f"❌ You don't have permission to use this command. Required permissions: {missing_perms}"
-        should_notify_owner = False
-    elif isinstance(error, commands.BotMissingPermissions):
-        missing_perms = ", ".join(error.missing_permissions)
-        user_message = (
-            f"❌ I don't have the required permissions to execute this command. Missing permissions: {missing_perms}"
-        )
-        should_notify_owner = False
-    elif isinstance(error, commands.NoPrivateMessage):
-        user_message = "❌ This command cannot be used in private messages."
-        should_notify_owner = False
-    elif isinstance(error, commands.PrivateMessageOnly):
-        user_message = "❌ This command can only be used in private messages."
-        should_notify_owner = False
-    elif isinstance(error, commands.NotOwner):
-        user_message = "❌ This command can only be used by the bot owner."
-        should_notify_owner = False
-    elif isinstance(error, commands.CommandOnCooldown):
-        user_message = f"❌ Command is on cooldown. Try again in {error.retry_after:.2f} seconds."
-        should_notify_owner = False
-    elif isinstance(error, commands.DisabledCommand):
-        user_message = "❌ This command is currently disabled."
-        should_notify_owner = False
-    elif isinstance(error, commands.CheckFailure):
-        user_message = "❌ You don't have permission to use this command."
+    handler = _find_error_handler(_COMMAND_ERROR_MESSAGES, error)
+    if handler is not None:
+        user_message = handler(ctx, error)
         should_notify_owner = False
 
     # Send user-friendly message or generic error message
@@ -294,17 +467,18 @@ async def on_command_error(ctx, error):
             await ctx.send(user_message)
         else:
             await ctx.send("❌ An error occurred while executing the command. The bot owner has been notified.")
-    except Exception:
+    except discord.HTTPException:
         pass
 
     # Only notify owner for unexpected errors
     if should_notify_owner:
-        tb_string = "".join(traceback.format_exception(type(error), error, error.__traceback__))
+        tb_string = _format_traceback(type(error), error, error.__traceback__)
 
-        print(f"Command error in {ctx.command.name}:")
-        print(tb_string)
+        log.error(f"Command error in {ctx.command.name}:\n{tb_string}")
 
-        context = f"Command: {ctx.command.name}, Author: {ctx.author} ({ctx.author.id}), Guild: {ctx.guild.name if ctx.guild else 'DM'} ({ctx.guild.id if ctx.guild else 'N/A'}), Channel: {ctx.channel}"
+        guild = ctx.guild
+        guild_info = f"{guild.name} ({guild.id})" if guild else "DM (N/A)"
+        context = f"Command: {ctx.command.name}, Author: {ctx.author} ({ctx.author.id}), Guild: {guild_info}, Channel: {ctx.channel}"
 
         await send_error_dm(
             ctx.bot,
@@ -323,39 +497,9 @@ async def on_app_command_error(interaction: discord.Interaction, error: app_comm
     user_message = None
     should_notify_owner = True
 
-    if isinstance(error, app_commands.CommandNotFound):
-        user_message = f"❌ Command `{error.name}` not found."
-        should_notify_owner = False
-    elif isinstance(error, app_commands.MissingPermissions):
-        missing_perms = ", ".join(error.missing_permissions)
-        user_message = f"❌ You are missing the following required permissions: {missing_perms}"
-        should_notify_owner = False
-    elif isinstance(error, app_commands.BotMissingPermissions):
-        missing_perms = ", ".join(error.missing_permissions)
-        user_message = (
-            f"❌ I don't have the required permissions to execute this command. Missing permissions: {missing_perms}"
-        )
-        should_notify_owner = False
-    elif isinstance(error, app_commands.NoPrivateMessage):
-        user_message = "❌ This command cannot be used in private messages."
-        should_notify_owner = False
-    elif isinstance(error, app_commands.CommandOnCooldown):
-        user_message = f"❌ This command is on cooldown. Try again in {error.retry_after:.2f} seconds."
-        should_notify_owner = False
-    elif isinstance(error, app_commands.CheckFailure):
-        user_message = "❌ You don't have permission to use this command."
-        should_notify_owner = False
-    elif isinstance(error, app_commands.TransformerError):
-        user_message = f"❌ Invalid input provided: {str(error)}"
-        should_notify_owner = False
-    elif isinstance(error, commands.MissingRequiredArgument):
-        user_message = f"❌ Missing required argument: `{error.param.name}`."
-        should_notify_owner = False
-    elif isinstance(error, commands.BadArgument):
-        user_message = "❌ Invalid argument provided."
-        should_notify_owner = False
-    elif isinstance(error, commands.NotOwner):
-        user_message = "❌ This command can only be used by the bot owner."
+    handler = _find_error_handler(_APP_COMMAND_ERROR_MESSAGES, error)
+    if handler is not None:
+        user_message = handler(interaction, error)
         should_notify_owner = False
 
     # Send user-friendly message or generic error message
@@ -376,18 +520,19 @@ async def on_app_command_error(interaction: discord.Interaction, error: app_comm
                     "❌ An error occurred while executing the command. The bot owner has been notified.",
                     ephemeral=True,
                 )
-    except Exception:
+    except discord.HTTPException:
         pass
 
     # Only notify owner for unexpected errors
     if should_notify_owner:
-        tb_string = "".join(traceback.format_exception(type(error), error, error.__traceback__)).strip()
+        tb_string = _format_traceback(type(error), error, error.__traceback__).strip()
 
         command_name = interaction.command.name if interaction.command else "Unknown"
-        print(f"App command error in {command_name}:")
-        print(tb_string)
+        log.error(f"App command error in {command_name}:\n{tb_string}")
 
-        context = f"Command: {command_name}, Author: {interaction.user} ({interaction.user.id}), Guild: {interaction.guild.name if interaction.guild else 'DM'} ({interaction.guild.id if interaction.guild else 'N/A'}), Channel: {interaction.channel}"
+        guild = interaction.guild
+        guild_info = f"{guild.name} ({guild.id})" if guild else "DM (N/A)"
+        context = f"Command: {command_name}, Author: {interaction.user} ({interaction.user.id}), Guild: {guild_info}, Channel: {interaction.channel}"
 
         await send_error_dm(
             interaction.client,
@@ -400,13 +545,20 @@ async def on_app_command_error(interaction: discord.Interaction, error: app_comm
 
 @bot.event
 async def on_ready():
+    if bot._ready_once:
+        # Guild joins, leaves and member changes may have been missed while disconnected.
+        log.info(f"Reconnected as {bot.user}, refreshing guild caches.")
+        await update_bot_guilds_cache()
+        await update_all_guild_member_caches()
+        return
+    bot._ready_once = True
+
     try:
-        await bot.tree.sync()
-        print("Commands synced successfully!")
+        await sync_command_tree()
     except Exception as e:
-        print(f"Failed to sync commands: {e}")
+        log.error(f"Failed to sync commands: {e}")
 
-        tb_string = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+        tb_string = _format_traceback(type(e), e, e.__traceback__)
         await send_error_dm(
             bot,
             error_type=type(e).__name__,
@@ -415,44 +567,95 @@ async def on_ready():
             context_info="Error occurred during command sync in on_ready event",
         )
 
-    print(f"Logged in as {bot.user}")
-    print(f"Global error handling is active - errors will be sent to user ID: {ERROR_NOTIFICATION_USER_ID}")
+    log.info(f"Logged in as {bot.user}")
+    log.info(f"Global error handling is active - errors will be sent to user ID: {ERROR_NOTIFICATION_USER_ID}")
+    pool_stats = get_pool_stats()
+    if pool_stats:
+        log.info(
+            f"Database pool: {pool_stats['size']} connections ({pool_stats['idle']} idle), "
+            f"limits {pool_stats['min_size']}-{pool_stats['max_size']}"
+        )
     await update_bot_guilds_cache()
     await update_launch_time_cache()
     await update_all_guild_member_caches()
+    await warm_prefix_cache()
     bot.loop.create_task(prefix_update_listener())
 
 
+async def sync_command_tree():
+    """Syncs the global command tree, skipping the upload if it is unchanged since the last sync."""
+    # Cogs load concurrently, so registration order can differ between restarts; sort so it doesn't change the hash.
+    payload = sorted(
+        (command.to_dict(bot.tree) for command in bot.tree.get_commands()),
+        key=lambda command: (command.get("type", 1), command["name"]),
+    )
+    tree_hash = hashlib.blake2b(json.dumps(payload, sort_keys=True, default=str).encode(), digest_size=16).hexdigest()
+    hash_key = f"tree_sync_hash:{bot.application_id}"
+
+    redis = await get_redis_client()
+    if redis:
+        synced_hash = await redis.get(hash_key)
+        if synced_hash is not None and synced_hash.decode() == tree_hash:
+            log.info("Command tree unchanged, skipping sync.")
+            return
+
+    await bot.tree.sync()
+    if redis:
+        await redis.set(hash_key, tree_hash)
+    log.info("Commands synced successfully!")
+
+
+REDIS_SADD_BATCH_SIZE = 1000
+
+
+def _queue_sadd_batches(pipe, key, members):
+    """Queues SADD commands for ``members`` on ``pipe`` in fixed-size batches and returns the member count."""
+    count = 0
+    members = iter(members)
+    while batch := list(itertools.islice(members, REDIS_SADD_BATCH_SIZE)):
+        pipe.sadd(key, *batch)
+        count += len(batch)
+    return count
+
+
 async def update_bot_guilds_cache():
-    """Updates the Redis cache with the list of guild IDs the bot is in."""
-    guild_ids = [guild.id for guild in bot.guilds]
-    await set_cache("bot_guilds", guild_ids)
-    print("Updated bot guilds cache.")
+    """Rebuilds the Redis set of guild IDs the bot is in."""
+    redis = await get_redis_client()
+    if not redis:
+        return
+
+    pipe = redis.pipeline()
+    pipe.delete("bot_guilds")
+    _queue_sadd_batches(pipe, "bot_guilds", (guild.id for guild in bot.guilds))
+    await pipe.execute()
+    log.info("Updated bot guilds cache.")
 
 
 async def update_launch_time_cache():
     """Updates the Redis cache with the bot's launch time."""
     await set_cache("bot_launch_time", bot.launch_time.timestamp())
-    print("Updated bot launch time cache.")
+    log.info("Updated bot launch time cache.")
 
 
 @bot.event
 async def on_guild_join(guild):
     """Event handler for when the bot joins a guild."""
-    print(f"Joined guild: {guild.name} ({guild.id})")
-    await update_bot_guilds_cache()
+    log.info(f"Joined guild: {guild.name} ({guild.id})")
+    redis = await get_redis_client()
+    if redis:
+        await redis.sadd("bot_guilds", guild.id)
     await update_guild_member_cache(guild)
 
 
 @bot.event
 async def on_guild_remove(guild):
     """Event handler for when the bot is removed from a guild."""
-    print(f"Removed from guild: {guild.name} ({guild.id})")
-    await update_bot_guilds_cache()
+    log.info(f"Removed from guild: {guild.name} ({guild.id})")
     redis = await get_redis_client()
     if redis:
+        await redis.srem("bot_guilds", guild.id)
         await redis.delete(f"guild:{guild.id}:members")
-        print(f"Removed member cache for guild {guild.id}")
+        log.info(f"Removed member cache for guild {guild.id}")
 
 
 @bot.event
@@ -461,7 +664,7 @@ async def on_member_join(member):
     redis = await get_redis_client()
     if redis:
         await redis.sadd(f"guild:{member.guild.id}:members", member.id)
-        print(f"Added member {member.id} to cache for guild {member.guild.id}")
+        log.info(f"Added member {member.id} to cache for guild {member.guild.id}")
 
 
 @bot.event
@@ -470,7 +673,7 @@ async def on_member_remove(member):
     redis = await get_redis_client()
     if redis:
         await redis.srem(f"guild:{member.guild.id}:members", member.id)
-        print(f"Removed member {member.id} from cache for guild {member.guild.id}")
+        log.info(f"Removed member {member.id} from cache for guild {member.guild.id}")
 
 
 async def update_guild_member_cache(guild):
@@ -481,44 +684,43 @@ async def update_guild_member_cache(guild):
 
     key = f"guild:{guild.id}:members"
     try:
-        # Fetch all members and store their IDs
-        member_ids = [str(member.id) for member in guild.members]
         # Use a pipeline to clear and re-add members efficiently
         pipe = redis.pipeline()
         pipe.delete(key)
-        if member_ids:
-            pipe.sadd(key, *member_ids)
+        member_count = _queue_sadd_batches(pipe, key, (str(member.id) for member in guild.members))
         await pipe.execute()
-        print(f"Updated member cache for guild {guild.name} ({guild.id}) with {len(member_ids)} members.")
+        log.info(f"Updated member cache for guild {guild.name} ({guild.id}) with {member_count} members.")
     except discord.Forbidden:
-        print(f"Missing permissions to fetch members for guild {guild.name} ({guild.id}).")
+        log.warning(f"Missing permissions to fetch members for guild {guild.name} ({guild.id}).")
     except Exception as e:
-        print(f"Error caching members for guild {guild.name} ({guild.id}): {e}")
+        log.error(f"Error caching members for guild {guild.name} ({guild.id}): {e}")
 
 
 async def update_all_guild_member_caches():
     """Iterates through all guilds and caches their members."""
-    print("Starting to cache all guild members...")
+    log.info("Starting to cache all guild members...")
     for guild in bot.guilds:
         await update_guild_member_cache(guild)
-    print("Finished caching all guild members.")
+    log.info("Finished caching all guild members.")
 
 
 @bot.event
 async def on_shard_ready(shard_id):
-    print(f"Shard {shard_id} is ready.")
+    log.info(f"Shard {shard_id} is ready.")
 
 
-@bot.command(name="testerror")
-async def test_error(ctx):
-    await ctx.send(f"Testing error handling in {ctx.command}...")
-    raise ValueError("This is a test error to verify error handling")
+def register_debug_commands(bot: commands.Bot):
+    """Registers the error-handling test commands. Only debug runs call this, so production trees never sync them."""
 
+    @bot.command(name="testerror")
+    async def test_error(ctx):
+        await ctx.send(f"Testing error handling in {ctx.command}...")
+        raise ValueError("This is a test error to verify error handling")
 
-@bot.tree.command(name="testerror", description="Test slash command to verify error handling")
-async def test_error_slash(interaction: discord.Interaction):
-    await interaction.response.send_message("Testing error handling in slash command...")
-    raise ValueError("This is a test error to verify slash command error handling")
+    @bot.tree.command(name="testerror", description="Test slash command to verify error handling")
+    async def test_error_slash(interaction: discord.Interaction):
+        await interaction.response.send_message("Testing error handling in slash command...")
+        raise ValueError("This is a test error to verify slash command error handling")
 
 
 async def main():
@@ -526,41 +728,44 @@ async def main():
         load_dotenv(".env")
         discord_token = os.getenv("DISCORD_TOKEN")
 
+        # Read after load_dotenv so the flag can be set in .env.
+        if os.getenv("OPENGUARD_DEBUG") == "1":
+            register_debug_commands(bot)
+
         if not discord_token:
             raise ValueError("Missing DISCORD_TOKEN environment variable.")
 
         # Initialize database before loading cogs
-        print("Initializing database connection...")
+        log.info("Initializing database connection...")
         db_success = await initialize_database()
         if db_success:
-            print("Database initialized successfully!")
+            log.info("Database initialized successfully!")
         else:
-            print("Failed to initialize database. Exiting.")
+            log.error("Failed to initialize database. Exiting.")
             return
 
         async with bot:
-            await load_cogs()
-            await bot.start(discord_token)
+            # Import cogs while the HTTP login round-trip is in flight. The gateway connection is only
+            # opened afterwards, so on_ready never fires with a partially loaded command tree.
+            await asyncio.gather(load_cogs(), bot.login(discord_token))
+            await bot.connect()
     finally:
         # Clean up database connections
-        print("Closing database connections...")
+        log.info("Closing database connections...")
         await close_pool()
         await close_redis()
-        print("Database connections closed.")
+        log.info("Database connections closed.")
 
 
 if __name__ == "__main__":
+    log_listener = setup_logging()
     try:
-        asyncio.run(main())
+        if UVLOOP_AVAILABLE:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except Exception as e:
-        print(f"Critical error during bot startup: {e}")
-        tb_string = "".join(traceback.format_exception(type(e), e, e.__traceback__))
-        print(tb_string)
-
-        print(f"Could not send error notification to user ID {ERROR_NOTIFICATION_USER_ID} - bot not running")
-        print(f"Error Type: {type(e).__name__}")
-        print(f"Error Message: {str(e)}")
-        print(f"Traceback: {tb_string}")
+        log.critical(f"Critical error during bot startup: {e}", exc_info=e)
+        log.critical(f"Could not send error notification to user ID {ERROR_NOTIFICATION_USER_ID} - bot not running")
     finally:
-        if "log_file" in locals() and not log_file.closed:
-            log_file.close()
+        log_listener.stop()
@@ -1,14 +1,90 @@
 # pylint: disable=no-member
+import asyncio
+import functools
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
 from typing import Optional
-from datetime import datetime, timezone
+from cachetools import TTLCache
 
 # Import database operations
-from database.operations import get_user_data, set_user_data, update_user_data_field
+from database.operations import get_guild_config, get_user_data, update_user_data_field, unset_user_data_field
 from lists import config
 
+log = logging.getLogger(__name__)
+
+# Badge labels in display order, keyed by their public flag bit.
+_BADGE_TABLE = (
+    (discord.UserFlags.staff.value, "Discord Staff 🛡️"),
+    (discord.UserFlags.partner.value, "Partner ⭐"),
+    (discord.UserFlags.hypesquad.value, "HypeSquad Event 🏆"),
+    (discord.UserFlags.bug_hunter.value, "Bug Hunter 🐛"),
+    (discord.UserFlags.hypesquad_bravery.value, "Bravery 🦁"),
+    (discord.UserFlags.hypesquad_brilliance.value, "Brilliance 🧠"),
+    (discord.UserFlags.hypesquad_balance.value, "Balance ⚖️"),
+    (discord.UserFlags.early_supporter.value, "Early Supporter 🕰️"),
+    (discord.UserFlags.team_user.value, "Team User 👥"),
+    (discord.UserFlags.system.value, "System 🤖"),
+    (discord.UserFlags.bug_hunter_level_2.value, "Bug Hunter Level 2 🐞"),
+    (discord.UserFlags.verified_bot.value, "Verified Bot 🤖"),
+    (discord.UserFlags.verified_bot_developer.value, "Early Verified Bot Dev 🛠️"),
+    (discord.UserFlags.discord_certified_moderator.value, "Certified Mod 🛡️"),
+    (discord.UserFlags.active_developer.value, "Active Developer 🧑‍💻"),
+)
+
+# Display names for presence statuses, matching their str() values title-cased.
+_STATUS_NAMES = {status: str(status).title() for status in discord.Status}
+
+# Client status attributes in the order they're reported as the member's device.
+_DEVICE_STATUSES = (("desktop_status", "Desktop"), ("mobile_status", "Mobile"), ("web_status", "Website"))
+
+
+@functools.lru_cache(maxsize=512)
+def _truncate_field_value(text: str, max_length: int = 1020) -> str:
+    """Truncate text to fit Discord embed field limits."""
+    if len(text) > max_length:
+        return text[: max_length - 3] + "..."
+    return text
+
+
+# Note keys are stored with spaces replaced by underscores.
+_KEY_TRANS = str.maketrans({" ": "_"})
+
+# Generic discord.Activity entries (e.g. rich presence) aren't shown.
+_ACTIVITY_FORMATTERS = {
+    discord.Game: lambda activity: f"Playing {activity.name}",
+    discord.Streaming: lambda activity: f"Streaming on {activity.platform}",
+    discord.CustomActivity: lambda activity: f"{activity.emoji} {activity.name}",
+    discord.Spotify: lambda activity: f"Listening to {activity.title} by {activity.artist}",
+}
+
+# Marks a user whose banner hasn't been looked up yet; a cached None means they have no banner.
+_UNCACHED = object()
+
+
+class PermissionsButton(discord.ui.DynamicItem[discord.ui.Button], template=r"userinfo_permissions_(?P<user_id>\d+)"):
+    """The "View Permissions" button on aboutuser embeds, routed by custom_id without a bot-wide listener."""
+
+    def __init__(self, user_id: int):
+        super().__init__(
+            discord.ui.Button(
+                label="View Permissions",
+                style=discord.ButtonStyle.secondary,
+                custom_id=f"userinfo_permissions_{user_id}",
+            )
+        )
+        self.user_id = user_id
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(int(match["user_id"]))
+
+    async def callback(self, interaction: discord.Interaction):
+        cog = interaction.client.get_cog("UserInfoCog")
+        if cog is not None:
+            await cog.show_permissions(interaction, self.user_id)
+
 
 class UserInfoCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -17,93 +93,115 @@ class UserInfoCog(commands.Cog):
             config.Owners.ILIKEPANCAKES: f"{config.CustomEmoji.STAFF_BLUE}OpenGuard Developer",
             config.Owners.SLIPSTREAM: f"{config.CustomEmoji.STAFF_PINK}OpenGuard Developer",
         }
-        # Legacy variables for compatibility
-        self.custom_data_file = "user_data.json"
-        self.custom_user_data = {}
-
-    def _truncate_field_value(self, text: str, max_length: int = 1020) -> str:
-        """Truncate text to fit Discord embed field limits."""
-        if len(text) > max_length:
-            return text[: max_length - 3] + "..."
-        return text
-
-    def _format_time_difference(self, past_time: datetime) -> str:
-        """Calculate and format the time difference from a past datetime to now."""
-        now = datetime.now(timezone.utc)
-        # Ensure past_time is timezone-aware
-        if past_time.tzinfo is None:
-            past_time = past_time.replace(tzinfo=timezone.utc)
-
-        diff = now - past_time
-
-        # Calculate total minutes
-        total_minutes = int(diff.total_seconds() / 60)
-
-        # Calculate years, days, hours, minutes
-        years = total_minutes // (365 * 24 * 60)
-        remaining_minutes = total_minutes % (365 * 24 * 60)
-
-        days = remaining_minutes // (24 * 60)
-        remaining_minutes = remaining_minutes % (24 * 60)
-
-        hours = remaining_minutes // 60
-        minutes = remaining_minutes % 60
-
-        # Build the formatted string
-        parts = []
-        if years > 0:
-            parts.append(f"{years} year{'s' if years != 1 else ''}")
-        if days > 0:
-            parts.append(f"{days} day{'s' if days != 1 else ''}")
-        if hours > 0:
-            parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
-        if minutes > 0:
-            parts.append(f"{minutes} minute{'s' if minutes != 1 else ''}")
-
-        if not parts:
-            return "Less than a minute"
-
-        return ", ".join(parts)
-
-    async def load_custom_data(self):
-        """Legacy function - now a no-op since data is loaded from database."""
-        pass
-
-    async def save_custom_data(self):
-        """Legacy function - now a no-op since data is saved directly to database."""
-        pass
+        # Notes change rarely, so repeated lookups of the same user are served from memory for a minute.
+        # Every write path invalidates its user's entry once the write has landed.
+        self._user_data_cache = TTLCache(maxsize=1024, ttl=60)
+        # Concurrent lookups of the same user share one database query.
+        self._user_data_requests: dict[int, asyncio.Task] = {}
+        # Concurrent aboutuser calls for the same user share one fetch_user request.
+        self._user_fetches: dict[int, asyncio.Task] = {}
+        # Caps concurrent fetch_user calls so a burst of lookups can't eat into the global REST rate limit.
+        self._fetch_user_semaphore = asyncio.Semaphore(4)
+        # Banners are only available through fetch_user and rarely change, so keep them for a few hours.
+        self._banner_cache = TTLCache(maxsize=4096, ttl=6 * 60 * 60)
+        # Per-guild ABOUTUSER_SHOW_BANNER values, so the setting isn't read from Redis/the database on every call.
+        self._show_banner_cache = TTLCache(maxsize=4096, ttl=5 * 60)
+        # Rendered role lists per (guild, member); dropped when the member's roles or the guild's roles change.
+        self._roles_cache = TTLCache(maxsize=2048, ttl=60)
+
+    async def cog_load(self):
+        # Buttons on embeds sent before a restart keep working, since routing only depends on the custom_id.
+        self.bot.add_dynamic_items(PermissionsButton)
+
+    async def cog_unload(self):
+        self.bot.remove_dynamic_items(PermissionsButton)
 
     async def get_custom_user_data(self, user_id):
-        """Get custom user data from database."""
-        try:
-            return await get_user_data(user_id)
-        except Exception as e:
-            print(f"Failed to get user data for user {user_id}: {e}")
-            return {}
+        """Get custom user data, from the cache if it was read recently."""
+        cached = self._user_data_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        request = self._user_data_requests.get(user_id)
+        if request is None:
+            request = asyncio.create_task(get_user_data(user_id))
+            self._user_data_requests[user_id] = request
+            request.add_done_callback(lambda task: self._finish_user_data_request(user_id, task))
+        # Shielded so one caller being cancelled doesn't cancel the query for the others.
+        return await asyncio.shield(request)
+
+    def _finish_user_data_request(self, user_id, task: asyncio.Task):
+        failed = not task.cancelled() and task.exception() is not None
+        if failed:
+            log.error(f"Failed to get user data for user {user_id}: {task.exception()}")
+        # A request that was invalidated by a write while in flight may hold stale data, so only cache current ones.
+        if self._user_data_requests.get(user_id) is not task:
+            return
+        del self._user_data_requests[user_id]
+        # Failed reads aren't cached, so a database blip doesn't show "no notes" until the entry expires.
+        if not task.cancelled() and not failed:
+            self._user_data_cache[user_id] = task.result()
+
+    def _invalidate_custom_user_data(self, user_id):
+        self._user_data_cache.pop(user_id, None)
+        self._user_data_requests.pop(user_id, None)
+
+    async def _fetch_user(self, user_id):
+        """Fetch a user from the API, joining a fetch for the same user that is already in flight."""
+        request = self._user_fetches.get(user_id)
+        if request is None:
+            request = asyncio.create_task(self._fetch_user_limited(user_id))
+            self._user_fetches[user_id] = request
+            request.add_done_callback(lambda _: self._user_fetches.pop(user_id, None))
+        return await asyncio.shield(request)
+
+    async def _fetch_user_limited(self, user_id):
+        async with self._fetch_user_semaphore:
+            return await self.bot.fetch_user(user_id)
+
+    async def _show_banner(self, guild_id):
+        show_banner = self._show_banner_cache.get(guild_id)
+        if show_banner is None:
+            show_banner = self._show_banner_cache[guild_id] = bool(
+                await get_guild_config(guild_id, "ABOUTUSER_SHOW_BANNER", True)
+            )
+        return show_banner
+
+    def forget_show_banner(self, guild_id):
+        """Drop a guild's cached ABOUTUSER_SHOW_BANNER value so a changed setting applies right away."""
+        self._show_banner_cache.pop(guild_id, None)
+
+    async def _get_banner_url(self, guild, user_id):
+        """Get a user's banner URL, fetching the user from the API only if it isn't cached."""
+        banner_url = self._banner_cache.get(user_id, _UNCACHED)
+        # Users known to have no banner need no guild setting lookup either.
+        if banner_url is None or (guild is not None and not await self._show_banner(guild.id)):
+            return None
+        if banner_url is _UNCACHED:
+            user = await self._fetch_user(user_id)
+            banner_url = user.banner.url if user.banner else None
+            self._banner_cache[user_id] = banner_url
+        return banner_url
 
     async def set_custom_user_value(self, user_id, key, value):
         """Set a custom user value in the database."""
         try:
             return await update_user_data_field(user_id, key, value)
-        except Exception as e:
-            print(f"Failed to set custom user value for user {user_id}: {e}")
+        except Exception:
+            log.exception(f"Failed to set custom user value for user {user_id}")
             return False
+        finally:
+            self._invalidate_custom_user_data(user_id)
 
     async def remove_custom_user_value(self, user_id, key):
         """Remove a custom user value from the database."""
         try:
-            current_data = await get_user_data(user_id)
-            if key in current_data:
-                del current_data[key]
-                await set_user_data(user_id, current_data)
-                return True
-            return False
-        except Exception as e:
-            print(f"Failed to remove custom user value for user {user_id}: {e}")
+            return await unset_user_data_field(user_id, key)
+        except Exception:
+            log.exception(f"Failed to remove custom user value for user {user_id}")
             return False
-
-    async def is_authorized_admin(self, ctx: commands.Context):
-        return ctx.author.guild_permissions.administrator
+        finally:
+            self._invalidate_custom_user_data(user_id)
 
     @commands.hybrid_command(
         name="aboutuser",
@@ -112,155 +210,118 @@ class UserInfoCog(commands.Cog):
     @app_commands.describe(user="The user to get info about (optional)")
     async def aboutuser(self, ctx: commands.Context, user: Optional[discord.Member] = None):
         member = user or ctx.author
-        if ctx.guild:
+        if ctx.guild and not isinstance(member, discord.Member):
             member = ctx.guild.get_member(member.id) or member
-        user_obj = member._user if hasattr(member, "_user") else member
-        banner_url = None
-        try:
-            user_obj = await self.bot.fetch_user(member.id)
-            if user_obj.banner:
-                banner_url = user_obj.banner.url
-        except Exception:
-            pass
+        # The banner and notes lookups are independent, so run them concurrently.
+        banner_url, custom_user_data = await asyncio.gather(
+            self._get_banner_url(ctx.guild, member.id), self.get_custom_user_data(member.id), return_exceptions=True
+        )
+        if isinstance(banner_url, BaseException):
+            banner_url = None
+        if isinstance(custom_user_data, BaseException):
+            custom_user_data = {}
         user_data = {
             "member": member,
-            "user_obj": user_obj,
             "banner_url": banner_url,
+            "custom_user_data": custom_user_data,
             "is_guild_member": isinstance(member, discord.Member) and ctx.guild,
             "interaction_user_id": ctx.author.id,
+            "requester_icon_url": ctx.author.display_avatar.url,
         }
         embed, view = await self._create_main_view(user_data)
         await ctx.reply(embed=embed, view=view)
 
     async def _create_main_view(self, user_data):
         member = user_data["member"]
-        user_obj = user_data["user_obj"]
         banner_url = user_data["banner_url"]
         is_guild_member = user_data["is_guild_member"]
         status = "Unknown"
         device_str = "Unknown"
         if is_guild_member:
-            status = str(member.status).title()
-            if member.desktop_status != "offline":
-                device_str = "Desktop"
-            elif member.mobile_status != "offline":
-                device_str = "Mobile"
-            elif member.web_status != "offline":
-                device_str = "Website"
+            status = _STATUS_NAMES.get(member.status, "Unknown")
+            for status_attr, label in _DEVICE_STATUSES:
+                if getattr(member, status_attr) is not discord.Status.offline:
+                    device_str = label
+                    break
         activity_str = "None"
         if member.activities:
             activity = member.activities[0]
-            if isinstance(activity, discord.Game):
-                activity_str = f"Playing {activity.name}"
-            elif isinstance(activity, discord.Streaming):
-                activity_str = f"Streaming on {activity.platform}"
-            elif isinstance(activity, discord.CustomActivity):
-                activity_str = f"{activity.emoji} {activity.name}"
-            elif isinstance(activity, discord.Spotify):
-                activity_str = f"Listening to {activity.title} by {activity.artist}"
+            formatter = _ACTIVITY_FORMATTERS.get(type(activity))
+            if formatter is not None:
+                activity_str = formatter(activity)
 
         # Truncate activity string if too long
-        activity_str = self._truncate_field_value(activity_str)
+        activity_str = _truncate_field_value(activity_str)
         roles_str = "None"
-        if is_guild_member and member.roles:
-            roles = [role.mention for role in reversed(member.roles) if role.name != "@everyone"]
-            if roles:
-                roles_str = ", ".join(roles)
+        if is_guild_member:
+            roles_key = (member.guild.id, member.id)
+            roles_str = self._roles_cache.get(roles_key)
+            if roles_str is None:
+                # Member.roles is sorted by position with @everyone always first, so skip it by slicing.
+                roles_str = ", ".join(role.mention for role in member.roles[:0:-1]) or "None"
                 # Truncate if too long for Discord embed field limit
-                roles_str = self._truncate_field_value(roles_str)
-            else:
-                roles_str = "None"
-        badge_map = {
-            "staff": "Discord Staff 🛡️",
-            "partner": "Partner ⭐",
-            "hypesquad": "HypeSquad Event 🏆",
-            "bug_hunter": "Bug Hunter 🐛",
-            "hypesquad_bravery": "Bravery 🦁",
-            "hypesquad_brilliance": "Brilliance 🧠",
-            "hypesquad_balance": "Balance ⚖️",
-            "early_supporter": "Early Supporter 🕰️",
-            "team_user": "Team User 👥",
-            "system": "System 🤖",
-            "bug_hunter_level_2": "Bug Hunter Level 2 🐞",
-            "verified_bot": "Verified Bot 🤖",
-            "verified_developer": "Early Verified Bot Dev 🛠️",
-            "discord_certified_moderator": "Certified Mod 🛡️",
-            "active_developer": "Active Developer 🧑‍💻",
-        }
-        user_flags = getattr(user_obj, "public_flags", None)
-        badges = []
-        if user_flags:
-            for flag in badge_map:
-                if getattr(user_flags, flag, False):
-                    badges.append(badge_map[flag])
+                roles_str = _truncate_field_value(roles_str)
+                self._roles_cache[roles_key] = roles_str
+        # Member proxies public_flags from its underlying User.
+        flags_value = member.public_flags.value
+        badges = [label for mask, label in _BADGE_TABLE if flags_value & mask]
         badge_str = ", ".join(badges) if badges else ""
         developer_badge = self.developer_badges.get(member.id)
         if developer_badge:
             badge_str = (badge_str + ", " if badge_str else "") + developer_badge
 
         # Truncate badge string if too long
-        badge_str = self._truncate_field_value(badge_str)
-        embed = discord.Embed(
-            title=f"User Info: {member.display_name}",
-            color=member.color if hasattr(member, "color") else discord.Color.blurple(),
-            description=f"Profile of {member.mention}",
-        )
-
-        # Set banner as the main image (appears at top of embed)
-        if banner_url:
-            embed.set_image(url=banner_url)
-
-        # Set user avatar as thumbnail (appears at top right corner)
-        embed.set_thumbnail(url=member.display_avatar.url)
-
+        badge_str = _truncate_field_value(badge_str)
+        fields = []
         if badge_str:
-            embed.add_field(name="Badge", value=badge_str, inline=False)
+            fields.append({"name": "Badge", "value": badge_str, "inline": False})
 
-        custom_user_data = await self.get_custom_user_data(member.id)
+        custom_user_data = user_data["custom_user_data"]
         if custom_user_data:
-            notes_str = ""
-            for key, value in custom_user_data.items():
-                notes_str += f"**{key.replace('_', ' ').title()}:** {value}\n"
-            if notes_str:
-                # Truncate notes if too long for Discord embed field limit
-                notes_str = self._truncate_field_value(notes_str)
-                embed.add_field(name="📋 Admin Notes", value=notes_str, inline=False)
-        embed.add_field(name="Nickname", value=member.nick or "None", inline=True)
-        embed.add_field(name="Username", value=f"{member.name}#{member.discriminator}", inline=True)
-        embed.add_field(name="User ID", value=member.id, inline=True)
-        embed.add_field(name="Status", value=status, inline=True)
-        embed.add_field(name="Device", value=device_str, inline=True)
-        embed.add_field(name="Activity", value=activity_str, inline=True)
-        embed.add_field(name="Roles", value=roles_str, inline=False)
-        # Calculate time differences
-        account_age = self._format_time_difference(member.created_at)
-        account_created_text = f"{member.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}\n({account_age} ago)"
-
-        embed.add_field(
-            name="Account Created",
-            value=account_created_text,
-            inline=True,
-        )
-        if hasattr(member, "joined_at") and member.joined_at:
-            server_join_age = self._format_time_difference(member.joined_at)
-            joined_server_text = f"{member.joined_at.strftime('%Y-%m-%d %H:%M:%S UTC')}\n({server_join_age} ago)"
-            embed.add_field(
-                name="Joined Server",
-                value=joined_server_text,
-                inline=True,
+            notes_str = "".join(
+                f"**{key.replace('_', ' ').title()}:** {value}\n" for key, value in custom_user_data.items()
             )
-        embed.set_footer(
-            text=f"Requested by {user_data['interaction_user_id']}",
-            icon_url=self.bot.get_user(user_data["interaction_user_id"]).display_avatar.url,
-        )
+            # Truncate notes if too long for Discord embed field limit
+            notes_str = _truncate_field_value(notes_str)
+            fields.append({"name": "📋 Admin Notes", "value": notes_str, "inline": False})
+
+        # Dates and ages use Discord timestamp markup, which clients render (and keep current) locally.
+        created_ts = int(member.created_at.timestamp())
+        account_created_text = f"<t:{created_ts}:F>\n(<t:{created_ts}:R>)"
+        fields += [
+            {"name": "Nickname", "value": member.nick or "None", "inline": True},
+            {"name": "Username", "value": f"{member.name}#{member.discriminator}", "inline": True},
+            {"name": "User ID", "value": str(member.id), "inline": True},
+            {"name": "Status", "value": status, "inline": True},
+            {"name": "Device", "value": device_str, "inline": True},
+            {"name": "Activity", "value": activity_str, "inline": True},
+            {"name": "Roles", "value": roles_str, "inline": False},
+            {"name": "Account Created", "value": account_created_text, "inline": True},
+        ]
+        if hasattr(member, "joined_at") and member.joined_at:
+            joined_ts = int(member.joined_at.timestamp())
+            joined_server_text = f"<t:{joined_ts}:F>\n(<t:{joined_ts}:R>)"
+            fields.append({"name": "Joined Server", "value": joined_server_text, "inline": True})
+
+        # Built as a single payload rather than through a dozen add_field/set_* calls.
+        embed_data = {
+            "title": f"User Info: {member.display_name}",
+            "color": (member.color if hasattr(member, "color") else discord.Color.blurple()).value,
+            "description": f"Profile of {member.mention}",
+            # User avatar as thumbnail (appears at top right corner)
+            "thumbnail": {"url": member.display_avatar.url},
+            "fields": fields,
+            "footer": {
+                "text": f"Requested by {user_data['interaction_user_id']}",
+                "icon_url": user_data["requester_icon_url"],
+            },
+        }
+        # Banner as the main image (appears at top of embed)
+        if banner_url:
+            embed_data["image"] = {"url": banner_url}
+        embed = discord.Embed.from_dict(embed_data)
         view = discord.ui.View()
-        view.add_item(
-            discord.ui.Button(
-                label="View Permissions",
-                style=discord.ButtonStyle.secondary,
-                custom_id=f"userinfo_permissions_{member.id}",
-            )
-        )
+        view.add_item(PermissionsButton(member.id))
         return embed, view
 
     @commands.hybrid_group(
@@ -272,6 +333,7 @@ class UserInfoCog(commands.Cog):
         await ctx.send_help(ctx.command)
 
     @usernote.command(name="set", description="Set a note for a user.")
+    @commands.has_guild_permissions(administrator=True)
     @app_commands.describe(
         user="The user to set a note for.",
         key="The note's title or key.",
@@ -284,16 +346,15 @@ class UserInfoCog(commands.Cog):
         key: str,
         value: str,
     ):
-        if not await self.is_authorized_admin(ctx):
-            return
-
-        key = key.strip().lower().replace(" ", "_")
+        # Validate before normalising so oversized keys are rejected without further work.
+        key = key.strip()
         if not key or len(key) > 50:
             await ctx.reply(
                 "❌ Key must be between 1-50 characters and contain no spaces.",
                 ephemeral=True,
             )
             return
+        key = key.lower().translate(_KEY_TRANS)
 
         value = value.strip()
         if not value or len(value) > 500:
@@ -307,6 +368,7 @@ class UserInfoCog(commands.Cog):
         )
 
     @usernote.command(name="remove", description="Remove a note from a user.")
+    @commands.has_guild_permissions(administrator=True)
     @app_commands.describe(
         user="The user to remove a note from.",
         key="The title/key of the note to remove.",
@@ -318,52 +380,63 @@ class UserInfoCog(commands.Cog):
             await ctx.reply(f"❌ No note with key '{key}' found for {user.mention}", ephemeral=True)
 
     @usernote.command(name="list", description="List all notes for a user.")
+    @commands.has_guild_permissions(administrator=True)
     @app_commands.describe(user="The user to list notes for.")
     async def list_custom_values(self, ctx: commands.Context, user: discord.Member):
-        if not await self.is_authorized_admin(ctx):
+        try:
+            custom_data = await self.get_custom_user_data(user.id)
+        except Exception:
+            await ctx.reply("❌ Couldn't load notes right now. Please try again later.", ephemeral=True)
             return
-
-        custom_data = await self.get_custom_user_data(user.id)
         if not custom_data:
             await ctx.reply(f"❌ No notes found for {user.mention}", ephemeral=True)
             return
 
-        content = f"**Notes for {user.display_name}**\n\n"
+        parts = [f"**Notes for {user.display_name}**", ""]
         for key, value in custom_data.items():
-            display_value = value if len(value) <= 100 else value[:97] + "..."
-            content += f"**{key}:** {display_value}\n"
+            display_value = value if len(value) <= 100 else f"{value[:97]}..."
+            parts.append(f"**{key}:** {display_value}")
 
-        await ctx.reply(content, ephemeral=True)
+        await ctx.reply("\n".join(parts), ephemeral=True)
 
     @usernote.command(name="clear", description="Clear all notes for a user.")
+    @commands.has_guild_permissions(administrator=True)
     @app_commands.describe(user="The user to clear all notes for.")
     async def clear_custom_values(self, ctx: commands.Context, user: discord.Member):
-        if not await self.is_authorized_admin(ctx):
-            return
-
         try:
             from database.operations import delete_user_data
 
             success = await delete_user_data(user.id)
+            self._invalidate_custom_user_data(user.id)
             if success:
                 await ctx.reply(f"✅ Cleared all custom data for {user.mention}", ephemeral=True)
             else:
                 await ctx.reply(f"❌ No custom data found for {user.mention}", ephemeral=True)
-        except Exception as e:
-            print(f"Failed to clear custom data for user {user.id}: {e}")
+        except Exception:
+            log.exception(f"Failed to clear custom data for user {user.id}")
             await ctx.reply(f"❌ Error clearing custom data for {user.mention}", ephemeral=True)
 
     @commands.Cog.listener()
-    async def on_interaction(self, interaction: discord.Interaction):
-        if interaction.type == discord.InteractionType.component and interaction.data["custom_id"].startswith(
-            "userinfo_"
-        ):
-            custom_id_parts = interaction.data["custom_id"].split("_")
-            action = custom_id_parts[1]
-            user_id = int(custom_id_parts[2])
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        self._banner_cache.pop(after.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles != after.roles:
+            self._roles_cache.pop((after.guild.id, after.id), None)
+
+    def _forget_guild_roles(self, guild_id):
+        for key in [key for key in self._roles_cache if key[0] == guild_id]:
+            self._roles_cache.pop(key, None)
+
+    # Deleting or reordering a role changes every cached role list in its guild.
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self._forget_guild_roles(after.guild.id)
 
-            if action == "permissions":
-                await self.show_permissions(interaction, user_id)
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._forget_guild_roles(role.guild.id)
 
     async def show_permissions(self, interaction: discord.Interaction, user_id: int):
         if not interaction.guild:
@@ -384,32 +457,13 @@ class UserInfoCog(commands.Cog):
             description="✅ = Granted, ❌ = Denied",
         )
 
-        columns = [[], [], []]
-        col_char_limits = [0, 0, 0]
-        max_col_chars = 900
-
-        for perm, value in sorted_perms:
-            perm_str = f"{'✅' if value else '❌'} {perm.replace('_', ' ').title()}\n"
-
-            best_col = -1
-            min_len = float("inf")
-            for i in range(3):
-                if col_char_limits[i] + len(perm_str) < max_col_chars:
-                    if col_char_limits[i] < min_len:
-                        min_len = col_char_limits[i]
-                        best_col = i
-
-            if best_col != -1:
-                columns[best_col].append(perm_str)
-                col_char_limits[best_col] += len(perm_str)
-            else:
-                shortest_col = col_char_limits.index(min(col_char_limits))
-                columns[shortest_col].append(perm_str)
-                col_char_limits[shortest_col] += len(perm_str)
-
+        lines = [f"{'✅' if value else '❌'} {perm.replace('_', ' ').title()}\n" for perm, value in sorted_perms]
+        # Split into three near-equal columns; each stays well under the 1024-character field limit.
+        step = -(-len(lines) // 3)
         for i in range(3):
-            if columns[i]:
-                embed.add_field(name=f"Permissions {i + 1}", value="".join(columns[i]), inline=True)
+            column = lines[i * step : (i + 1) * step]
+            if column:
+                embed.add_field(name=f"Permissions {i + 1}", value="".join(column), inline=True)
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
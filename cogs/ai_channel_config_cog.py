@@ -1,8 +1,10 @@
 # pylint: disable=no-member
+import asyncio
 import discord
 from discord.ext import commands
 from discord import app_commands
 from typing import Optional
+from cachetools import TTLCache
 
 from .aimod_helpers.config_manager import (
     get_excluded_channels,
@@ -26,6 +28,19 @@ class AIChannelConfigCog(commands.Cog, name="AI Channel Config"):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # Short-lived per-guild (excluded channels, channel rules) snapshots shared by the read-only commands.
+        self._snapshots = TTLCache(maxsize=1024, ttl=30)
+
+    async def _get_snapshot(self, guild_id: int) -> tuple[frozenset[int], dict]:
+        """Return the guild's excluded channels and channel rules, fetching both together on a miss."""
+        snapshot = self._snapshots.get(guild_id)
+        if snapshot is None:
+            excluded_channels, channel_rules = await asyncio.gather(
+                get_excluded_channels(guild_id),
+                get_all_channel_rules(guild_id),
+            )
+            snapshot = self._snapshots[guild_id] = (frozenset(excluded_channels), channel_rules)
+        return snapshot
 
     @CoreAICog.ai.group(
         name="channel",
@@ -52,6 +67,7 @@ class AIChannelConfigCog(commands.Cog, name="AI Channel Config"):
             response = f"❌ {channel.mention} is already excluded from AI moderation."
         else:
             success = await add_excluded_channel(guild_id, channel_id)
+            self._snapshots.pop(guild_id, None)
             if success:
                 response = f"✅ {channel.mention} has been excluded from AI moderation."
             else:
@@ -81,6 +97,7 @@ class AIChannelConfigCog(commands.Cog, name="AI Channel Config"):
             response = f"❌ {channel.mention} is not excluded from AI moderation."
         else:
             success = await remove_excluded_channel(guild_id, channel_id)
+            self._snapshots.pop(guild_id, None)
             if success:
                 response = f"✅ {channel.mention} has been included in AI moderation."
             else:
@@ -96,20 +113,18 @@ class AIChannelConfigCog(commands.Cog, name="AI Channel Config"):
     async def list_excluded(self, ctx: commands.Context):
         """List all channels excluded from AI moderation."""
         guild_id = ctx.guild.id
-        excluded_channels = await get_excluded_channels(guild_id)
+        excluded_channels, _ = await self._get_snapshot(guild_id)
 
         if not excluded_channels:
             response = "No channels are currently excluded from AI moderation."
         else:
-            channel_mentions = []
-            for channel_id in excluded_channels:
-                channel = ctx.guild.get_channel(channel_id)
-                if channel:
-                    channel_mentions.append(channel.mention)
-                else:
-                    channel_mentions.append(f"<#{channel_id}> (deleted)")
-
-            response = f"**Excluded Channels ({len(excluded_channels)}):**\n" + "\n".join(channel_mentions)
+            get_channel = ctx.guild.get_channel
+            lines = [f"**Excluded Channels ({len(excluded_channels)}):**"]
+            lines += [
+                channel.mention if (channel := get_channel(channel_id)) else f"<#{channel_id}> (deleted)"
+                for channel_id in sorted(excluded_channels)
+            ]
+            response = "\n".join(lines)
 
         if ctx.interaction:
             await ctx.interaction.response.send_message(response)
@@ -153,6 +168,7 @@ class AIChannelConfigCog(commands.Cog, name="AI Channel Config"):
                 response = f"✅ Custom rules set for {channel.mention}."
             else:
                 response = f"❌ Failed to set custom rules for {channel.mention}."
+        self._snapshots.pop(guild_id, None)
 
         if ctx.interaction:
             await ctx.interaction.response.send_message(response)
@@ -204,20 +220,21 @@ class AIChannelConfigCog(commands.Cog, name="AI Channel Config"):
     async def list_all_rules(self, ctx: commands.Context):
         """List all channels with custom AI moderation rules."""
         guild_id = ctx.guild.id
-        all_channel_rules = await get_all_channel_rules(guild_id)
+        _, all_channel_rules = await self._get_snapshot(guild_id)
 
         if not all_channel_rules:
             response = "No channels have custom AI moderation rules set."
         else:
             embed = discord.Embed(title="Channels with Custom Rules", color=discord.Color.blue())
 
+            get_channel = ctx.guild.get_channel
             for channel_id_str, rules in all_channel_rules.items():
                 channel_id = int(channel_id_str)
-                channel = ctx.guild.get_channel(channel_id)
+                channel = get_channel(channel_id)
                 channel_name = channel.name if channel else f"Deleted Channel ({channel_id})"
 
                 # Truncate rules if too long
-                truncated_rules = rules[:100] + "..." if len(rules) > 100 else rules
+                truncated_rules = f"{rules[:100]}..." if len(rules) > 100 else rules
                 embed.add_field(name=channel_name, value=truncated_rules, inline=False)
 
             if ctx.interaction:
@@ -242,8 +259,9 @@ class AIChannelConfigCog(commands.Cog, name="AI Channel Config"):
         guild_id = ctx.guild.id
         channel_id = channel.id
 
-        is_excluded = await is_channel_excluded(guild_id, channel_id)
-        custom_rules = await get_channel_rules(guild_id, channel_id)
+        excluded_channels, all_channel_rules = await self._get_snapshot(guild_id)
+        is_excluded = channel_id in excluded_channels
+        custom_rules = all_channel_rules.get(str(channel_id), "")
 
         embed = discord.Embed(
             title=f"AI Moderation Status for {channel.name}",
@@ -263,7 +281,7 @@ class AIChannelConfigCog(commands.Cog, name="AI Channel Config"):
         )
 
         if custom_rules:
-            truncated_rules = custom_rules[:500] + "..." if len(custom_rules) > 500 else custom_rules
+            truncated_rules = f"{custom_rules[:500]}..." if len(custom_rules) > 500 else custom_rules
             embed.add_field(name="Rules Preview", value=f"```{truncated_rules}```", inline=False)
 
         embed.set_footer(text=f"Channel ID: {channel_id}")
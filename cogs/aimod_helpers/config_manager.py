@@ -1,3 +1,4 @@
+import logging
 import os
 import asyncio
 from typing import Optional
@@ -8,6 +9,8 @@ from database.operations import (
     set_guild_config as db_set_guild_config,
 )
 
+log = logging.getLogger(__name__)
+
 # OpenRouter/LiteLLM configuration
 DEFAULT_AI_MODEL = "openrouter/google/gemini-2.0-flash-001"
 
@@ -79,7 +82,7 @@ def get_guild_config(guild_id: int, key: str, default=None):
         )
         return default
     except Exception as e:
-        print(f"Error in get_guild_config: {e}")
+        log.error(f"Error in get_guild_config: {e}")
         return default
 
 
@@ -88,7 +91,7 @@ async def set_guild_config(guild_id: int, key: str, value):
     try:
         return await db_set_guild_config(guild_id, key, value)
     except Exception as e:
-        print(f"Failed to set guild config {key} for guild {guild_id}: {e}")
+        log.error(f"Failed to set guild config {key} for guild {guild_id}: {e}")
         return False
 
 
@@ -97,7 +100,7 @@ async def get_guild_config_async(guild_id: int, key: str, default=None):
     try:
         return await db_get_guild_config(guild_id, key, default)
     except Exception as e:
-        print(f"Failed to get guild config {key} for guild {guild_id}: {e}")
+        log.error(f"Failed to get guild config {key} for guild {guild_id}: {e}")
         return default
 
 
@@ -169,7 +172,7 @@ async def get_guild_language_async(guild_id: int) -> str:
     try:
         return await db_get_guild_config(guild_id, GUILD_LANGUAGE_KEY, DEFAULT_LANGUAGE)
     except Exception as e:
-        print(f"Failed to get guild language for guild {guild_id}: {e}")
+        log.error(f"Failed to get guild language for guild {guild_id}: {e}")
         return DEFAULT_LANGUAGE
 
 
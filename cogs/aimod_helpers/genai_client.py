@@ -1,8 +1,11 @@
+import logging
 from .litellm_config import (
     get_litellm_client,
     get_litellm_client_for_model,
 )
 
+log = logging.getLogger(__name__)
+
 __all__ = [
     "genai_client_us_central1",
     "genai_client_global",
@@ -15,12 +18,12 @@ try:
     genai_client_us_central1 = get_litellm_client()
     genai_client_global = get_litellm_client()
     genai_client = genai_client_us_central1
-    print("LiteLLM Clients initialized with OpenRouter backend.")
+    log.info("LiteLLM Clients initialized with OpenRouter backend.")
 except Exception as e:
     genai_client_us_central1 = None
     genai_client_global = None
     genai_client = None
-    print(f"Error initializing LiteLLM Clients: {e}")
+    log.error(f"Error initializing LiteLLM Clients: {e}")
 
 
 def get_genai_client_for_model(model_name: str):
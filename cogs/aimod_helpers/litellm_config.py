@@ -3,11 +3,14 @@ LiteLLM configuration module for OpenRouter integration.
 This module handles the setup and configuration of LiteLLM with OpenRouter as the backend provider.
 """
 
+import logging
 import os
 from typing import Dict, Any, Optional, List
 import litellm
 from litellm import acompletion
 
+log = logging.getLogger(__name__)
+
 # Configure LiteLLM settings
 litellm.set_verbose = False  # Set to True for debugging
 litellm.drop_params = True  # Drop unsupported parameters instead of erroring
@@ -66,7 +69,7 @@ class LiteLLMClient:
         # Configure LiteLLM for OpenRouter
         os.environ["OPENROUTER_API_KEY"] = self.api_key
 
-        print("LiteLLM client initialized with OpenRouter backend.")
+        log.info("LiteLLM client initialized with OpenRouter backend.")
 
     def map_model_name(self, model_name: str) -> str:
         """
@@ -144,11 +147,11 @@ class LiteLLMClient:
             if self._is_openrouter_key(final_api_key):
                 self._handle_openrouter_error(e, final_model_name)
             else:
-                print(f"Error calling API with model {final_model_name}: {e}")
+                log.error(f"Error calling API with model {final_model_name}: {e}")
 
             # Try fallback model if the primary model fails
             if final_model_name != FALLBACK_MODEL:
-                print(f"Retrying with fallback model: {FALLBACK_MODEL}")
+                log.info(f"Retrying with fallback model: {FALLBACK_MODEL}")
                 try:
                     fallback_headers = self._get_provider_headers(self.api_key, FALLBACK_MODEL)
                     response = await acompletion(
@@ -161,7 +164,7 @@ class LiteLLMClient:
                     )
                     return LiteLLMResponse(response)
                 except Exception as fallback_error:
-                    print(f"Fallback model also failed: {fallback_error}")
+                    log.error(f"Fallback model also failed: {fallback_error}")
 
             raise e
 
@@ -223,15 +226,15 @@ class LiteLLMClient:
         error_str = str(error).lower()
         
         if "quota" in error_str or "rate limit" in error_str:
-            print(f"OpenRouter quota/rate limit exceeded for model {model_name}: {error}")
+            log.error(f"OpenRouter quota/rate limit exceeded for model {model_name}: {error}")
         elif "unauthorized" in error_str or "invalid api key" in error_str:
-            print(f"OpenRouter authentication failed for model {model_name}: {error}")
+            log.error(f"OpenRouter authentication failed for model {model_name}: {error}")
         elif "model not found" in error_str or "not available" in error_str:
-            print(f"OpenRouter model {model_name} not found or unavailable: {error}")
+            log.error(f"OpenRouter model {model_name} not found or unavailable: {error}")
         elif "insufficient credits" in error_str or "balance" in error_str:
-            print(f"OpenRouter insufficient credits for model {model_name}: {error}")
+            log.error(f"OpenRouter insufficient credits for model {model_name}: {error}")
         else:
-            print(f"OpenRouter API error for model {model_name}: {error}")
+            log.error(f"OpenRouter API error for model {model_name}: {error}")
 
 
 class LiteLLMResponse:
@@ -264,7 +267,7 @@ class LiteLLMResponse:
                     return choice.message.content or ""
             return ""
         except Exception as e:
-            print(f"Error extracting text from response: {e}")
+            log.error(f"Error extracting text from response: {e}")
             return ""
 
     @property
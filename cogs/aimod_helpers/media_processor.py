@@ -1,6 +1,9 @@
+import logging
 import discord
 import os
 
+log = logging.getLogger(__name__)
+
 
 class MediaProcessor:
     def __init__(self):
@@ -23,7 +26,7 @@ class MediaProcessor:
             mime_type = attachment.content_type or "image/jpeg"
             return mime_type, image_bytes
         except Exception as e:
-            print(f"Error processing image: {e}")
+            log.error(f"Error processing image: {e}")
             return None, None
 
     async def process_gif(self, attachment: discord.Attachment) -> tuple[str, bytes]:
@@ -33,7 +36,7 @@ class MediaProcessor:
             mime_type = attachment.content_type or "image/gif"
             return mime_type, gif_bytes
         except Exception as e:
-            print(f"Error processing GIF: {e}")
+            log.error(f"Error processing GIF: {e}")
             return None, None
 
     async def process_video(self, attachment: discord.Attachment) -> tuple[str, bytes]:
@@ -43,7 +46,7 @@ class MediaProcessor:
             mime_type = attachment.content_type or "video/mp4"
             return mime_type, video_bytes
         except Exception as e:
-            print(f"Error processing video: {e}")
+            log.error(f"Error processing video: {e}")
             return None, None
 
     async def process_attachment(self, attachment: discord.Attachment) -> tuple[str, bytes, str]:
@@ -62,5 +65,5 @@ class MediaProcessor:
             mime_type, image_bytes = await self.process_video(attachment)
             return mime_type, image_bytes, "video"
         else:
-            print(f"Unsupported file type: {ext}")
+            log.warning(f"Unsupported file type: {ext}")
             return None, None, None
@@ -1,3 +1,4 @@
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -14,6 +15,8 @@ from .aimod_helpers.config_manager import (
 )
 from .aimod_helpers.ui import AppealActions
 
+log = logging.getLogger(__name__)
+
 
 class AppealCog(commands.Cog, name="Appeals"):
     """
@@ -85,7 +88,7 @@ class AppealCog(commands.Cog, name="Appeals"):
         admin_user = self.bot.get_user(admin_user_id)
 
         if not admin_user:
-            print(f"CRITICAL: Could not find admin user with ID {admin_user_id} to send appeal.")
+            log.critical(f"Could not find admin user with ID {admin_user_id} to send appeal.")
             await interaction.response.send_message(
                 "Your appeal has been submitted, but there was an error notifying the admin.",
                 ephemeral=True,
@@ -128,13 +131,13 @@ class AppealCog(commands.Cog, name="Appeals"):
                 ephemeral=True,
             )
         except discord.Forbidden:
-            print(f"CRITICAL: Could not DM admin user {admin_user_id}. They may have DMs disabled.")
+            log.critical(f"Could not DM admin user {admin_user_id}. They may have DMs disabled.")
             await interaction.response.send_message(
                 "Your appeal has been submitted, but there was an error notifying the admin.",
                 ephemeral=True,
             )
         except Exception as e:
-            print(f"CRITICAL: An unexpected error occurred when sending appeal to admin: {e}")
+            log.critical(f"An unexpected error occurred when sending appeal to admin: {e}")
             await interaction.response.send_message(
                 "Your appeal has been submitted, but an unexpected error occurred.",
                 ephemeral=True,
@@ -186,14 +189,14 @@ class AppealCog(commands.Cog, name="Appeals"):
             new_embed.title = "Appeal Accepted"
 
             if not guild:
-                print(f"Could not find guild {guild_id} to revert action for appeal {appeal_id}")
+                log.warning(f"Could not find guild {guild_id} to revert action for appeal {appeal_id}")
                 if user_to_notify:
                     try:
                         await user_to_notify.send(
                             f"Your appeal ({appeal_id}) was accepted, but we could not find the original server to revert the action. Please contact an admin."
                         )
                     except discord.Forbidden:
-                        print(f"Could not DM user {user_id} about accepted appeal with missing guild.")
+                        log.warning(f"Could not DM user {user_id} about accepted appeal with missing guild.")
             else:
                 action_reverted = False
                 original_action = original_infraction.get("action_taken")
@@ -205,7 +208,7 @@ class AppealCog(commands.Cog, name="Appeals"):
                         )
                         action_reverted = True
                     except Exception as e:
-                        print(f"Failed to unban user {user_id} in guild {guild_id} for appeal {appeal_id}: {e}")
+                        log.error(f"Failed to unban user {user_id} in guild {guild_id} for appeal {appeal_id}: {e}")
                 elif original_action == "GLOBAL_BAN":
                     if user_id in GLOBAL_BANS:
                         GLOBAL_BANS.remove(user_id)
@@ -217,7 +220,7 @@ class AppealCog(commands.Cog, name="Appeals"):
                         )
                         action_reverted = True
                     except Exception as e:
-                        print(
+                        log.error(
                             f"Failed to unban user {user_id} in guild {guild_id} for global ban appeal {appeal_id}: {e}"
                         )
                 elif "TIMEOUT" in original_action:
@@ -226,9 +229,11 @@ class AppealCog(commands.Cog, name="Appeals"):
                         await member.timeout(None, reason=f"Appeal {appeal_id} accepted.")
                         action_reverted = True
                     except discord.NotFound:
-                        print(f"User {user_id} not found in guild {guild_id} to remove timeout for appeal {appeal_id}")
+                        log.warning(
+                            f"User {user_id} not found in guild {guild_id} to remove timeout for appeal {appeal_id}"
+                        )
                     except Exception as e:
-                        print(
+                        log.error(
                             f"Failed to remove timeout for user {user_id} in guild {guild_id} for appeal {appeal_id}: {e}"
                         )
 
@@ -243,7 +248,7 @@ class AppealCog(commands.Cog, name="Appeals"):
                                 f"Your appeal regarding the action in **{guild.name}** has been **accepted**, but we failed to automatically revert the action. Please contact an admin."
                             )
                     except discord.Forbidden:
-                        print(f"Could not DM user {user_id} about accepted appeal.")
+                        log.warning(f"Could not DM user {user_id} about accepted appeal.")
 
         else:
             appeal_data["status"] = "denied"
@@ -252,7 +257,7 @@ class AppealCog(commands.Cog, name="Appeals"):
                 try:
                     await user_to_notify.send("Your appeal has been **denied**.")
                 except discord.Forbidden:
-                    print(f"Could not DM user {user_id} about denied appeal.")
+                    log.warning(f"Could not DM user {user_id} about denied appeal.")
 
         await save_appeals()
 
@@ -278,4 +283,4 @@ class AppealCog(commands.Cog, name="Appeals"):
 async def setup(bot: commands.Bot):
     """Loads the AppealCog."""
     await bot.add_cog(AppealCog(bot))
-    print("AppealCog has been loaded.")
+    log.info("AppealCog has been loaded.")
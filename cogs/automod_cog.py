@@ -1,8 +1,11 @@
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
 from .aimod_helpers import gemini_client
 
+log = logging.getLogger(__name__)
+
 
 class AutoModCog(commands.Cog, name="Discord AutoMod"):
     """Commands to manage Discord AutoMod rules."""
@@ -69,4 +72,4 @@ class AutoModCog(commands.Cog, name="Discord AutoMod"):
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(AutoModCog(bot))
-    print("AutoModCog has been loaded.")
+    log.info("AutoModCog has been loaded.")
@@ -1,3 +1,4 @@
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -10,6 +11,8 @@ from database.operations import (
     get_all_botdetect_config,
 )
 
+log = logging.getLogger(__name__)
+
 # Legacy configuration paths (kept for compatibility but not used)
 BOTDETECT_CONFIG_DIR = "wdiscordbot-json-data"
 BOTDETECT_CONFIG_PATH = "wdiscordbot-json-data/botdetect_config.json"
@@ -145,7 +148,7 @@ async def get_guild_botdetect_config(guild_id: int) -> Dict[str, Any]:
         return result
 
     except Exception as e:
-        print(f"Failed to get botdetect config for guild {guild_id}: {e}")
+        log.error(f"Failed to get botdetect config for guild {guild_id}: {e}")
         # Return default config on error
         return {
             "enabled": False,
@@ -164,7 +167,7 @@ async def set_guild_botdetect_config(guild_id: int, config: Dict[str, Any]):
         for key, value in config.items():
             await set_botdetect_config(guild_id, key, value)
     except Exception as e:
-        print(f"Failed to set botdetect config for guild {guild_id}: {e}")
+        log.error(f"Failed to set botdetect config for guild {guild_id}: {e}")
 
 
 class BotDetectCog(commands.Cog):
@@ -175,7 +178,7 @@ class BotDetectCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        print("BotDetectCog initialized.")
+        log.info("BotDetectCog initialized.")
 
     @commands.hybrid_group(name="botdetect", description="Bot detection commands.")
     async def botdetect(self, ctx: commands.Context):
@@ -778,7 +781,7 @@ class BotDetectCog(commands.Cog):
             # "delete" action just deletes the message, which we already did above
 
         except Exception as e:
-            print(f"Error handling bot detection in {guild.name}: {e}")
+            log.error(f"Error handling bot detection in {guild.name}: {e}")
 
     async def _log_detection(
         self,
@@ -833,7 +836,7 @@ class BotDetectCog(commands.Cog):
             await log_channel.send(embed=embed)
 
         except Exception as e:
-            print(f"Error logging bot detection: {e}")
+            log.error(f"Error logging bot detection: {e}")
 
 
 async def setup(bot: commands.Bot):
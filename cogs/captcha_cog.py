@@ -14,7 +14,6 @@ import io
 import random
 from typing import Optional
 from datetime import datetime, timezone, timedelta
-from PIL import Image, ImageDraw, ImageFont
 
 from database.operations import (
     get_captcha_config,
@@ -56,6 +55,9 @@ class LocalCaptchaGenerator:
 
     def generate_captcha_image(self, text: str) -> io.BytesIO:
         """Generate a captcha image with the given text."""
+        # Pillow is only needed once someone actually starts a captcha, so keep it off the startup path.
+        from PIL import Image, ImageDraw, ImageFont
+
         # Create image with white background
         image = Image.new("RGB", (self.width, self.height), "white")
         draw = ImageDraw.Draw(image)
@@ -188,7 +190,7 @@ class CaptchaCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.captcha_generator = LocalCaptchaGenerator()
-        print("CaptchaCog initialized with local captcha generation.")
+        log.info("CaptchaCog initialized with local captcha generation.")
 
     async def cog_load(self):
         """Initialize when cog loads."""
@@ -993,4 +995,4 @@ class VerificationStartView(discord.ui.View):
 async def setup(bot: commands.Bot):
     """Load the CaptchaCog."""
     await bot.add_cog(CaptchaCog(bot))
-    print("CaptchaCog has been loaded.")
+    log.info("CaptchaCog has been loaded.")
@@ -1,3 +1,4 @@
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -10,6 +11,8 @@ from .aimod_helpers.config_manager import (
 )
 from .logging_helpers import settings_manager
 
+log = logging.getLogger(__name__)
+
 
 class ConfigCog(commands.Cog, name="Configuration"):
     """
@@ -351,6 +354,23 @@ class ConfigCog(commands.Cog, name="Configuration"):
         response_func = ctx.interaction.response.send_message if ctx.interaction else ctx.send
         await response_func("Confirmation ping role has been cleared.", ephemeral=False)
 
+    @config.command(
+        name="aboutuser_banner",
+        description="Show or hide user banners in aboutuser for this guild (admin only).",
+    )
+    @app_commands.describe(enabled="Show banners (true/false)")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def modset_aboutuser_banner(self, ctx: commands.Context, enabled: bool):
+        await set_guild_config(ctx.guild.id, "ABOUTUSER_SHOW_BANNER", enabled)
+        user_info_cog = self.bot.get_cog("UserInfoCog")
+        if user_info_cog:
+            user_info_cog.forget_show_banner(ctx.guild.id)
+        response_func = ctx.interaction.response.send_message if ctx.interaction else ctx.send
+        await response_func(
+            f"Aboutuser banners are now {'shown' if enabled else 'hidden'} in this guild.",
+            ephemeral=False if ctx.interaction else False,
+        )
+
     @config.command(
         name="ai_enabled",
         description="Enable or disable AI moderation for this guild (admin only).",
@@ -489,4 +509,4 @@ class ConfigCog(commands.Cog, name="Configuration"):
 async def setup(bot: commands.Bot):
     """Loads the ConfigCog."""
     await bot.add_cog(ConfigCog(bot))
-    print("ConfigCog has been loaded.")
+    log.info("ConfigCog has been loaded.")
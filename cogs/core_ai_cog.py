@@ -1,3 +1,4 @@
+import logging
 import json
 import discord
 from discord.ext import commands
@@ -33,6 +34,8 @@ from database.operations import (
     get_ai_decisions,
 )
 
+log = logging.getLogger(__name__)
+
 DEV_AIMODTEST_USER_IDS = config.OwnersTuple
 DEV_AIMODTEST_ENABLED = False
 
@@ -79,21 +82,21 @@ class CoreAICog(commands.Cog, name="Core AI"):
         self.media_processor = MediaProcessor()
         try:
             self.genai_client = get_litellm_client()
-            print("CoreAICog: LiteLLM client initialized successfully.")
+            log.info("CoreAICog: LiteLLM client initialized successfully.")
         except Exception as e:
-            print(f"CoreAICog: Failed to initialize LiteLLM client: {e}")
+            log.error(f"CoreAICog: Failed to initialize LiteLLM client: {e}")
             self.genai_client = None
-        print("CoreAICog Initializing.")
+        log.info("CoreAICog Initializing.")
 
     async def cog_load(self):
-        print("CoreAICog cog_load started.")
+        log.info("CoreAICog cog_load started.")
         if not self.genai_client:
             try:
                 self.genai_client = get_litellm_client()
-                print("CoreAICog: LiteLLM client re-initialized on load.")
+                log.info("CoreAICog: LiteLLM client re-initialized on load.")
             except Exception as e:
-                print(f"CoreAICog: Failed to re-initialize LiteLLM client on load: {e}")
-        print("CoreAICog cog_load finished.")
+                log.error(f"CoreAICog: Failed to re-initialize LiteLLM client on load: {e}")
+        log.info("CoreAICog cog_load finished.")
 
         # Auto-ban any users already in servers who are on the global ban list
         for guild in self.bot.guilds:
@@ -102,14 +105,14 @@ class CoreAICog(commands.Cog, name="Core AI"):
                     try:
                         ban_reason = "Globally banned for severe universal violation. (Auto-enforced on cog load)"
                         await guild.ban(member, reason=ban_reason)
-                        print(f"[GLOBAL BAN] Auto-banned {member} ({member.id}) from {guild.name} on cog load.")
+                        log.info(f"[GLOBAL BAN] Auto-banned {member} ({member.id}) from {guild.name} on cog load.")
                         try:
                             dm_channel = await member.create_dm()
                             await dm_channel.send(
                                 f"You have been globally banned for a severe universal violation and have been banned from **{guild.name}**."
                             )
                         except Exception as e:
-                            print(f"Could not DM globally banned user {member}: {e}")
+                            log.warning(f"Could not DM globally banned user {member}: {e}")
                         # Optionally log to mod log channel
                         log_channel_id = await get_guild_config_async(guild.id, "ai_actions_log_channel_id")
                         log_channel = self.bot.get_channel(log_channel_id) if log_channel_id else None
@@ -134,17 +137,17 @@ class CoreAICog(commands.Cog, name="Core AI"):
                             try:
                                 await log_channel.send(embed=embed)
                             except discord.Forbidden:
-                                print(
+                                log.warning(
                                     f"WARNING: Missing permissions to send global ban enforcement log to channel {log_channel.id} in guild {guild.id}."
                                 )
                             except Exception as e:
-                                print(f"Error sending global ban enforcement log: {e}")
+                                log.error(f"Error sending global ban enforcement log: {e}")
                     except discord.Forbidden:
-                        print(
+                        log.warning(
                             f"WARNING: Missing permissions to ban user {member} ({member.id}) from guild {guild.name} during cog load."
                         )
                     except Exception as e:
-                        print(
+                        log.error(
                             f"Error auto-banning globally banned user {member} ({member.id}) from guild {guild.name}: {e}"
                         )
 
@@ -152,7 +155,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
         """
         Close any open connections when the cog is unloaded.
         """
-        print("CoreAICog Unloaded.")
+        log.info("CoreAICog Unloaded.")
 
     @commands.hybrid_group(name="infractions", description="Manage user infractions.")
     async def infractions(self, ctx: commands.Context):
@@ -208,7 +211,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
                     f"User ID `{user_id}` added to the global ban list. Reason {globalbanreason}",
                     ephemeral=False,
                 )
-                print(f"[MODERATION] User ID {user_id} added to global ban list by {ctx.author} ({ctx.author.id}).")
+                log.info(f"[MODERATION] User ID {user_id} added to global ban list by {ctx.author} ({ctx.author.id}).")
             else:
                 await ctx.reply(
                     f"User ID `{user_id}` is already in the global ban list.",
@@ -222,7 +225,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
                     f"User ID `{user_id}` removed from the global ban list. {globalbanreason}",
                     ephemeral=False,
                 )
-                print(f"[MODERATION] User ID {user_id} removed from global ban list by {ctx.author} ({ctx.author.id}).")
+                log.info(f"[MODERATION] User ID {user_id} removed from global ban list by {ctx.author} ({ctx.author.id}).")
             else:
                 await ctx.reply(
                     f"User ID `{user_id}` is not in the global ban list.",
@@ -410,7 +413,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
         USER_INFRACTIONS[key] = []
         await save_user_infractions()
 
-        print(
+        log.info(
             f"[MODERATION] Cleared {len(infractions)} infraction(s) for user {user} (ID: {user.id}) in guild {ctx.guild.name} (ID: {ctx.guild.id}) by {ctx.author} (ID: {ctx.author.id}) at {datetime.datetime.now(datetime.timezone.utc).isoformat()}.".replace(
                 ")", ")\n"
             )
@@ -422,9 +425,9 @@ class CoreAICog(commands.Cog, name="Core AI"):
                 f"Your infraction history in **{ctx.guild.name}** has been cleared by an administrator."
             )
         except discord.Forbidden:
-            print(f"[MODERATION] Could not DM user {user} about infraction clearance (DMs disabled).")
+            log.warning(f"[MODERATION] Could not DM user {user} about infraction clearance (DMs disabled).")
         except Exception as e:
-            print(f"[MODERATION] Error DMing user {user} about infraction clearance: {e}")
+            log.error(f"[MODERATION] Error DMing user {user} about infraction clearance: {e}")
 
         await ctx.reply(
             f"Cleared {len(infractions)} infraction(s) for {user.mention}.",
@@ -454,43 +457,43 @@ class CoreAICog(commands.Cog, name="Core AI"):
             if guild_api_key.api_provider == "github_copilot":
                 auth_info = guild_api_key.github_auth_info
                 provider_used = "github_copilot"
-                print(f"Using GitHub Copilot for guild {guild_id} with model: {model_used}")
+                log.info(f"Using GitHub Copilot for guild {guild_id} with model: {model_used}")
             elif guild_api_key.api_provider == "openrouter":
                 # For OpenRouter, use the API key and ensure proper model handling
                 api_key = guild_api_key.api_key
                 provider_used = "guild_openrouter"
-                print(f"Using guild-specific OpenRouter API key for guild {guild_id} with model: {model_used}")
+                log.info(f"Using guild-specific OpenRouter API key for guild {guild_id} with model: {model_used}")
             else:
                 # For other providers, the key is the api_key
                 api_key = guild_api_key.api_key
                 provider_used = guild_api_key.api_provider
-                print(f"Using {guild_api_key.api_provider} provider for guild {guild_id} with model: {model_used}")
+                log.info(f"Using {guild_api_key.api_provider} provider for guild {guild_id} with model: {model_used}")
         else:
             # No guild-specific API key found, fall back to global OpenRouter key
             from .aimod_helpers.litellm_config import OPENROUTER_API_KEY
             if OPENROUTER_API_KEY:
                 api_key = OPENROUTER_API_KEY
                 provider_used = "global_openrouter"
-                print(f"No guild-specific API key found for guild {guild_id}, using global OpenRouter key with model: {model_used}")
+                log.info(f"No guild-specific API key found for guild {guild_id}, using global OpenRouter key with model: {model_used}")
             else:
-                print(f"ERROR: No API key available for guild {guild_id} - neither guild-specific nor global OpenRouter key found")
+                log.error(f"No API key available for guild {guild_id} - neither guild-specific nor global OpenRouter key found")
                 return None
 
         if custom_rules_text is not None:
             rules_text = custom_rules_text
-            print("Using custom rule instructions for analysis.")
+            log.info("Using custom rule instructions for analysis.")
         else:
             # Check for channel-specific rules first, fallback to server rules
             channel_rules = await get_channel_rules(guild_id, message.channel.id)
             if channel_rules:
                 rules_text = channel_rules
-                print(f"Using channel-specific rules for channel {message.channel.name} (ID: {message.channel.id})")
+                log.info(f"Using channel-specific rules for channel {message.channel.name} (ID: {message.channel.id})")
             else:
                 rules_text = await self.get_server_rules(guild_id)
                 if rules_text == "No rules set.":
-                    print("No server rules set; skipping analysis.")
+                    log.info("No server rules set; skipping analysis.")
                     return None
-                print(f"Using server default rules for channel {message.channel.name} (ID: {message.channel.id})")
+                log.info(f"Using server default rules for channel {message.channel.name} (ID: {message.channel.id})")
 
         system_prompt_text = SYSTEM_PROMPT_TEMPLATE.format(rules_text=rules_text)
 
@@ -560,17 +563,17 @@ class CoreAICog(commands.Cog, name="Core AI"):
             image_descriptions = []
             for mime_type, image_bytes, attachment_type, filename in image_data_list:
                 image_descriptions.append(f"[{attachment_type.upper()} ATTACHMENT: {filename}]")
-                print(f"Added {attachment_type} attachment to AI analysis: {filename}")
+                log.debug(f"Added {attachment_type} attachment to AI analysis: {filename}")
 
             if image_descriptions:
                 messages[-1]["content"] += "\n\nAttachments:\n" + "\n".join(image_descriptions)
 
         try:
             # Enhanced logging for provider and model being used
-            print(f"[AI_ANALYSIS] Guild {guild_id}: Using {provider_used} provider with model: {model_used}")
+            log.info(f"[AI_ANALYSIS] Guild {guild_id}: Using {provider_used} provider with model: {model_used}")
             if api_key:
                 key_preview = f"{api_key[:8]}...{api_key[-4:]}" if len(api_key) > 12 else "***"
-                print(f"[AI_ANALYSIS] Guild {guild_id}: API key preview: {key_preview}")
+                log.debug(f"[AI_ANALYSIS] Guild {guild_id}: API key preview: {key_preview}")
             
             response = await self.genai_client.generate_content(
                 model=model_used,
@@ -584,14 +587,14 @@ class CoreAICog(commands.Cog, name="Core AI"):
             ai_response_text = response.text
 
             if not ai_response_text:
-                print("Error: Empty response from LiteLLM API.")
+                log.error("Empty response from LiteLLM API.")
                 return None
 
             try:
                 json_start_index = ai_response_text.find("{")
                 if json_start_index == -1:
-                    print("Error: Could not find the start of the JSON object in AI response.")
-                    print(f"Raw AI response: {ai_response_text}")
+                    log.error("Could not find the start of the JSON object in AI response.")
+                    log.info(f"Raw AI response: {ai_response_text}")
                     return None
 
                 json_string = ai_response_text[json_start_index:].strip()
@@ -606,15 +609,15 @@ class CoreAICog(commands.Cog, name="Core AI"):
 
                 required_keys = ["reasoning", "violation", "rule_violated", "action"]
                 if not all(key in ai_decision for key in required_keys):
-                    print(f"Error: AI response missing required keys. Got: {ai_decision}")
+                    log.error(f"AI response missing required keys. Got: {ai_decision}")
                     return None
 
-                print(f"AI Decision: {ai_decision}")
+                log.info(f"AI Decision: {ai_decision}")
                 return ai_decision
 
             except json.JSONDecodeError as e:
-                print(f"Error parsing AI response as JSON: {e}")
-                print(f"Raw AI response: {ai_response_text}")
+                log.error(f"Error parsing AI response as JSON: {e}")
+                log.info(f"Raw AI response: {ai_response_text}")
                 return None
         except Exception as e:
             # Enhanced error handling for different providers
@@ -623,26 +626,26 @@ class CoreAICog(commands.Cog, name="Core AI"):
             if provider_used in ["guild_openrouter", "global_openrouter"]:
                 provider_name = "OpenRouter (guild-specific)" if provider_used == "guild_openrouter" else "OpenRouter (global)"
                 if "quota" in error_str or "rate limit" in error_str:
-                    print(f"[ERROR] {provider_name} quota/rate limit exceeded for guild {guild_id} with model {model_used}: {e}")
+                    log.error(f"{provider_name} quota/rate limit exceeded for guild {guild_id} with model {model_used}: {e}")
                 elif "unauthorized" in error_str or "invalid api key" in error_str:
-                    print(f"[ERROR] {provider_name} authentication failed for guild {guild_id}: Invalid API key")
+                    log.error(f"{provider_name} authentication failed for guild {guild_id}: Invalid API key")
                 elif "model not found" in error_str or "not available" in error_str:
-                    print(f"[ERROR] {provider_name} model '{model_used}' not found or unavailable for guild {guild_id}: {e}")
+                    log.error(f"{provider_name} model '{model_used}' not found or unavailable for guild {guild_id}: {e}")
                 elif "insufficient credits" in error_str or "balance" in error_str:
-                    print(f"[ERROR] {provider_name} insufficient credits for guild {guild_id} with model {model_used}: {e}")
+                    log.error(f"{provider_name} insufficient credits for guild {guild_id} with model {model_used}: {e}")
                 else:
-                    print(f"[ERROR] {provider_name} API error for guild {guild_id} with model {model_used}: {e}")
+                    log.error(f"{provider_name} API error for guild {guild_id} with model {model_used}: {e}")
             elif provider_used == "github_copilot":
-                print(f"[ERROR] GitHub Copilot API error for guild {guild_id} with model {model_used}: {e}")
+                log.error(f"GitHub Copilot API error for guild {guild_id} with model {model_used}: {e}")
             else:
-                print(f"[ERROR] {provider_used} API error for guild {guild_id} with model {model_used}: {e}")
+                log.error(f"{provider_used} API error for guild {guild_id} with model {model_used}: {e}")
             return None
 
     async def _execute_ban(self, message: discord.Message, reason: str, rule_violated: str):
         """Helper function to execute a ban."""
         ban_reason = f"AI Mod: Rule {rule_violated}. Reason: {reason}"
         await message.guild.ban(message.author, reason=ban_reason, delete_message_days=1)
-        print(f"[MODERATION] BANNED user {message.author} for violating rule {rule_violated}.")
+        log.info(f"[MODERATION] BANNED user {message.author} for violating rule {rule_violated}.")
         await add_user_infraction(
             message.guild.id,
             message.author.id,
@@ -659,13 +662,13 @@ class CoreAICog(commands.Cog, name="Core AI"):
                 f"If you believe this was a mistake, you may appeal using the `/appeal` command."
             )
         except Exception as e:
-            print(f"Could not DM banned user: {e}")
+            log.warning(f"Could not DM banned user: {e}")
 
     async def _execute_kick(self, message: discord.Message, reason: str, rule_violated: str):
         """Helper function to execute a kick."""
         kick_reason = f"AI Mod: Rule {rule_violated}. Reason: {reason}"
         await message.author.kick(reason=kick_reason)
-        print(f"[MODERATION] KICKED user {message.author} for violating rule {rule_violated}.")
+        log.info(f"[MODERATION] KICKED user {message.author} for violating rule {rule_violated}.")
         await add_user_infraction(
             message.guild.id,
             message.author.id,
@@ -682,7 +685,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
                 f"You may rejoin the server, but please review the rules."
             )
         except Exception as e:
-            print(f"Could not DM kicked user: {e}")
+            log.warning(f"Could not DM kicked user: {e}")
 
     async def _execute_timeout(
         self,
@@ -699,7 +702,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
             discord.utils.utcnow() + datetime.timedelta(seconds=duration_seconds),
             reason=timeout_reason,
         )
-        print(
+        log.info(
             f"[MODERATION] TIMED OUT user {message.author} for {duration_readable} for violating rule {rule_violated}."
         )
         await add_user_infraction(
@@ -718,11 +721,11 @@ class CoreAICog(commands.Cog, name="Core AI"):
                 f"If you believe this was a mistake, you may appeal using the `/appeal` command."
             )
         except Exception as e:
-            print(f"Could not DM timed out user: {e}")
+            log.warning(f"Could not DM timed out user: {e}")
 
     async def _execute_warn(self, message: discord.Message, reason: str, rule_violated: str):
         """Helper function to execute a warn."""
-        print(f"[MODERATION] DELETED message from {message.author} (AI suggested WARN for rule {rule_violated}).")
+        log.info(f"[MODERATION] DELETED message from {message.author} (AI suggested WARN for rule {rule_violated}).")
         try:
             await message.author.send(
                 f"Your recent message in **{message.guild.name}** was removed for violating Rule **{rule_violated}**. "
@@ -730,7 +733,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
                 f"If you believe this was a mistake, you may appeal using the `/appeal` command."
             )
         except Exception as e:
-            print(f"[MODERATION] Error sending warning DM to {message.author}: {e}")
+            log.error(f"[MODERATION] Error sending warning DM to {message.author}: {e}")
         await add_user_infraction(
             message.guild.id,
             message.author.id,
@@ -839,10 +842,10 @@ class CoreAICog(commands.Cog, name="Core AI"):
                 except (discord.NotFound, discord.Forbidden):
                     pass
                 await action_function(*action_args)
-                print(f"Moderator approved action '{action}' for user {user_id}")
+                log.info(f"Moderator approved action '{action}' for user {user_id}")
 
             async def deny_action():
-                print(f"Moderator denied action '{action}' for user {user_id}")
+                log.info(f"Moderator denied action '{action}' for user {user_id}")
 
             view = ActionConfirmationView(
                 action=action,
@@ -860,7 +863,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
             try:
                 await message.delete()
             except (discord.NotFound, discord.Forbidden) as e:
-                print(f"Could not delete message before action '{action}': {e}")
+                log.warning(f"Could not delete message before action '{action}': {e}")
 
             try:
                 await action_function(*action_args)
@@ -868,7 +871,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
                 notification_embed.add_field(name="Status", value=action_taken_message, inline=False)
                 await log_channel.send(embed=notification_embed)
             except discord.Forbidden as e:
-                print(f"Permission error executing {action}: {e}")
+                log.error(f"Permission error executing {action}: {e}")
                 # Notify mods of permission failure
                 mod_ping = f"<@&{moderator_role_id}>" if moderator_role_id else "Moderators"
                 await log_channel.send(
@@ -876,7 +879,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
                     embed=notification_embed,
                 )
             except Exception as e:
-                print(f"Unexpected error executing {action}: {e}")
+                log.error(f"Unexpected error executing {action}: {e}")
         else:  # Fallback for NOTIFY_MODS, SUICIDAL, etc.
             # This part handles actions that are always manual or have special handling
             if action == "NOTIFY_MODS":
@@ -889,7 +892,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
                 try:
                     await message.author.send(SUICIDAL_HELP_RESOURCES)
                 except Exception as e:
-                    print(f"Could not DM suicidal help resources: {e}")
+                    log.warning(f"Could not DM suicidal help resources: {e}")
             else:
                 action_taken_message = "Action Taken: **None** (AI suggested IGNORE or unhandled action)."
                 notification_embed.color = discord.Color.light_grey()
@@ -921,17 +924,17 @@ class CoreAICog(commands.Cog, name="Core AI"):
     @commands.Cog.listener(name="on_member_join")
     async def member_join_listener(self, member: discord.Member):
         """Checks if a joining member is globally banned and bans them if so."""
-        print(
+        log.info(
             f"on_member_join triggered for user: {member} ({member.id}) in guild: {member.guild.name} ({member.guild.id})"
         )
         if self.is_globally_banned(member.id):
-            print(
+            log.info(
                 f"User {member} ({member.id}) is globally banned. Banning from guild {member.guild.name} ({member.guild.id})."
             )
             try:
                 ban_reason = "Globally banned for severe universal violation."
                 await member.guild.ban(member, reason=ban_reason)
-                print(
+                log.info(
                     f"Successfully banned globally banned user {member} ({member.id}) from guild {member.guild.name}."
                 )
                 try:
@@ -940,7 +943,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
                         f"You have been globally banned for a severe universal violation and have been banned from **{member.guild.name}**."
                     )
                 except Exception as e:
-                    print(f"Could not DM globally banned user {member}: {e}")
+                    log.warning(f"Could not DM globally banned user {member}: {e}")
 
                 log_channel_id = await get_guild_config_async(member.guild.id, "ai_actions_log_channel_id")
                 log_channel = self.bot.get_channel(log_channel_id) if log_channel_id else None
@@ -965,14 +968,14 @@ class CoreAICog(commands.Cog, name="Core AI"):
                     try:
                         await log_channel.send(embed=embed)
                     except discord.Forbidden:
-                        print(
+                        log.warning(
                             f"WARNING: Missing permissions to send global ban enforcement log to channel {log_channel.id} in guild {member.guild.id}."
                         )
                     except Exception as e:
-                        print(f"Error sending global ban enforcement log: {e}")
+                        log.error(f"Error sending global ban enforcement log: {e}")
 
             except discord.Forbidden:
-                print(
+                log.warning(
                     f"WARNING: Missing permissions to ban user {member} ({member.id}) from guild {member.guild.name} ({member.guild.id})."
                 )
                 log_channel_id = await get_guild_config_async(member.guild.id, "ai_actions_log_channel_id")
@@ -985,9 +988,9 @@ class CoreAICog(commands.Cog, name="Core AI"):
                             f"{mod_ping} **PERMISSION ERROR!** Could not ban globally banned user {member.mention} (`{member.id}`) from this server. Please check bot permissions."
                         )
                     except discord.Forbidden:
-                        print("FATAL: Bot lacks permission to send messages, even permission errors.")
+                        log.critical("FATAL: Bot lacks permission to send messages, even permission errors.")
             except Exception as e:
-                print(
+                log.error(
                     f"An unexpected error occurred during global ban enforcement for user {member} ({member.id}) in guild {member.guild.name}: {e}"
                 )
                 log_channel_id = await get_guild_config_async(member.guild.id, "ai_actions_log_channel_id")
@@ -1000,44 +1003,44 @@ class CoreAICog(commands.Cog, name="Core AI"):
                             f"{mod_ping} **UNEXPECTED ERROR!** An error occurred while enforcing global ban for user {member.mention} (`{member.id}`). Please check bot logs."
                         )
                     except discord.Forbidden:
-                        print("FATAL: Bot lacks permission to send messages, even error notifications.")
+                        log.critical("FATAL: Bot lacks permission to send messages, even error notifications.")
             return
 
     @commands.Cog.listener(name="on_message")
     async def message_listener(self, message: discord.Message):
         """Listens to messages and triggers moderation checks."""
-        print(f"on_message triggered for message ID: {message.id}")
+        log.debug(f"on_message triggered for message ID: {message.id}")
         if message.author.bot:
-            print(f"Ignoring message {message.id} from bot.")
+            log.debug(f"Ignoring message {message.id} from bot.")
             return
         if not message.content and not message.attachments:
-            print(f"Ignoring message {message.id} with no content or attachments.")
+            log.debug(f"Ignoring message {message.id} with no content or attachments.")
             return
         if not message.guild:
-            print(f"Ignoring message {message.id} from DM.")
+            log.debug(f"Ignoring message {message.id} from DM.")
             return
         if not await get_guild_config_async(message.guild.id, "ENABLED", True):
-            print(f"Moderation disabled for guild {message.guild.id}. Ignoring message {message.id}.")
+            log.debug(f"Moderation disabled for guild {message.guild.id}. Ignoring message {message.id}.")
             return
 
         # Check if channel is excluded from AI moderation
         if await is_channel_excluded(message.guild.id, message.channel.id):
-            print(
+            log.debug(
                 f"Channel {message.channel.name} (ID: {message.channel.id}) is excluded from AI moderation. Ignoring message {message.id}."
             )
             return
         if self.is_globally_banned(message.author.id):
-            print(
+            log.info(
                 f"Globally banned user {message.author} ({message.author.id}) sent a message in guild {message.guild.name}. Attempting to ban."
             )
             try:
                 ban_reason = "Globally banned user sent message."
                 await message.guild.ban(message.author, reason=ban_reason, delete_message_days=1)
-                print(
+                log.info(
                     f"Successfully banned globally banned user {message.author} from guild {message.guild.name} after they sent a message."
                 )
             except discord.Forbidden:
-                print(
+                log.warning(
                     f"WARNING: Missing permissions to ban globally banned user {message.author} ({message.author.id}) from guild {message.guild.name} after they sent a message."
                 )
                 log_channel_id = await get_guild_config_async(message.guild.id, "ai_actions_log_channel_id")
@@ -1050,9 +1053,9 @@ class CoreAICog(commands.Cog, name="Core AI"):
                             f"{mod_ping} **PERMISSION ERROR!** Globally banned user {message.author.mention} (`{message.author.id}`) sent a message but could not be banned from this server. Please check bot permissions."
                         )
                     except discord.Forbidden:
-                        print("FATAL: Bot lacks permission to send messages, even error notifications.")
+                        log.critical("FATAL: Bot lacks permission to send messages, even error notifications.")
             except Exception as e:
-                print(
+                log.error(
                     f"An unexpected error occurred when banning globally banned user {message.author} ({message.author.id}) after they sent a message: {e}"
                 )
                 log_channel_id = await get_guild_config_async(message.guild.id, "ai_actions_log_channel_id")
@@ -1065,7 +1068,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
                             f"{mod_ping} **UNEXPECTED ERROR!** An error occurred while banning globally banned user {message.author.mention} (`{message.author.id}`) after they sent a message. Please check bot logs."
                         )
                     except discord.Forbidden:
-                        print("FATAL: Bot lacks permission to send messages, even error notifications.")
+                        log.critical("FATAL: Bot lacks permission to send messages, even error notifications.")
             return
 
         analysis_mode = await get_analysis_mode(message.guild.id)
@@ -1074,7 +1077,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
         custom_rules_text = None
         if analysis_mode == "rules_only":
             if not matched_rule:
-                print("No rule matched; skipping analysis in rules_only mode.")
+                log.info("No rule matched; skipping analysis in rules_only mode.")
                 return
             custom_rules_text = matched_rule.get("instructions", "")
         elif analysis_mode == "override":
@@ -1087,17 +1090,17 @@ class CoreAICog(commands.Cog, name="Core AI"):
                 mime_type, image_bytes, attachment_type = await self.media_processor.process_attachment(attachment)
                 if mime_type and image_bytes and attachment_type:
                     image_data_list.append((mime_type, image_bytes, attachment_type, attachment.filename))
-                    print(f"Processed attachment: {attachment.filename} as {attachment_type}")
+                    log.debug(f"Processed attachment: {attachment.filename} as {attachment_type}")
 
             if image_data_list:
-                print(f"Processed {len(image_data_list)} attachments for message {message.id}")
+                log.info(f"Processed {len(image_data_list)} attachments for message {message.id}")
 
         if not message_content and not image_data_list:
-            print(f"Ignoring message {message.id} with no content or valid attachments.")
+            log.debug(f"Ignoring message {message.id} with no content or valid attachments.")
             return
 
         if not self.genai_client:
-            print(f"Skipping AI analysis for message {message.id}: LiteLLM Client is not available.")
+            log.info(f"Skipping AI analysis for message {message.id}: LiteLLM Client is not available.")
             return
 
         infractions = get_user_infraction_history(message.guild.id, message.author.id)
@@ -1115,10 +1118,10 @@ class CoreAICog(commands.Cog, name="Core AI"):
         if len(user_history_summary) > max_history_len:
             user_history_summary = user_history_summary[: max_history_len - 3] + "..."
 
-        print(f"Analyzing message {message.id} from {message.author} in #{message.channel.name} with history...")
+        log.info(f"Analyzing message {message.id} from {message.author} in #{message.channel.name} with history...")
         if image_data_list:
             attachment_types = [data[2] for data in image_data_list]
-            print(f"Including {len(image_data_list)} attachments in analysis: {', '.join(attachment_types)}")
+            log.info(f"Including {len(image_data_list)} attachments in analysis: {', '.join(attachment_types)}")
         ai_decision = await self.query_vertex_ai(
             message,
             message_content,
@@ -1128,7 +1131,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
         )
 
         if not ai_decision:
-            print(f"Failed to get valid AI decision for message {message.id}.")
+            log.error(f"Failed to get valid AI decision for message {message.id}.")
             self.last_ai_decisions.append(
                 {
                     "message_id": message.id,
@@ -1181,7 +1184,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
             )
             await self.handle_violation(message, ai_decision, notify_mods_message)
         else:
-            print(f"AI analysis complete for message {message.id}. No violation detected.")
+            log.info(f"AI analysis complete for message {message.id}. No violation detected.")
 
     @ai.command(name="decisions", description="View recent AI moderation decisions")
     @app_commands.guild_only()
@@ -1204,7 +1207,7 @@ class CoreAICog(commands.Cog, name="Core AI"):
             await ctx.reply("You must be an administrator to use this command.", ephemeral=True)
         else:
             await ctx.reply(f"An error occurred: {error}", ephemeral=True)
-            print(f"Error in ai_last_decisions command: {error}")
+            log.error(f"Error in ai_last_decisions command: {error}")
 
     @staticmethod
     def build_decision_embed(record: dict, index: int, total: int) -> discord.Embed:
@@ -1250,4 +1253,4 @@ class CoreAICog(commands.Cog, name="Core AI"):
 async def setup(bot: commands.Bot):
     """Loads the CoreAICog."""
     await bot.add_cog(CoreAICog(bot))
-    print("CoreAICog has been loaded.")
+    log.info("CoreAICog has been loaded.")
@@ -1,8 +1,11 @@
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
 import aiohttp
 
+log = logging.getLogger(__name__)
+
 # The GitHub repository to fetch contributors from
 REPO_OWNER = "openguard-bot"
 REPO_NAME = "openguard"
@@ -24,10 +27,10 @@ class CreditsCog(commands.Cog):
                         user_data = await response.json()
                         return user_data.get('avatar_url')
                     else:
-                        print(f"Failed to fetch repo owner avatar. GitHub API returned status: {response.status}")
+                        log.error(f"Failed to fetch repo owner avatar. GitHub API returned status: {response.status}")
                         return None
         except aiohttp.ClientError as e:
-            print(f"An error occurred while trying to connect to GitHub for repo owner avatar: {e}")
+            log.error(f"An error occurred while trying to connect to GitHub for repo owner avatar: {e}")
             return None
 
     @app_commands.command(name="credits", description="Show the contributors for OpenGuard.")
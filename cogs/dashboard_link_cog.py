@@ -1,8 +1,11 @@
+import logging
 import discord
 from discord.ext import commands
 
 from lists import config
 
+log = logging.getLogger(__name__)
+
 
 class DashboardLinkCog(commands.Cog):
     """Provides a command to link the dashboard."""
@@ -29,4 +32,4 @@ class DashboardLinkCog(commands.Cog):
 
 async def setup(bot: commands.Bot) -> None:
     await bot.add_cog(DashboardLinkCog(bot))
-    print("DashboardLinkCog has been loaded.")
+    log.info("DashboardLinkCog has been loaded.")
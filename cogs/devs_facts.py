@@ -1,7 +1,10 @@
+import logging
 import discord
 from discord.ext import commands
 import random
 
+log = logging.getLogger(__name__)
+
 
 class DevsFacts(commands.Cog):
     """
@@ -75,4 +78,4 @@ class DevsFacts(commands.Cog):
 async def setup(bot: commands.Bot):
     """Load the DevsFacts cog."""
     await bot.add_cog(DevsFacts(bot))
-    print("DevsFacts cog has been loaded.")
+    log.info("DevsFacts cog has been loaded.")
@@ -6,8 +6,6 @@ from discord import app_commands
 from typing import Optional, List, Dict, Any
 import inspect
 
-from bot import get_prefix
-
 
 class HelpView(discord.ui.View):
     """Interactive view for the help command with category navigation."""
@@ -360,7 +358,7 @@ class HelpView(discord.ui.View):
             value=(
                 "• Use the dropdown below to browse command categories.\n"
                 "• Almost all commands are slash commands (start with `/`).\n"
-                f"• All commands can also be invoked using the prefix `{await get_prefix(self.bot, ctx)}`, but they may not behave correctly, and can't be ephemeral.\n"
+                f"• All commands can also be invoked using the prefix `{await self.bot.get_prefix(ctx.message)}`, but they may not behave correctly, and can't be ephemeral.\n"
                 "• Use `/help <command>` for detailed help on a specific command."
             ),
             inline=False,
@@ -374,7 +372,7 @@ class HelpView(discord.ui.View):
             value=(
                 f"• **Servers**: {len(self.bot.guilds)}\n"
                 f"• **Commands**: {total_commands}\n"
-                f"• **Prefix**: `{await get_prefix(self.bot, ctx)}`\n"
+                f"• **Prefix**: `{await self.bot.get_prefix(ctx.message)}`\n"
             ),
             inline=True,
         )
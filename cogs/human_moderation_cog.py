@@ -1193,7 +1193,7 @@ class HumanModerationCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_ready(self):
-        print(f"{self.__class__.__name__} cog has been loaded.")
+        logger.info(f"{self.__class__.__name__} cog has been loaded.")
 
 
 # Modals for context menu commands
@@ -1,4 +1,5 @@
 # pylint: disable=import-error
+import logging
 import platform
 import psutil
 import discord
@@ -8,6 +9,8 @@ import time
 import GPUtil
 import distro
 
+log = logging.getLogger(__name__)
+
 try:
     import wmi
 
@@ -39,7 +42,7 @@ class HwInfo(commands.Cog):
             else:
                 await ctx.send(embed=embed)  # For prefix commands
         except Exception as e:
-            print(f"Error in systemcheck command: {e}")
+            log.error(f"Error in systemcheck command: {e}")
             if ctx.interaction:
                 await ctx.interaction.followup.send(f"An error occurred while checking system status: {e}")
             else:
@@ -57,7 +60,7 @@ class HwInfo(commands.Cog):
                     if not member.bot:
                         user_ids.add(member.id)
             except Exception as e:
-                print(f"Error counting members in guild {guild.name}: {e}")
+                log.error(f"Error counting members in guild {guild.name}: {e}")
         user_count = len(user_ids)
 
         system = platform.system()
@@ -79,7 +82,7 @@ class HwInfo(commands.Cog):
                 win_build = platform.win32_ver()[1]
                 os_info = f"Windows {win_ver} (Build {win_build})"
             except Exception as e:
-                print(f"Could not get detailed Windows version: {e}")
+                log.warning(f"Could not get detailed Windows version: {e}")
 
         uptime_seconds = time.time() - psutil.boot_time()
         days, remainder = divmod(uptime_seconds, 86400)
@@ -115,7 +118,7 @@ class HwInfo(commands.Cog):
             total_threads = psutil.cpu_count(logical=True)
             cpu_name = f"{cpu_name_base} ({physical_cores}C/{total_threads}T)"
         except Exception as e:
-            print(f"Error getting CPU info: {e}")
+            log.error(f"Error getting CPU info: {e}")
             cpu_name = "N/A"
 
         motherboard_info = self._get_motherboard_info()
@@ -137,7 +140,7 @@ class HwInfo(commands.Cog):
         except ImportError:
             gpu_info = "GPUtil library not installed. Cannot get detailed GPU info."
         except Exception as e:
-            print(f"Error getting GPU info via GPUtil: {e}")
+            log.error(f"Error getting GPU info via GPUtil: {e}")
             gpu_info = f"Error retrieving GPU info: {e}"
 
         if isinstance(context_or_interaction, commands.Context):
@@ -214,7 +217,7 @@ class HwInfo(commands.Cog):
             else:
                 return f"Unsupported OS: {system}"
         except Exception as e:
-            print(f"Error getting motherboard info: {e}")
+            log.error(f"Error getting motherboard info: {e}")
             return "Error retrieving motherboard info"
 
     @system.command(
@@ -441,7 +441,7 @@ class ModLogCog(commands.Cog):
         """
         Method called when the cog is loaded.
         """
-        print("ModLogCog has been loaded.")
+        log.info("ModLogCog has been loaded.")
 
 
 async def setup(bot: commands.Bot):
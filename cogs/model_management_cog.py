@@ -1,3 +1,4 @@
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -14,6 +15,8 @@ from database.operations import (
 )
 from .aimod_helpers.copilot_auth import start_copilot_login
 
+log = logging.getLogger(__name__)
+
 
 class ApiKeyModal(discord.ui.Modal):
     def __init__(self, title: str, provider: str, guild_id: int):
@@ -269,4 +272,4 @@ class ModelManagementCog(commands.Cog, name="Model Management"):
 async def setup(bot: commands.Bot):
     """Loads the ModelManagementCog."""
     await bot.add_cog(ModelManagementCog(bot))
-    print("ModelManagementCog has been loaded.")
+    log.info("ModelManagementCog has been loaded.")
@@ -1,3 +1,4 @@
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -8,6 +9,8 @@ from .aimod_helpers.config_manager import (
     set_guild_config,
 )
 
+log = logging.getLogger(__name__)
+
 
 class RaidDefenceView(discord.ui.View):
     """View with Stop Raid button for guild owners"""
@@ -40,13 +43,13 @@ class RaidDefenceView(discord.ui.View):
                         delete_message_days=1,
                     )
                     banned_count += 1
-                    print(f"[RAID DEFENSE] Banned user {user} ({user_id}) from guild {interaction.guild.name}")
+                    log.info(f"[RAID DEFENSE] Banned user {user} ({user_id}) from guild {interaction.guild.name}")
             except discord.Forbidden:
                 failed_bans.append(user_id)
-                print(f"[RAID DEFENSE] Failed to ban user {user_id} - insufficient permissions")
+                log.error(f"[RAID DEFENSE] Failed to ban user {user_id} - insufficient permissions")
             except discord.HTTPException as e:
                 failed_bans.append(user_id)
-                print(f"[RAID DEFENSE] Failed to ban user {user_id} - HTTP error: {e}")
+                log.error(f"[RAID DEFENSE] Failed to ban user {user_id} - HTTP error: {e}")
 
         # Create response embed
         embed = discord.Embed(
@@ -144,7 +147,7 @@ class RaidDefenceCog(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=False)
         else:
             await interaction.send(embed=embed, ephemeral=False)
-        print(
+        log.info(
             f"[RAID DEFENSE] Configuration updated for guild {interaction.guild.name}: enabled={enable}, threshold={threshold}, timeframe={timeframe}"
         )
 
@@ -219,7 +222,7 @@ class RaidDefenceCog(commands.Cog):
 
     async def trigger_raid_alert(self, guild: discord.Guild, suspicious_users: list, total_joins: int):
         """Trigger raid alert and send notifications"""
-        print(
+        log.info(
             f"[RAID DEFENSE] Potential raid detected in guild {guild.name}: {total_joins} joins, {len(suspicious_users)} suspicious"
         )
 
@@ -243,9 +246,9 @@ class RaidDefenceCog(commands.Cog):
             owner = guild.owner
             if owner:
                 await owner.send(embed=embed, view=view)
-                print(f"[RAID DEFENSE] Alert sent to guild owner {owner}")
+                log.info(f"[RAID DEFENSE] Alert sent to guild owner {owner}")
         except discord.Forbidden:
-            print(f"[RAID DEFENSE] Could not DM guild owner {guild.owner}")
+            log.warning(f"[RAID DEFENSE] Could not DM guild owner {guild.owner}")
 
         # Send to mod log channel if configured
         mod_log_channel_id = await get_guild_config_async(guild.id, "MOD_LOG_CHANNEL_ID")
@@ -254,9 +257,9 @@ class RaidDefenceCog(commands.Cog):
             if mod_log_channel:
                 try:
                     await mod_log_channel.send(embed=embed, view=view)
-                    print("[RAID DEFENSE] Alert sent to mod log channel")
+                    log.info("[RAID DEFENSE] Alert sent to mod log channel")
                 except discord.Forbidden:
-                    print("[RAID DEFENSE] Could not send to mod log channel")
+                    log.warning("[RAID DEFENSE] Could not send to mod log channel")
 
         # Send to general channel as fallback
         general_channel = discord.utils.get(guild.text_channels, name="general")
@@ -267,9 +270,9 @@ class RaidDefenceCog(commands.Cog):
                     embed=embed,
                     view=view,
                 )
-                print("[RAID DEFENSE] Alert sent to general channel")
+                log.info("[RAID DEFENSE] Alert sent to general channel")
             except discord.Forbidden:
-                print("[RAID DEFENSE] Could not send to general channel")
+                log.warning("[RAID DEFENSE] Could not send to general channel")
 
     async def log_raid_action(self, guild: discord.Guild, banned_count: int, failed_count: int):
         """Log raid defense action to aimod log"""
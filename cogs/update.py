@@ -1,4 +1,5 @@
 # pylint: disable=import-error
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -11,6 +12,8 @@ import tomllib
 
 from lists import config
 
+log = logging.getLogger(__name__)
+
 # The user IDs that can run the update command
 AUTHORIZED_USER_IDS = config.OwnersTuple
 
@@ -23,7 +26,7 @@ class UpdateCog(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        print("UpdateCog initialized.")
+        log.info("UpdateCog initialized.")
 
     @commands.command(name="aimod")
     async def aimod_command(self, ctx: commands.Context, subcommand: str = None):
@@ -244,7 +247,7 @@ class UpdateCog(commands.Cog):
             await self.bot.close()
             os.execv(sys.executable, [sys.executable] + sys.argv)
         except Exception as e:
-            print(f"Error during restart: {e}")
+            log.error(f"Error during restart: {e}")
             sys.exit(1)
 
     @commands.command(
@@ -327,8 +327,12 @@ async def get_guilds(request: Request):
         raise HTTPException(status_code=401, detail="Invalid token")
 
     # Get bot's guilds from cache
-    bot_guild_ids = await get_cache("bot_guilds")
-    if bot_guild_ids is None:
+    try:
+        bot_guild_ids = {int(guild_id) for guild_id in await redis_client.smembers("bot_guilds")}
+    except redis.RedisError as e:
+        logger.error(f"Failed to read bot guilds from cache: {e}")
+        bot_guild_ids = set()
+    if not bot_guild_ids:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Unable to retrieve the bot's guild list from cache. The bot may be offline, or the cache service might be down. Please try again later.",
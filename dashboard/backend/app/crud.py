@@ -53,7 +53,7 @@ async def update_general_settings(
             {"guild_id": guild_id, "key": key, "value": db_value},
         )
         if key == "prefix":
-            await redis_client.publish("prefix_updates", f"{guild_id}:{db_value}")
+            await redis_client.publish("prefix_updates", f"{guild_id}:{value}")
     await db.commit()
     return await get_general_settings(db, guild_id)
 
@@ -1321,7 +1321,7 @@ async def update_all_guild_settings(
             {"guild_id": guild_id, "key": key, "value": db_value},
         )
         if key == "prefix":
-            await redis_client.publish("prefix_updates", f"{guild_id}:{db_value}")
+            await redis_client.publish("prefix_updates", f"{guild_id}:{value}")
     await db.commit()
     return await get_all_guild_settings(db, guild_id)
 
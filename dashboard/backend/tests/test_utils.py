@@ -83,3 +83,19 @@ async def test_fetch_user_guilds_fetches_and_caches(monkeypatch):
     fetch_mock.assert_awaited_once_with("token")
     mock_redis.set.assert_any_call("user_guilds:123", json.dumps(guilds), ex=300)
     mock_redis.set.assert_any_call("guild:1", json.dumps(guilds[0]), ex=300)
+
+
+@pytest.mark.asyncio
+async def test_get_guilds_cache_outage_returns_503(monkeypatch):
+    monkeypatch.setattr(api, "SECRET_KEY", "secret")
+    token = api.create_access_token({"id": "123", "access_token": "token"})
+    request = SimpleNamespace(cookies={"access_token": f"Bearer {token}"})
+    mock_redis = SimpleNamespace(smembers=AsyncMock(side_effect=api.redis.ConnectionError("redis down")))
+    monkeypatch.setattr(api, "redis_client", mock_redis)
+    fetch_mock = AsyncMock()
+    monkeypatch.setattr(api, "fetch_user_guilds", fetch_mock)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await api.get_guilds(request)
+    assert exc_info.value.status_code == 503
+    fetch_mock.assert_not_called()
@@ -5,6 +5,7 @@ from .connection import (  # noqa: F401
     create_pool,
     get_connection,
     get_pool,
+    get_pool_stats,
     get_transaction,
 )
 from .cache import close_redis, get_redis  # noqa: F401
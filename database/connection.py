@@ -25,6 +25,12 @@ class DatabaseConfig:
         self.user = os.getenv("DB_USER", "aimod_user")
         self.password = os.getenv("DB_PASSWORD", "")
         self.database_url = os.getenv("DATABASE_URL")
+        # Prepared statements are cached per connection; set to 0 behind a transaction-mode pooler.
+        self.statement_cache_size = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
+        self.pool_min_size = int(os.getenv("DB_POOL_MIN_SIZE", "10"))
+        self.pool_max_size = int(os.getenv("DB_POOL_MAX_SIZE", "50"))
+        self.max_inactive_connection_lifetime = float(os.getenv("DB_POOL_MAX_INACTIVE_LIFETIME", "300"))
+        self.command_timeout = float(os.getenv("DB_COMMAND_TIMEOUT", "60"))
 
     def get_connection_kwargs(self) -> dict:
         """Get connection parameters for asyncpg."""
@@ -42,16 +48,20 @@ class DatabaseConfig:
             }
 
 
-async def create_pool(min_size: int = 5, max_size: int = 20) -> asyncpg.Pool:
+async def create_pool(min_size: Optional[int] = None, max_size: Optional[int] = None) -> asyncpg.Pool:
     """Create a connection pool to the PostgreSQL database."""
     config = DatabaseConfig()
     connection_kwargs = config.get_connection_kwargs()
+    min_size = config.pool_min_size if min_size is None else min_size
+    max_size = config.pool_max_size if max_size is None else max_size
 
     try:
         pool = await asyncpg.create_pool(
             min_size=min_size,
             max_size=max_size,
-            command_timeout=60,
+            max_inactive_connection_lifetime=config.max_inactive_connection_lifetime,
+            command_timeout=config.command_timeout,
+            statement_cache_size=config.statement_cache_size,
             **connection_kwargs,
         )
         log.info(f"Created database connection pool (min={min_size}, max={max_size})")
@@ -65,7 +75,7 @@ async def initialize_database() -> bool:
     """
     Initialize the database with required tables and indexes only if they don't exist.
     """
-    from database.models import SCHEMA_SQL, INDEXES_SQL, TRIGGERS_SQL
+    from database.models import SCHEMA_SQL, INDEXES_SQL, TRIGGERS_SQL, PREFIX_SYNC_SQL
 
     config = DatabaseConfig()
     connection_kwargs = config.get_connection_kwargs()
@@ -117,6 +127,14 @@ async def initialize_database() -> bool:
             raise
 
         log.info("Database triggers initialization complete.")
+
+        try:
+            await conn.execute(PREFIX_SYNC_SQL)
+            log.info("Guild prefix sync trigger created/updated successfully.")
+        except Exception as e:
+            log.error(f"Error executing prefix sync statements: {e}")
+            raise
+
         return True
 
     except Exception as e:
@@ -137,6 +155,19 @@ async def get_pool() -> asyncpg.Pool:
     return _pool
 
 
+def get_pool_stats() -> Optional[dict]:
+    """Get the size of the global connection pool, or None if it hasn't been created."""
+    if _pool is None:
+        return None
+
+    return {
+        "size": _pool.get_size(),
+        "idle": _pool.get_idle_size(),
+        "min_size": _pool.get_min_size(),
+        "max_size": _pool.get_max_size(),
+    }
+
+
 async def close_pool():
     """Close the global connection pool."""
     global _pool
@@ -299,6 +299,12 @@ CREATE TABLE IF NOT EXISTS guild_settings (
     PRIMARY KEY (guild_id, key)
 );
 
+-- Guild command prefixes, kept in sync with guild_settings by the sync_guild_prefixes trigger
+CREATE TABLE IF NOT EXISTS guild_prefixes (
+    guild_id BIGINT PRIMARY KEY,
+    prefix TEXT NOT NULL
+);
+
 -- Log event toggles table
 CREATE TABLE IF NOT EXISTS log_event_toggles (
     guild_id BIGINT NOT NULL,
@@ -465,3 +471,37 @@ CREATE TRIGGER update_botdetect_config_updated_at BEFORE UPDATE ON botdetect_con
 CREATE TRIGGER update_user_data_updated_at BEFORE UPDATE ON user_data FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_guild_api_keys_updated_at BEFORE UPDATE ON guild_api_keys FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 """
+
+# Idempotent, so it runs on every startup and also covers databases created before guild_prefixes existed.
+PREFIX_SYNC_SQL = """
+-- Mirror the 'prefix' guild setting into guild_prefixes as plain text
+CREATE OR REPLACE FUNCTION sync_guild_prefix()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        IF OLD.key = 'prefix' THEN
+            DELETE FROM guild_prefixes WHERE guild_id = OLD.guild_id;
+        END IF;
+        RETURN OLD;
+    END IF;
+
+    IF NEW.key = 'prefix' THEN
+        IF NEW.value #>> '{}' IS NULL THEN
+            DELETE FROM guild_prefixes WHERE guild_id = NEW.guild_id;
+        ELSE
+            INSERT INTO guild_prefixes (guild_id, prefix) VALUES (NEW.guild_id, NEW.value #>> '{}')
+            ON CONFLICT (guild_id) DO UPDATE SET prefix = EXCLUDED.prefix;
+        END IF;
+    END IF;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS sync_guild_prefixes ON guild_settings;
+CREATE TRIGGER sync_guild_prefixes AFTER INSERT OR UPDATE OR DELETE ON guild_settings FOR EACH ROW EXECUTE FUNCTION sync_guild_prefix();
+
+-- Backfill prefixes written before the trigger existed
+INSERT INTO guild_prefixes (guild_id, prefix)
+SELECT guild_id, value #>> '{}' FROM guild_settings WHERE key = 'prefix' AND value #>> '{}' IS NOT NULL
+ON CONFLICT (guild_id) DO UPDATE SET prefix = EXCLUDED.prefix;
+"""
@@ -574,15 +574,14 @@ async def get_all_botdetect_config(guild_id: int) -> Dict[str, Any]:
 
 
 async def get_user_data(user_id: int) -> Dict[str, Any]:
-    """Get custom user data."""
-    try:
-        result = await execute_query("SELECT data FROM user_data WHERE user_id = $1", user_id, fetch_one=True)
-        if result and result["data"]:
-            return json.loads(result["data"]) if isinstance(result["data"], str) else result["data"]
-        return {}
-    except Exception as e:
-        log.error(f"Failed to get user data for user {user_id}: {e}")
-        return {}
+    """Get custom user data.
+
+    Query errors propagate, so callers can tell a failed read from a user with no data.
+    """
+    result = await execute_query("SELECT data FROM user_data WHERE user_id = $1", user_id, fetch_one=True)
+    if result and result["data"]:
+        return json.loads(result["data"]) if isinstance(result["data"], str) else result["data"]
+    return {}
 
 
 async def set_user_data(user_id: int, data: Dict[str, Any]) -> bool:
@@ -606,6 +605,21 @@ async def update_user_data_field(user_id: int, field: str, value: Any) -> bool:
         return False
 
 
+async def unset_user_data_field(user_id: int, field: str) -> bool:
+    """Remove a specific field from user data. Returns False if the field wasn't set."""
+    try:
+        result = await execute_query(
+            "UPDATE user_data SET data = data - $2 WHERE user_id = $1 AND data ? $2 RETURNING user_id",
+            user_id,
+            field,
+            fetch_one=True,
+        )
+        return result is not None
+    except Exception as e:
+        log.error(f"Failed to unset user data field {field} for user {user_id}: {e}")
+        return False
+
+
 async def delete_user_data(user_id: int) -> bool:
     """Delete all custom user data."""
     try:
@@ -37,6 +37,7 @@ class Config:
 
         if "Owners" in self._data:
             self.OwnersTuple = tuple(self.Owners.__dict__.values())
+            self.OwnerIds = frozenset(self.OwnersTuple)
 
     def __getattr__(self, name: str) -> Any:
         with self.lock:
@@ -80,7 +81,7 @@ CONFIG_FILE = Path(__file__).parent / "configs" / "config.yaml"
 
 # Global config instance
 config = Config(CONFIG_FILE)
-print(CONFIG_FILE)
+logger.info(f"Loaded config from {CONFIG_FILE}")
 
 # Set up watchdog observer
 observer = Observer()
@@ -0,0 +1,235 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+import discord
+from discord.ext import commands
+from cogs.abtuser import UserInfoCog
+
+
+@pytest.fixture
+def mock_bot():
+    intents = discord.Intents.default()
+    bot = commands.Bot(command_prefix="!", intents=intents)
+    return bot
+
+
+@pytest.fixture
+def cog(mock_bot):
+    # Other test modules replace config.Owners, so don't depend on the real owner IDs here.
+    with patch("cogs.abtuser.config"):
+        return UserInfoCog(mock_bot)
+
+
+def mock_guild(guild_id=456):
+    guild = MagicMock(spec=discord.Guild)
+    guild.id = guild_id
+    return guild
+
+
+def mock_fetched_user(banner_url=None):
+    user = MagicMock()
+    user.banner = MagicMock(url=banner_url) if banner_url else None
+    return user
+
+
+@pytest.mark.asyncio
+async def test_get_banner_url_caches_guild_setting_and_banner(cog):
+    guild = mock_guild()
+    cog.bot.fetch_user = AsyncMock(return_value=mock_fetched_user("https://cdn/banner.png"))
+
+    with patch("cogs.abtuser.get_guild_config", new_callable=AsyncMock, return_value=True) as mock_get_config:
+        assert await cog._get_banner_url(guild, 1) == "https://cdn/banner.png"
+        assert await cog._get_banner_url(guild, 1) == "https://cdn/banner.png"
+
+    mock_get_config.assert_awaited_once_with(456, "ABOUTUSER_SHOW_BANNER", True)
+    cog.bot.fetch_user.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_get_banner_url_skips_setting_for_users_without_banner(cog):
+    cog.bot.fetch_user = AsyncMock(return_value=mock_fetched_user())
+
+    with patch("cogs.abtuser.get_guild_config", new_callable=AsyncMock, return_value=True) as mock_get_config:
+        assert await cog._get_banner_url(mock_guild(1), 2) is None
+        assert await cog._get_banner_url(mock_guild(2), 2) is None
+
+    # The second guild never looks up its setting, since the user is known to have no banner.
+    mock_get_config.assert_awaited_once_with(1, "ABOUTUSER_SHOW_BANNER", True)
+    cog.bot.fetch_user.assert_awaited_once_with(2)
+
+
+@pytest.mark.asyncio
+async def test_get_banner_url_respects_disabled_setting(cog):
+    cog.bot.fetch_user = AsyncMock(return_value=mock_fetched_user("https://cdn/banner.png"))
+
+    with patch("cogs.abtuser.get_guild_config", new_callable=AsyncMock, return_value=False):
+        assert await cog._get_banner_url(mock_guild(), 3) is None
+
+    cog.bot.fetch_user.assert_not_called()
+
+
+# --- Custom user data cache Tests ---
+@pytest.mark.asyncio
+async def test_get_custom_user_data_serves_repeat_reads_from_cache(cog):
+    with patch("cogs.abtuser.get_user_data", new_callable=AsyncMock, return_value={"note": "hi"}) as mock_get:
+        assert await cog.get_custom_user_data(1) == {"note": "hi"}
+        assert await cog.get_custom_user_data(1) == {"note": "hi"}
+
+    mock_get.assert_awaited_once_with(1)
+
+
+@pytest.mark.asyncio
+async def test_get_custom_user_data_concurrent_reads_share_one_query(cog):
+    release = asyncio.Event()
+
+    async def slow_get_user_data(user_id):
+        await release.wait()
+        return {"note": "shared"}
+
+    with patch("cogs.abtuser.get_user_data", side_effect=slow_get_user_data) as mock_get:
+        readers = asyncio.gather(*(cog.get_custom_user_data(1) for _ in range(3)))
+        await asyncio.sleep(0)
+        release.set()
+        results = await readers
+
+    assert results == [{"note": "shared"}] * 3
+    assert mock_get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_custom_user_data_does_not_cache_failed_reads(cog):
+    with patch(
+        "cogs.abtuser.get_user_data", new_callable=AsyncMock, side_effect=[RuntimeError("db down"), {"note": "hi"}]
+    ) as mock_get:
+        with pytest.raises(RuntimeError, match="db down"):
+            await cog.get_custom_user_data(1)
+        assert await cog.get_custom_user_data(1) == {"note": "hi"}
+
+    assert mock_get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_set_custom_user_value_invalidates_cache(cog):
+    with (
+        patch("cogs.abtuser.get_user_data", new_callable=AsyncMock, side_effect=[{}, {"note": "new"}]) as mock_get,
+        patch("cogs.abtuser.update_user_data_field", new_callable=AsyncMock, return_value=True),
+    ):
+        assert await cog.get_custom_user_data(1) == {}
+        assert await cog.set_custom_user_value(1, "note", "new") is True
+        assert await cog.get_custom_user_data(1) == {"note": "new"}
+
+    assert mock_get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_remove_custom_user_value_invalidates_cache(cog):
+    with (
+        patch("cogs.abtuser.get_user_data", new_callable=AsyncMock, side_effect=[{"note": "old"}, {}]) as mock_get,
+        patch("cogs.abtuser.unset_user_data_field", new_callable=AsyncMock, return_value=True) as mock_unset,
+    ):
+        assert await cog.get_custom_user_data(1) == {"note": "old"}
+        assert await cog.remove_custom_user_value(1, "note") is True
+        assert await cog.get_custom_user_data(1) == {}
+
+    mock_unset.assert_awaited_once_with(1, "note")
+    assert mock_get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_clear_custom_values_invalidates_cache(cog):
+    ctx = MagicMock()
+    ctx.reply = AsyncMock()
+    user = MagicMock(spec=discord.Member)
+    user.id = 1
+
+    with (
+        patch("cogs.abtuser.get_user_data", new_callable=AsyncMock, side_effect=[{"note": "old"}, {}]) as mock_get,
+        patch("database.operations.delete_user_data", new_callable=AsyncMock, return_value=True),
+    ):
+        assert await cog.get_custom_user_data(1) == {"note": "old"}
+        await cog.clear_custom_values.callback(cog, ctx, user)
+        assert await cog.get_custom_user_data(1) == {}
+
+    assert mock_get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_write_during_read_keeps_stale_result_out_of_cache(cog):
+    release = asyncio.Event()
+    results = iter([{"note": "old"}, {"note": "new"}])
+
+    async def slow_get_user_data(user_id):
+        await release.wait()
+        return next(results)
+
+    with (
+        patch("cogs.abtuser.get_user_data", side_effect=slow_get_user_data),
+        patch("cogs.abtuser.update_user_data_field", new_callable=AsyncMock, return_value=True),
+    ):
+        in_flight = asyncio.create_task(cog.get_custom_user_data(1))
+        await asyncio.sleep(0)
+        await cog.set_custom_user_value(1, "note", "new")
+        release.set()
+        assert await in_flight == {"note": "old"}
+        assert await cog.get_custom_user_data(1) == {"note": "new"}
+
+
+@pytest.mark.asyncio
+async def test_list_custom_values_reports_failed_read(cog):
+    ctx = MagicMock()
+    ctx.reply = AsyncMock()
+    user = MagicMock(spec=discord.Member)
+    user.id = 1
+
+    with patch("cogs.abtuser.get_user_data", new_callable=AsyncMock, side_effect=RuntimeError("db down")):
+        await cog.list_custom_values.callback(cog, ctx, user)
+
+    ctx.reply.assert_awaited_once_with("❌ Couldn't load notes right now. Please try again later.", ephemeral=True)
+
+
+@pytest.mark.asyncio
+async def test_aboutuser_banner_setting_applies_without_fetching(cog):
+    from cogs.config_cog import ConfigCog
+
+    config_bot = MagicMock()
+    config_bot.get_cog.return_value = cog
+    config_cog = ConfigCog(config_bot)
+    ctx = MagicMock()
+    ctx.interaction = None
+    ctx.send = AsyncMock()
+    ctx.guild.id = 456
+    cog.bot.fetch_user = AsyncMock(return_value=mock_fetched_user("https://cdn/banner.png"))
+
+    with (
+        patch("cogs.abtuser.get_guild_config", new_callable=AsyncMock, side_effect=[True, False]),
+        patch("cogs.config_cog.set_guild_config", new_callable=AsyncMock, return_value=True) as mock_set_config,
+    ):
+        assert await cog._get_banner_url(mock_guild(), 1) == "https://cdn/banner.png"
+        await config_cog.modset_aboutuser_banner.callback(config_cog, ctx, False)
+        assert await cog._get_banner_url(mock_guild(), 1) is None
+
+    mock_set_config.assert_awaited_once_with(456, "ABOUTUSER_SHOW_BANNER", False)
+    config_bot.get_cog.assert_called_once_with("UserInfoCog")
+    cog.bot.fetch_user.assert_awaited_once_with(1)
+
+
+# --- Role list cache Tests ---
+@pytest.mark.asyncio
+async def test_guild_role_changes_drop_that_guilds_role_lists(cog):
+    cog._roles_cache[(1, 10)] = "<@&100>"
+    cog._roles_cache[(1, 11)] = "<@&100>"
+    cog._roles_cache[(2, 10)] = "<@&200>"
+    role = MagicMock(spec=discord.Role)
+    role.guild = mock_guild(1)
+
+    await cog.on_guild_role_delete(role)
+
+    assert dict(cog._roles_cache) == {(2, 10): "<@&200>"}
+
+    cog._roles_cache[(1, 10)] = "<@&101>"
+    other_role = MagicMock(spec=discord.Role)
+    other_role.guild = mock_guild(2)
+
+    await cog.on_guild_role_update(other_role, other_role)
+
+    assert dict(cog._roles_cache) == {(1, 10): "<@&101>"}
@@ -0,0 +1,112 @@
+import os
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+import discord
+
+# The AI helpers build their LiteLLM clients at import time and need a key to do so.
+os.environ.setdefault("SLIPSTREAM_OPENROUTER_KEY", "test-key")
+
+from cogs.ai_channel_config_cog import AIChannelConfigCog  # noqa: E402
+
+
+@pytest.fixture
+def cog():
+    # The channel group hangs off CoreAICog's "ai" group, so skip the command tree setup that needs that cog loaded.
+    cog = object.__new__(AIChannelConfigCog)
+    AIChannelConfigCog.__init__(cog, MagicMock())
+    return cog
+
+
+@pytest.fixture
+def channel():
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.id = 10
+    channel.name = "general"
+    channel.mention = "<#10>"
+    return channel
+
+
+@pytest.fixture
+def mock_ctx(channel):
+    ctx = MagicMock()
+    ctx.interaction = None
+    ctx.send = AsyncMock()
+    ctx.guild.id = 456
+    ctx.guild.get_channel.return_value = channel
+    ctx.channel = channel
+    return ctx
+
+
+def status_field(ctx):
+    embed = ctx.send.call_args.kwargs["embed"]
+    return embed.fields[0].value
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_share_one_snapshot(cog, mock_ctx, channel):
+    with (
+        patch("cogs.ai_channel_config_cog.get_excluded_channels", new=AsyncMock(return_value=[10])) as mock_excluded,
+        patch("cogs.ai_channel_config_cog.get_all_channel_rules", new=AsyncMock(return_value={})) as mock_rules,
+    ):
+        await cog.list_excluded.callback(cog, mock_ctx)
+        await cog.list_all_rules.callback(cog, mock_ctx)
+        await cog.channel_status.callback(cog, mock_ctx, channel)
+
+    mock_excluded.assert_awaited_once_with(456)
+    mock_rules.assert_awaited_once_with(456)
+    assert status_field(mock_ctx) == "❌ Excluded"
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_snapshot(cog, mock_ctx, channel):
+    with (
+        patch(
+            "cogs.ai_channel_config_cog.get_excluded_channels", new=AsyncMock(side_effect=[[], [10]])
+        ) as mock_excluded,
+        patch("cogs.ai_channel_config_cog.get_all_channel_rules", new=AsyncMock(return_value={})),
+        patch("cogs.ai_channel_config_cog.is_channel_excluded", new=AsyncMock(return_value=False)),
+        patch("cogs.ai_channel_config_cog.add_excluded_channel", new=AsyncMock(return_value=True)),
+    ):
+        await cog.channel_status.callback(cog, mock_ctx, channel)
+        assert status_field(mock_ctx) == "✅ Active"
+
+        await cog.exclude_channel.callback(cog, mock_ctx, channel)
+        await cog.channel_status.callback(cog, mock_ctx, channel)
+
+    assert mock_excluded.await_count == 2
+    assert status_field(mock_ctx) == "❌ Excluded"
+
+
+@pytest.mark.asyncio
+async def test_set_rules_invalidates_snapshot(cog, mock_ctx, channel):
+    with (
+        patch("cogs.ai_channel_config_cog.get_excluded_channels", new=AsyncMock(return_value=[])),
+        patch(
+            "cogs.ai_channel_config_cog.get_all_channel_rules", new=AsyncMock(side_effect=[{}, {"10": "Be nice"}])
+        ) as mock_rules,
+        patch("cogs.ai_channel_config_cog.set_channel_rules", new=AsyncMock(return_value=True)),
+    ):
+        await cog.channel_status.callback(cog, mock_ctx, channel)
+        await cog.set_channel_rules.callback(cog, mock_ctx, channel, rules="Be nice")
+        await cog.channel_status.callback(cog, mock_ctx, channel)
+
+    assert mock_rules.await_count == 2
+    embed = mock_ctx.send.call_args.kwargs["embed"]
+    assert embed.fields[2].value == "```Be nice```"
+
+
+@pytest.mark.asyncio
+async def test_list_excluded_renders_channels_in_id_order(cog, mock_ctx):
+    mock_ctx.guild.get_channel.return_value = None
+    with (
+        patch("cogs.ai_channel_config_cog.get_excluded_channels", new=AsyncMock(return_value=[30, 10, 20])),
+        patch("cogs.ai_channel_config_cog.get_all_channel_rules", new=AsyncMock(return_value={})),
+    ):
+        await cog.list_excluded.callback(cog, mock_ctx)
+
+    assert mock_ctx.send.call_args.args[0].splitlines()[1:] == [
+        "<#10> (deleted)",
+        "<#20> (deleted)",
+        "<#30> (deleted)",
+    ]
@@ -7,14 +7,16 @@ from discord.ext.commands import BucketType
 from bot import (
     bot,
     get_prefix,
+    warm_prefix_cache,
     MyBot,
-    DualStream,
+    setup_logging,
     prefix_cache,
     load_cogs,
     send_error_dm,
     catch_exceptions,
     ERROR_NOTIFICATION_USER_ID,
     update_bot_guilds_cache,
+    sync_command_tree,
     update_launch_time_cache,
     prefix_update_listener,
     main,
@@ -25,10 +27,13 @@ from bot import (
     on_guild_join,
     on_guild_remove,
     on_shard_ready,
+    _format_traceback,
+    TRACEBACK_FRAME_LIMIT,
+    register_debug_commands,
 )
 import os
-import io
-import json
+import logging
+import logging.handlers
 import asyncio
 from collections import namedtuple
 from discord import app_commands
@@ -41,6 +46,7 @@ class MockOwners:
 
 
 config.Owners = MockOwners
+config.OwnerIds = frozenset({MockOwners.ILIKEPANCAKES})
 bot.ERROR_NOTIFICATION_CHANNEL_ID = None
 
 
@@ -52,6 +58,12 @@ def clear_prefix_cache():
     prefix_cache.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_error_user():
+    with patch("bot._error_user", None):
+        yield
+
+
 @pytest.fixture
 def mock_bot():
     intents = discord.Intents.default()
@@ -61,6 +73,7 @@ def mock_bot():
     bot._connection = MagicMock()
     bot._connection.user = MagicMock(spec=discord.ClientUser)
     bot.user.id = 9876543210
+    bot.get_user = MagicMock(return_value=None)  # Nothing is in the user cache
     bot.loop = asyncio.get_event_loop()  # Assign an event loop for tasks
     return bot
 
@@ -109,14 +122,14 @@ def temp_cogs_dir(tmp_path):
     """Create a temporary cogs directory for testing."""
     cogs_dir = tmp_path / "cogs"
     cogs_dir.mkdir()
-    original_listdir = os.listdir
+    original_scandir = os.scandir
 
-    def mock_listdir(path):
+    def mock_scandir(path="."):
         if path == "cogs":
-            return [f.name for f in cogs_dir.iterdir()]
-        return original_listdir(path)
+            return original_scandir(cogs_dir)
+        return original_scandir(path)
 
-    with patch("os.listdir", side_effect=mock_listdir):
+    with patch("os.scandir", side_effect=mock_scandir):
         yield cogs_dir
 
 
@@ -131,7 +144,7 @@ def mock_user(user_id, is_owner_val=False):
 # --- MyBot.is_owner Tests ---
 @pytest.mark.asyncio
 async def test_is_owner_true(mock_bot):
-    owner_id = list(config.Owners.__dict__.values())[0]  # Get one of the owner IDs
+    owner_id = MockOwners.ILIKEPANCAKES
     user = mock_user(owner_id)
     assert await mock_bot.is_owner(user) is True
 
@@ -156,29 +169,40 @@ async def test_is_owner_user_no_id(mock_bot):
         await mock_bot.is_owner(user)
 
 
-# --- DualStream Tests ---
-def test_dualstream_write():
-    mock_original_stream = MagicMock(spec=io.StringIO)
-    mock_log_file = MagicMock(spec=io.StringIO)
-    stream = DualStream(mock_original_stream, mock_log_file)
-
-    test_data = "Hello, world!"
-    stream.write(test_data)
+# --- Logging Tests ---
+def test_setup_logging_routes_records_through_queue(tmp_path):
+    log_path = tmp_path / "bot.log"
+    root_logger = logging.getLogger()
+    original_handlers, original_level = root_logger.handlers[:], root_logger.level
+    with patch("bot.LOG_FILE", str(log_path)):
+        listener = setup_logging()
+    try:
+        assert [type(handler) for handler in root_logger.handlers] == [logging.handlers.QueueHandler]
+        assert any(isinstance(handler, logging.handlers.RotatingFileHandler) for handler in listener.handlers)
+        logging.getLogger("test").warning("written to file")
+    finally:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        root_logger.handlers[:] = original_handlers
+        root_logger.setLevel(original_level)
 
-    mock_original_stream.write.assert_called_once_with(test_data)
-    mock_log_file.write.assert_called_once_with(test_data)
-    mock_log_file.flush.assert_called_once()
+    assert "WARNING test: written to file" in log_path.read_text()
 
 
-def test_dualstream_flush():
-    mock_original_stream = MagicMock(spec=io.StringIO)
-    mock_log_file = MagicMock(spec=io.StringIO)
-    stream = DualStream(mock_original_stream, mock_log_file)
+def test_format_traceback_keeps_innermost_frames():
+    def recurse(depth):
+        if depth == 0:
+            raise ValueError("deep failure")
+        recurse(depth - 1)
 
-    stream.flush()
+    try:
+        recurse(TRACEBACK_FRAME_LIMIT * 2)
+    except ValueError as e:
+        tb_string = _format_traceback(type(e), e, e.__traceback__)
 
-    mock_original_stream.flush.assert_called_once()
-    mock_log_file.flush.assert_called_once()
+    assert 'raise ValueError("deep failure")' in tb_string
+    assert "test_format_traceback_keeps_innermost_frames" not in tb_string
 
 
 # --- get_prefix Tests (from original file, kept for completeness) ---
@@ -190,17 +214,16 @@ async def test_get_prefix_from_db(mock_bot):
     mock_message.guild.name = "Test Guild"
 
     with patch("bot.get_pool", new_callable=AsyncMock) as mock_get_pool:
-        mock_conn = AsyncMock()
-        mock_conn.fetchval.return_value = json.dumps("test!")  # Ensure JSON string
         mock_pool = MagicMock()
-        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        # guild_prefixes holds the prefix as plain text, already unwrapped from the JSONB setting
+        mock_pool.fetch = AsyncMock(return_value=[{"guild_id": 12345, "prefix": "test!"}])
         mock_get_pool.return_value = mock_pool
 
         prefix = await get_prefix(mock_bot, mock_message)
         assert prefix == "test!"
-        mock_conn.fetchval.assert_called_once_with(
-            "SELECT value FROM guild_settings WHERE guild_id = $1 AND key = 'prefix'",
-            12345,
+        mock_pool.fetch.assert_called_once_with(
+            "SELECT guild_id, prefix FROM guild_prefixes WHERE guild_id = ANY($1::bigint[])",
+            [12345],
         )
         assert prefix_cache[12345] == "test!"
 
@@ -213,17 +236,15 @@ async def test_get_prefix_default(mock_bot):
     mock_message.guild.name = "Another Test Guild"
 
     with patch("bot.get_pool", new_callable=AsyncMock) as mock_get_pool:
-        mock_conn = AsyncMock()
-        mock_conn.fetchval.return_value = None
         mock_pool = MagicMock()
-        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        mock_pool.fetch = AsyncMock(return_value=[])
         mock_get_pool.return_value = mock_pool
 
         prefix = await get_prefix(mock_bot, mock_message)
         assert prefix == "o!"
-        mock_conn.fetchval.assert_called_once_with(
-            "SELECT value FROM guild_settings WHERE guild_id = $1 AND key = 'prefix'",
-            67890,
+        mock_pool.fetch.assert_called_once_with(
+            "SELECT guild_id, prefix FROM guild_prefixes WHERE guild_id = ANY($1::bigint[])",
+            [67890],
         )
         assert prefix_cache[67890] == "o!"
 
@@ -236,10 +257,8 @@ async def test_get_prefix_caching(mock_bot):
     mock_message.guild.name = "Cached Guild"
 
     with patch("bot.get_pool", new_callable=AsyncMock) as mock_get_pool:
-        mock_conn = AsyncMock()
-        mock_conn.fetchval.return_value = json.dumps("cached!")
         mock_pool = MagicMock()
-        mock_pool.acquire.return_value.__aenter__.return_value = mock_conn
+        mock_pool.fetch = AsyncMock(return_value=[{"guild_id": 112233, "prefix": "cached!"}])
         mock_get_pool.return_value = mock_pool
 
         # First call, should hit DB and cache
@@ -277,6 +296,101 @@ async def test_get_prefix_no_pool(mock_bot):
         assert 98765 not in prefix_cache  # Should not cache if pool is None
 
 
+@pytest.mark.asyncio
+async def test_get_prefix_coalesces_concurrent_misses(mock_bot):
+    messages = []
+    for guild_id in (501, 502, 503):
+        message = MagicMock()
+        message.guild = MagicMock()
+        message.guild.id = guild_id
+        messages.append(message)
+    messages.append(messages[0])  # Duplicate lookup for the same guild
+
+    with patch("bot.get_pool", new_callable=AsyncMock) as mock_get_pool:
+        mock_pool = MagicMock()
+        mock_pool.fetch = AsyncMock(
+            return_value=[
+                {"guild_id": 501, "prefix": "a!"},
+                {"guild_id": 503, "prefix": "c!"},
+            ]
+        )
+        mock_get_pool.return_value = mock_pool
+
+        prefixes = await asyncio.gather(*(get_prefix(mock_bot, m) for m in messages))
+
+        assert prefixes == ["a!", "o!", "c!", "a!"]
+        mock_pool.fetch.assert_called_once()
+        assert sorted(mock_pool.fetch.call_args.args[1]) == [501, 502, 503]
+        assert prefix_cache[502] == "o!"
+
+
+@pytest.mark.asyncio
+async def test_get_prefix_miss_during_flush_gets_its_own_batch(mock_bot):
+    first, second = MagicMock(), MagicMock()
+    first.guild.id = 601
+    second.guild.id = 602
+    fetch_started = asyncio.Event()
+    release_fetch = asyncio.Event()
+
+    async def fetch(query, guild_ids):
+        if guild_ids == [601]:
+            fetch_started.set()
+            await release_fetch.wait()
+            return [{"guild_id": 601, "prefix": "a!"}]
+        return [{"guild_id": 602, "prefix": "b!"}]
+
+    with patch("bot.get_pool", new_callable=AsyncMock) as mock_get_pool:
+        mock_pool = MagicMock()
+        mock_pool.fetch = AsyncMock(side_effect=fetch)
+        mock_get_pool.return_value = mock_pool
+
+        first_lookup = asyncio.create_task(get_prefix(mock_bot, first))
+        await fetch_started.wait()
+        # This miss arrives while the first flush is still waiting on the database.
+        second_lookup = asyncio.create_task(get_prefix(mock_bot, second))
+        await asyncio.sleep(0)
+        release_fetch.set()
+
+        prefixes = await asyncio.wait_for(asyncio.gather(first_lookup, second_lookup), timeout=1)
+
+        assert prefixes == ["a!", "b!"]
+        assert mock_pool.fetch.await_count == 2
+        assert prefix_cache[602] == "b!"
+
+
+@pytest.mark.asyncio
+async def test_get_prefix_flush_error_fails_waiters(mock_bot):
+    message = MagicMock()
+    message.guild.id = 611
+
+    with patch("bot.get_pool", new_callable=AsyncMock) as mock_get_pool:
+        mock_pool = MagicMock()
+        mock_pool.fetch = AsyncMock(side_effect=RuntimeError("db down"))
+        mock_get_pool.return_value = mock_pool
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await asyncio.wait_for(get_prefix(mock_bot, message), timeout=1)
+        assert 611 not in prefix_cache
+
+
+@pytest.mark.asyncio
+async def test_warm_prefix_cache(mock_bot):
+    with (
+        patch.object(type(mock_bot), "guilds", [MagicMock(id=701), MagicMock(id=702)]),
+        patch("bot.bot", new=mock_bot),
+        patch("bot.get_pool", new_callable=AsyncMock) as mock_get_pool,
+    ):
+        mock_pool = MagicMock()
+        mock_pool.fetch = AsyncMock(return_value=[{"guild_id": 701, "prefix": "w!"}])
+        mock_get_pool.return_value = mock_pool
+
+        await warm_prefix_cache()
+
+        mock_pool.fetch.assert_called_once()
+        assert prefix_cache[701] == "w!"
+        assert prefix_cache[702] == "o!"  # Default-prefix guilds are cached too
+
+
 # --- prefix_update_listener Tests ---
 @pytest.mark.asyncio
 async def test_prefix_update_listener_updates_cache():
@@ -288,10 +402,10 @@ async def test_prefix_update_listener_updates_cache():
     async def get_message_mock(ignore_subscribe_messages, timeout):
         if get_message_mock.call_count == 0:
             get_message_mock.call_count += 1
-            return {"type": "message", "data": b'123: "new_prefix!"'}
+            return {"type": "message", "data": b"123:new_prefix!"}
         elif get_message_mock.call_count == 1:
             get_message_mock.call_count += 1
-            return {"type": "message", "data": b'456: "another_prefix?"'}
+            return {"type": "message", "data": b"456:another_prefix?"}
         else:
             raise asyncio.CancelledError  # To stop the loop
 
@@ -300,7 +414,7 @@ async def test_prefix_update_listener_updates_cache():
 
     with (
         patch("bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis),
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
     ):
         # We create a task for the listener and then cancel it to stop the infinite loop
         listener_task = asyncio.create_task(prefix_update_listener())
@@ -316,20 +430,23 @@ async def test_prefix_update_listener_updates_cache():
             pass  # Expected cancellation
 
         mock_pubsub.subscribe.assert_called_once_with("prefix_updates")
+        mock_pubsub.unsubscribe.assert_awaited_once_with("prefix_updates")
+        for call_args in mock_pubsub.get_message.call_args_list:
+            assert call_args.kwargs["timeout"] is None
         assert prefix_cache[123] == "new_prefix!"
         assert prefix_cache[456] == "another_prefix?"
-        mock_print.assert_any_call("Updated prefix for guild 123 to 'new_prefix!'")
-        mock_print.assert_any_call("Updated prefix for guild 456 to 'another_prefix?'")
+        mock_log.info.assert_any_call("Updated prefix for guild 123 to 'new_prefix!'")
+        mock_log.info.assert_any_call("Updated prefix for guild 456 to 'another_prefix?'")
 
 
 @pytest.mark.asyncio
 async def test_prefix_update_listener_no_redis():
     with (
         patch("bot.get_redis_client", new_callable=AsyncMock, return_value=None) as mock_get_redis_client,
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
     ):
         await prefix_update_listener()
-        mock_print.assert_called_once_with("Redis not available, prefix update listener will not run.")
+        mock_log.warning.assert_called_once_with("Redis not available, prefix update listener will not run.")
         mock_get_redis_client.assert_called_once()
 
 
@@ -343,7 +460,7 @@ async def test_prefix_update_listener_handles_error():
     async def get_message_error_mock(ignore_subscribe_messages, timeout):
         if get_message_error_mock.call_count == 0:
             get_message_error_mock.call_count += 1
-            return {"type": "message", "data": b'123: "new_prefix!"'}
+            return {"type": "message", "data": b"123:new_prefix!"}
         elif get_message_error_mock.call_count == 1:
             get_message_error_mock.call_count += 1
             raise Exception("Simulated pubsub error")
@@ -355,7 +472,7 @@ async def test_prefix_update_listener_handles_error():
 
     with (
         patch("bot.get_redis_client", new_callable=AsyncMock, return_value=mock_redis),
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
     ):
         listener_task = asyncio.create_task(prefix_update_listener())
 
@@ -365,7 +482,7 @@ async def test_prefix_update_listener_handles_error():
         except (asyncio.TimeoutError, asyncio.CancelledError):
             pass  # Task is expected to be cancelled or finish
 
-        mock_print.assert_any_call("Error in prefix_update_listener: Simulated pubsub error")
+        mock_log.error.assert_any_call("Error in prefix_update_listener: Simulated pubsub error")
         assert prefix_cache[123] == "new_prefix!"
 
 
@@ -394,16 +511,46 @@ async def test_send_error_dm_success(mock_bot):
     mock_user_obj.send.assert_called_once_with(expected_content)
 
 
+@pytest.mark.asyncio
+async def test_send_error_dm_reuses_fetched_user(mock_bot):
+    mock_user_obj = AsyncMock(spec=discord.User)
+    mock_bot.fetch_user = AsyncMock(return_value=mock_user_obj)
+
+    with patch("bot.ERROR_NOTIFICATION_CHANNEL_ID", None):
+        await send_error_dm(mock_bot, "TypeA", "first")
+        await send_error_dm(mock_bot, "TypeB", "second")
+
+    mock_bot.fetch_user.assert_awaited_once_with(ERROR_NOTIFICATION_USER_ID)
+    assert mock_user_obj.send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_error_dm_concurrent_errors_fetch_user_once(mock_bot):
+    mock_user_obj = AsyncMock(spec=discord.User)
+
+    async def slow_fetch_user(user_id):
+        await asyncio.sleep(0.01)
+        return mock_user_obj
+
+    mock_bot.fetch_user = AsyncMock(side_effect=slow_fetch_user)
+
+    with patch("bot.ERROR_NOTIFICATION_CHANNEL_ID", None):
+        await asyncio.gather(*(send_error_dm(mock_bot, "Type", f"error {i}") for i in range(5)))
+
+    mock_bot.fetch_user.assert_awaited_once_with(ERROR_NOTIFICATION_USER_ID)
+    assert mock_user_obj.send.await_count == 5
+
+
 @pytest.mark.asyncio
 async def test_send_error_dm_no_user(mock_bot):
     mock_bot.fetch_user = AsyncMock(return_value=None)  # Simulate user not found
 
-    with patch("bot.ERROR_NOTIFICATION_CHANNEL_ID", None), patch("builtins.print") as mock_print:
+    with patch("bot.ERROR_NOTIFICATION_CHANNEL_ID", None), patch("bot.log") as mock_log:
         await send_error_dm(mock_bot, "Type", "Message")
 
     mock_bot.fetch_user.assert_called_once_with(ERROR_NOTIFICATION_USER_ID)
-    mock_print.assert_called_once()
-    assert "Could not find user with ID" in mock_print.call_args[0][0]
+    mock_log.warning.assert_called_once()
+    assert "Could not find user with ID" in mock_log.warning.call_args[0][0]
 
 
 @pytest.mark.asyncio
@@ -429,11 +576,11 @@ async def test_send_error_dm_handles_dm_error(mock_bot):
     mock_user_obj.send.side_effect = Exception("DM send error")
     mock_bot.fetch_user = AsyncMock(return_value=mock_user_obj)
 
-    with patch("bot.bot", new=mock_bot), patch("builtins.print") as mock_print:
+    with patch("bot.bot", new=mock_bot), patch("bot.log") as mock_log:
         await send_error_dm(mock_bot, "Type", "Message")
 
-    mock_print.assert_called_once()
-    assert "Failed to send error DM" in mock_print.call_args[0][0]
+    mock_log.error.assert_called_once()
+    assert "Failed to send error DM" in mock_log.error.call_args[0][0]
 
 
 @pytest.mark.asyncio
@@ -565,20 +712,20 @@ async def test_load_cogs_success(mock_bot, temp_cogs_dir):
     # Create dummy cog files in the temporary directory
     (temp_cogs_dir / "test_cog1.py").write_text("# dummy cog")
     (temp_cogs_dir / "test_cog2.py").write_text("# dummy cog")
-    (temp_cogs_dir / "aimod.py").write_text("# excluded cog")
+    (temp_cogs_dir / "ban_appeal_cog.py").write_text("# excluded cog")
     (temp_cogs_dir / "_ignored.py").write_text("# ignored cog")
 
     with (
         patch("bot.bot", new=mock_bot),
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
         patch("bot.send_error_dm", new=AsyncMock()) as mock_send_error_dm,
     ):
         await load_cogs()
 
         mock_bot.load_extension.assert_has_calls([call("cogs.test_cog1"), call("cogs.test_cog2")], any_order=True)
         assert mock_bot.load_extension.call_count == 2
-        mock_print.assert_any_call("Loaded cog: test_cog1")
-        mock_print.assert_any_call("Loaded cog: test_cog2")
+        mock_log.info.assert_any_call("Loaded cog: test_cog1")
+        mock_log.info.assert_any_call("Loaded cog: test_cog2")
         mock_send_error_dm.assert_not_called()
 
 
@@ -590,13 +737,13 @@ async def test_load_cogs_failure(mock_bot, temp_cogs_dir):
 
     with (
         patch("bot.bot", new=mock_bot),
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
         patch("bot.send_error_dm", new=AsyncMock()) as mock_send_error_dm,
     ):
         await load_cogs()
 
         mock_bot.load_extension.assert_called_once_with("cogs.failing_cog")
-        mock_print.assert_any_call("Failed to load cog failing_cog: Load error")
+        mock_log.error.assert_any_call("Failed to load cog failing_cog: Load error")
         mock_send_error_dm.assert_called_once()
         sent_args, sent_kwargs = mock_send_error_dm.call_args
         assert sent_kwargs["error_type"] == "Exception"
@@ -612,13 +759,13 @@ async def test_load_cogs_send_error_dm_failure(mock_bot, temp_cogs_dir):
 
     with (
         patch("bot.bot", new=mock_bot),
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
         patch("bot.send_error_dm", new=AsyncMock(side_effect=Exception("DM error"))) as mock_send_error_dm,
     ):
         await load_cogs()
 
         mock_send_error_dm.assert_called_once()
-        mock_print.assert_any_call("Failed to send error DM for cog loading error: DM error")
+        mock_log.error.assert_any_call("Failed to send error DM for cog loading error: DM error")
 
 
 @pytest.mark.asyncio
@@ -634,7 +781,7 @@ async def test_load_cogs_skips_config_cog(mock_bot, temp_cogs_dir):
 
     with (
         patch("bot.bot", new=mock_bot),
-        patch("builtins.print"),
+        patch("bot.log"),
         patch("bot.send_error_dm", new=AsyncMock()),
     ):
         await load_cogs()
@@ -656,7 +803,7 @@ async def test_load_cogs_skips_dashboard_cog(mock_bot, temp_cogs_dir):
 
     with (
         patch("bot.bot", new=mock_bot),
-        patch("builtins.print"),
+        patch("bot.log"),
         patch("bot.send_error_dm", new=AsyncMock()),
     ):
         await load_cogs()
@@ -675,14 +822,13 @@ async def test_on_error_sends_dm(mock_bot):
         patch("bot.send_error_dm", new=mock_send_error_dm),
         patch("sys.exc_info", new=mock_sys_exc_info),
         patch("traceback.format_exception", new=mock_traceback_format_exception),
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
     ):
         # We need to patch the global bot object for the event handler to use it
         with patch("bot.bot", new=mock_bot):
             await on_error("on_message", "arg1", kwarg1="val1")
 
-        mock_print.assert_any_call("Error in event on_message:")
-        mock_print.assert_any_call("Event Traceback\n")
+        mock_log.error.assert_any_call("Error in event on_message:\nEvent Traceback\n")
         mock_send_error_dm.assert_called_once()
         sent_args, sent_kwargs = mock_send_error_dm.call_args
         assert sent_kwargs["error_type"] == "ValueError"
@@ -755,7 +901,7 @@ async def test_on_command_error_handles_known_errors(
     mock_bot, mock_context, error_type, user_message_part, should_notify
 ):
     mock_send_error_dm = AsyncMock()
-    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("builtins.print") as mock_print:
+    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("bot.log") as mock_log:
         await on_command_error(mock_context, error_type)
 
         mock_context.send.assert_called_once()
@@ -774,15 +920,15 @@ async def test_on_command_error_handles_known_errors(
 
 @pytest.mark.asyncio
 async def test_on_command_error_send_message_failure(mock_bot, mock_context):
-    mock_context.send.side_effect = Exception("Send message error")
+    mock_context.send.side_effect = discord.HTTPException(MagicMock(status=500), "Send message error")
     mock_send_error_dm = AsyncMock()
 
-    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("builtins.print") as mock_print:
+    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("bot.log") as mock_log:
         await on_command_error(mock_context, commands.CommandNotFound("test"))
 
         mock_context.send.assert_called_once()
         # No error should be re-raised, just print
-        mock_print.assert_not_called()  # send_error_dm is not called for CommandNotFound
+        mock_log.error.assert_not_called()  # send_error_dm is not called for CommandNotFound
 
 
 @pytest.mark.asyncio
@@ -791,7 +937,7 @@ async def test_on_command_error_original_error(mock_bot, mock_context):
     error_with_original = commands.CommandInvokeError(original_error)
 
     mock_send_error_dm = AsyncMock()
-    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("builtins.print") as mock_print:
+    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("bot.log") as mock_log:
         await on_command_error(mock_context, error_with_original)
 
         mock_context.send.assert_called_once()
@@ -869,7 +1015,7 @@ async def test_on_app_command_error_handles_known_errors(
     mock_bot, mock_interaction, error_type, user_message_part, should_notify
 ):
     mock_send_error_dm = AsyncMock()
-    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("builtins.print") as mock_print:
+    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("bot.log") as mock_log:
         # We need to patch the global bot object for the event handler to use it
         with patch("bot.bot", new=mock_bot):
             await on_app_command_error(mock_interaction, error_type)
@@ -893,7 +1039,7 @@ async def test_on_app_command_error_already_responded(mock_bot, mock_interaction
     mock_interaction.response.is_done.return_value = True  # Simulate response already done
     mock_send_error_dm = AsyncMock()
 
-    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("builtins.print") as mock_print:
+    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("bot.log") as mock_log:
         with patch("bot.bot", new=mock_bot):
             await on_app_command_error(mock_interaction, app_commands.CheckFailure("check failed"))
 
@@ -905,16 +1051,18 @@ async def test_on_app_command_error_already_responded(mock_bot, mock_interaction
 
 @pytest.mark.asyncio
 async def test_on_app_command_error_send_message_failure(mock_bot, mock_interaction):
-    mock_interaction.response.send_message.side_effect = Exception("Send message error")
+    mock_interaction.response.send_message.side_effect = discord.HTTPException(
+        MagicMock(status=500), "Send message error"
+    )
     mock_send_error_dm = AsyncMock()
 
-    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("builtins.print") as mock_print:
+    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("bot.log") as mock_log:
         with patch("bot.bot", new=mock_bot):
             await on_app_command_error(mock_interaction, app_commands.CommandNotFound("test", parents=[]))
 
         mock_interaction.response.send_message.assert_called_once()
         # No error should be re-raised, just print
-        mock_print.assert_not_called()  # send_error_dm is not called for CommandNotFound
+        mock_log.error.assert_not_called()  # send_error_dm is not called for CommandNotFound
 
 
 @pytest.mark.asyncio
@@ -923,7 +1071,7 @@ async def test_on_app_command_error_original_error(mock_bot, mock_interaction):
     error_with_original = app_commands.AppCommandError(original_error)
 
     mock_send_error_dm = AsyncMock()
-    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("builtins.print") as mock_print:
+    with patch("bot.send_error_dm", new=mock_send_error_dm), patch("bot.log") as mock_log:
         with patch("bot.bot", new=mock_bot):
             await on_app_command_error(mock_interaction, error_with_original)
 
@@ -945,18 +1093,20 @@ async def test_on_ready_success(mock_bot):
     with (
         patch.object(type(mock_bot), "guilds", [MagicMock(id=1), MagicMock(id=2)]),
         patch("bot.bot", new=mock_bot),
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
         patch("bot.send_error_dm", new=AsyncMock()) as mock_send_error_dm,
         patch("bot.update_bot_guilds_cache", new=AsyncMock()) as mock_update_guilds,
         patch("bot.update_launch_time_cache", new=AsyncMock()) as mock_update_launch_time,
+        patch("bot.warm_prefix_cache", new=AsyncMock()) as mock_warm_prefixes,
     ):
         await on_ready()
 
         mock_bot.tree.sync.assert_called_once()
-        mock_print.assert_any_call("Commands synced successfully!")
-        mock_print.assert_any_call(f"Logged in as {mock_bot.user}")
+        mock_log.info.assert_any_call("Commands synced successfully!")
+        mock_log.info.assert_any_call(f"Logged in as {mock_bot.user}")
         mock_update_guilds.assert_called_once()
         mock_update_launch_time.assert_called_once()
+        mock_warm_prefixes.assert_awaited_once()
         # mock_create_task.assert_called_once() # This is now handled by the global fixture
         mock_send_error_dm.assert_not_called()
 
@@ -969,17 +1119,18 @@ async def test_on_ready_sync_failure(mock_bot):
     with (
         patch.object(type(mock_bot), "guilds", []),
         patch("bot.bot", new=mock_bot),
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
         patch("bot.send_error_dm", new=AsyncMock()) as mock_send_error_dm,
         patch("bot.update_bot_guilds_cache", new=AsyncMock()),
         patch("bot.update_launch_time_cache", new=AsyncMock()),
+        patch("bot.warm_prefix_cache", new=AsyncMock()),
     ):
         # patch('bot.bot.loop.create_task') as mock_create_task: # This is now handled by the global fixture
 
         await on_ready()
 
         mock_bot.tree.sync.assert_called_once()
-        mock_print.assert_any_call("Failed to sync commands: Sync error")
+        mock_log.error.assert_any_call("Failed to sync commands: Sync error")
         mock_send_error_dm.assert_called_once()
         sent_args, sent_kwargs = mock_send_error_dm.call_args
         assert sent_kwargs["error_type"] == "Exception"
@@ -988,21 +1139,138 @@ async def test_on_ready_sync_failure(mock_bot):
         # mock_create_task.assert_called_once() # This is now handled by the global fixture
 
 
+@pytest.mark.asyncio
+async def test_on_ready_reconnect_skips_startup_work(mock_bot):
+    mock_bot.tree.sync = AsyncMock()
+    mock_bot._ready_once = True
+
+    with (
+        patch("bot.bot", new=mock_bot),
+        patch("bot.log"),
+        patch("bot.update_bot_guilds_cache", new=AsyncMock()) as mock_update_guilds,
+        patch("bot.update_all_guild_member_caches", new=AsyncMock()) as mock_update_members,
+        patch("bot.update_launch_time_cache", new=AsyncMock()) as mock_update_launch_time,
+        patch("bot.warm_prefix_cache", new=AsyncMock()) as mock_warm_prefixes,
+        patch("bot.prefix_update_listener") as mock_listener,
+    ):
+        await on_ready()
+
+        mock_bot.tree.sync.assert_not_called()
+        mock_update_guilds.assert_awaited_once()
+        mock_update_members.assert_awaited_once()
+        mock_update_launch_time.assert_not_called()
+        mock_warm_prefixes.assert_not_called()
+        mock_listener.assert_not_called()
+
+
+# --- sync_command_tree Tests ---
+@pytest.mark.asyncio
+async def test_sync_command_tree_syncs_and_stores_hash(mock_bot):
+    mock_bot.tree.sync = AsyncMock()
+    redis_mock = AsyncMock()
+    redis_mock.get.return_value = None
+
+    with (
+        patch("bot.bot", new=mock_bot),
+        patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)),
+        patch("bot.log") as mock_log,
+    ):
+        await sync_command_tree()
+
+        mock_bot.tree.sync.assert_awaited_once()
+        redis_mock.set.assert_awaited_once()
+        mock_log.info.assert_called_once_with("Commands synced successfully!")
+
+
+@pytest.mark.asyncio
+async def test_sync_command_tree_skips_unchanged_tree(mock_bot):
+    mock_bot.tree.sync = AsyncMock()
+    redis_mock = AsyncMock()
+    redis_mock.get.return_value = None
+
+    with (
+        patch("bot.bot", new=mock_bot),
+        patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)),
+        patch("bot.log") as mock_log,
+    ):
+        await sync_command_tree()
+        stored_hash = redis_mock.set.call_args.args[1]
+        redis_mock.get.return_value = stored_hash.encode()
+        mock_bot.tree.sync.reset_mock()
+
+        await sync_command_tree()
+
+        mock_bot.tree.sync.assert_not_awaited()
+        mock_log.info.assert_called_with("Command tree unchanged, skipping sync.")
+
+
+@pytest.mark.asyncio
+async def test_sync_command_tree_hash_ignores_registration_order(mock_bot):
+    mock_bot.tree.sync = AsyncMock()
+
+    async def callback(interaction: discord.Interaction):
+        pass
+
+    commands_in_order = [
+        app_commands.Command(name=name, description=name, callback=callback) for name in ("alpha", "beta")
+    ]
+    redis_mock = AsyncMock()
+    redis_mock.get.return_value = None
+
+    with (
+        patch("bot.bot", new=mock_bot),
+        patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)),
+        patch("bot.log"),
+    ):
+        hashes = []
+        for order in (commands_in_order, commands_in_order[::-1]):
+            with patch.object(mock_bot.tree, "get_commands", return_value=order):
+                await sync_command_tree()
+            hashes.append(redis_mock.set.call_args.args[1])
+
+    assert hashes[0] == hashes[1]
+
+
 # --- update_bot_guilds_cache Tests ---
 @pytest.mark.asyncio
 async def test_update_bot_guilds_cache(mock_bot):
-    mock_set_cache = AsyncMock()
+    redis_mock = MagicMock()
+    pipe_mock = MagicMock()
+    pipe_mock.execute = AsyncMock()
+    redis_mock.pipeline.return_value = pipe_mock
 
     with (
         patch.object(type(mock_bot), "guilds", [MagicMock(id=123), MagicMock(id=456)]),
         patch("bot.bot", new=mock_bot),
-        patch("bot.set_cache", new=mock_set_cache),
-        patch("builtins.print") as mock_print,
+        patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)),
+        patch("bot.log") as mock_log,
+    ):
+        await update_bot_guilds_cache()
+
+        pipe_mock.delete.assert_called_once_with("bot_guilds")
+        pipe_mock.sadd.assert_called_once_with("bot_guilds", 123, 456)
+        pipe_mock.execute.assert_awaited_once()
+        mock_log.info.assert_called_once_with("Updated bot guilds cache.")
+
+
+@pytest.mark.asyncio
+async def test_update_bot_guilds_cache_batches_sadd(mock_bot):
+    redis_mock = MagicMock()
+    pipe_mock = MagicMock()
+    pipe_mock.execute = AsyncMock()
+    redis_mock.pipeline.return_value = pipe_mock
+
+    with (
+        patch.object(type(mock_bot), "guilds", [MagicMock(id=i) for i in (1, 2, 3)]),
+        patch("bot.bot", new=mock_bot),
+        patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)),
+        patch("bot.REDIS_SADD_BATCH_SIZE", 2),
+        patch("bot.log"),
     ):
         await update_bot_guilds_cache()
 
-        mock_set_cache.assert_called_once_with("bot_guilds", [123, 456])
-        mock_print.assert_called_once_with("Updated bot guilds cache.")
+        pipe_mock.sadd.assert_has_calls([call("bot_guilds", 1, 2), call("bot_guilds", 3)])
+        pipe_mock.execute.assert_awaited_once()
 
 
 # --- update_launch_time_cache Tests ---
@@ -1014,12 +1282,12 @@ async def test_update_launch_time_cache(mock_bot):
     with (
         patch("bot.bot", new=mock_bot),
         patch("bot.set_cache", new=mock_set_cache),
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
     ):
         await update_launch_time_cache()
 
         mock_set_cache.assert_called_once_with("bot_launch_time", mock_bot.launch_time.timestamp())
-        mock_print.assert_called_once_with("Updated bot launch time cache.")
+        mock_log.info.assert_called_once_with("Updated bot launch time cache.")
 
 
 # --- on_guild_join Tests ---
@@ -1028,17 +1296,19 @@ async def test_on_guild_join(mock_bot):
     mock_guild = MagicMock(spec=discord.Guild)
     mock_guild.name = "New Guild"
     mock_guild.id = 789
-    mock_update_bot_guilds_cache = AsyncMock()
+    redis_mock = AsyncMock()
 
     with (
         patch("bot.bot", new=mock_bot),
-        patch("bot.update_bot_guilds_cache", new=AsyncMock()) as mock_update_bot_guilds_cache,
-        patch("builtins.print") as mock_print,
+        patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)),
+        patch("bot.update_guild_member_cache", new=AsyncMock()) as mock_update_member_cache,
+        patch("bot.log") as mock_log,
     ):
         await on_guild_join(mock_guild)
 
-        mock_print.assert_any_call(f"Joined guild: {mock_guild.name} ({mock_guild.id})")
-        mock_update_bot_guilds_cache.assert_called_once()
+        mock_log.info.assert_any_call(f"Joined guild: {mock_guild.name} ({mock_guild.id})")
+        redis_mock.sadd.assert_awaited_once_with("bot_guilds", 789)
+        mock_update_member_cache.assert_awaited_once_with(mock_guild)
 
 
 # --- on_guild_remove Tests ---
@@ -1047,26 +1317,27 @@ async def test_on_guild_remove(mock_bot):
     mock_guild = MagicMock(spec=discord.Guild)
     mock_guild.name = "Removed Guild"
     mock_guild.id = 1011
-    mock_update_bot_guilds_cache = AsyncMock()
+    redis_mock = AsyncMock()
 
     with (
         patch("bot.bot", new=mock_bot),
-        patch("bot.update_bot_guilds_cache", new=mock_update_bot_guilds_cache),
-        patch("builtins.print") as mock_print,
+        patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)),
+        patch("bot.log") as mock_log,
     ):
         await on_guild_remove(mock_guild)
 
-        mock_print.assert_any_call(f"Removed from guild: {mock_guild.name} ({mock_guild.id})")
-        mock_update_bot_guilds_cache.assert_called_once()
+        mock_log.info.assert_any_call(f"Removed from guild: {mock_guild.name} ({mock_guild.id})")
+        redis_mock.srem.assert_awaited_once_with("bot_guilds", 1011)
+        redis_mock.delete.assert_awaited_once_with("guild:1011:members")
 
 
 # --- on_shard_ready Tests ---
 @pytest.mark.asyncio
 async def test_on_shard_ready(mock_bot):
     shard_id = 0
-    with patch("builtins.print") as mock_print:
+    with patch("bot.log") as mock_log:
         await on_shard_ready(shard_id)
-        mock_print.assert_called_once_with(f"Shard {shard_id} is ready.")
+        mock_log.info.assert_called_once_with(f"Shard {shard_id} is ready.")
 
 
 # --- test_error command Tests ---
@@ -1137,10 +1408,11 @@ async def test_main_success():
     with (
         patch("bot.initialize_database", new_callable=AsyncMock, return_value=True) as mock_init_db,
         patch("bot.load_cogs", new_callable=AsyncMock) as mock_load_cogs,
-        patch("bot.bot.start", new_callable=AsyncMock) as mock_bot_start,
+        patch("bot.bot.login", new_callable=AsyncMock) as mock_bot_login,
+        patch("bot.bot.connect", new_callable=AsyncMock) as mock_bot_connect,
         patch("bot.close_pool", new_callable=AsyncMock) as mock_close_pool,
         patch("bot.close_redis", new_callable=AsyncMock) as mock_close_redis,
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
         patch("os.getenv") as mock_getenv,
     ):
         mock_getenv.return_value = "FAKE_TOKEN"
@@ -1148,13 +1420,14 @@ async def test_main_success():
 
         mock_init_db.assert_called_once()
         mock_load_cogs.assert_called_once()
-        mock_bot_start.assert_called_once_with("FAKE_TOKEN")
+        mock_bot_login.assert_called_once_with("FAKE_TOKEN")
+        mock_bot_connect.assert_called_once()
         mock_close_pool.assert_called_once()
         mock_close_redis.assert_called_once()
-        mock_print.assert_any_call("Initializing database connection...")
-        mock_print.assert_any_call("Database initialized successfully!")
-        mock_print.assert_any_call("Closing database connections...")
-        mock_print.assert_any_call("Database connections closed.")
+        mock_log.info.assert_any_call("Initializing database connection...")
+        mock_log.info.assert_any_call("Database initialized successfully!")
+        mock_log.info.assert_any_call("Closing database connections...")
+        mock_log.info.assert_any_call("Database connections closed.")
 
 
 @pytest.mark.asyncio
@@ -1162,20 +1435,48 @@ async def test_main_db_init_failure():
     with (
         patch("bot.initialize_database", new_callable=AsyncMock, return_value=False) as mock_init_db,
         patch("bot.load_cogs", new_callable=AsyncMock) as mock_load_cogs,
-        patch("bot.bot.start", new_callable=AsyncMock) as mock_bot_start,
+        patch("bot.bot.login", new_callable=AsyncMock) as mock_bot_login,
         patch("bot.close_pool", new_callable=AsyncMock) as mock_close_pool,
         patch("bot.close_redis", new_callable=AsyncMock) as mock_close_redis,
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
         patch("os.getenv", return_value="FAKE_TOKEN"),
     ):
         await main()
 
         mock_init_db.assert_called_once()
         mock_load_cogs.assert_not_called()
-        mock_bot_start.assert_not_called()
+        mock_bot_login.assert_not_called()
         mock_close_pool.assert_called_once()
         mock_close_redis.assert_called_once()
-        mock_print.assert_any_call("Failed to initialize database. Exiting.")
+        mock_log.error.assert_any_call("Failed to initialize database. Exiting.")
+
+
+@pytest.mark.asyncio
+async def test_main_reads_debug_flag_after_load_dotenv(monkeypatch):
+    monkeypatch.delenv("OPENGUARD_DEBUG", raising=False)
+    monkeypatch.setenv("DISCORD_TOKEN", "FAKE_TOKEN")
+
+    def fake_load_dotenv(path):
+        monkeypatch.setenv("OPENGUARD_DEBUG", "1")
+
+    with (
+        patch("bot.load_dotenv", side_effect=fake_load_dotenv),
+        patch("bot.register_debug_commands") as mock_register,
+        patch("bot.initialize_database", new_callable=AsyncMock, return_value=False),
+        patch("bot.close_pool", new_callable=AsyncMock),
+        patch("bot.close_redis", new_callable=AsyncMock),
+        patch("bot.log"),
+    ):
+        await main()
+
+    mock_register.assert_called_once_with(bot)
+
+
+def test_register_debug_commands(mock_bot):
+    register_debug_commands(mock_bot)
+
+    assert mock_bot.get_command("testerror") is not None
+    assert mock_bot.tree.get_command("testerror") is not None
 
 
 @pytest.mark.asyncio
@@ -1184,7 +1485,7 @@ async def test_main_bot_start_failure():
         patch("bot.initialize_database", new_callable=AsyncMock, return_value=True),
         patch("bot.load_cogs", new_callable=AsyncMock),
         patch(
-            "bot.bot.start",
+            "bot.bot.login",
             new_callable=AsyncMock,
             side_effect=Exception("Bot start error"),
         ) as mock_bot_start,
@@ -0,0 +1,100 @@
+import json
+import os
+import uuid
+
+import asyncpg
+import pytest
+import pytest_asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from database.connection import initialize_database
+from database.models import PREFIX_SYNC_SQL, SCHEMA_SQL, TRIGGERS_SQL
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+requires_postgres = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set; the prefix sync trigger needs a real PostgreSQL"
+)
+
+# Mirrors the upsert set_guild_setting issues through insert_or_update.
+UPSERT_SETTING = """
+INSERT INTO guild_settings (guild_id, key, value) VALUES ($1, $2, $3)
+ON CONFLICT (guild_id, key) DO UPDATE SET value = EXCLUDED.value
+"""
+
+
+def table_ddl(table):
+    return next(
+        statement for statement in SCHEMA_SQL.split(";") if f"CREATE TABLE IF NOT EXISTS {table} (" in statement
+    )
+
+
+@pytest_asyncio.fixture
+async def conn():
+    # Each test gets its own schema so the trigger never touches real data.
+    conn = await asyncpg.connect(TEST_DATABASE_URL)
+    schema = f"test_prefix_sync_{uuid.uuid4().hex}"
+    await conn.execute(f"CREATE SCHEMA {schema}")
+    await conn.execute(f"SET search_path TO {schema}")
+    await conn.execute(table_ddl("guild_settings"))
+    await conn.execute(table_ddl("guild_prefixes"))
+    try:
+        yield conn
+    finally:
+        await conn.execute(f"DROP SCHEMA {schema} CASCADE")
+        await conn.close()
+
+
+async def stored_prefixes(conn):
+    return {row["guild_id"]: row["prefix"] for row in await conn.fetch("SELECT guild_id, prefix FROM guild_prefixes")}
+
+
+@requires_postgres
+@pytest.mark.asyncio
+async def test_prefix_sync_backfills_existing_prefixes(conn):
+    await conn.execute(UPSERT_SETTING, 1, "prefix", json.dumps("?"))
+    await conn.execute(UPSERT_SETTING, 1, "other", json.dumps("x"))
+
+    await conn.execute(PREFIX_SYNC_SQL)
+
+    assert await stored_prefixes(conn) == {1: "?"}
+
+
+@requires_postgres
+@pytest.mark.asyncio
+async def test_prefix_writes_are_mirrored(conn):
+    await conn.execute(PREFIX_SYNC_SQL)
+
+    await conn.execute(UPSERT_SETTING, 1, "prefix", json.dumps("!"))
+    assert await stored_prefixes(conn) == {1: "!"}
+
+    await conn.execute(UPSERT_SETTING, 1, "prefix", json.dumps("$"))
+    await conn.execute(UPSERT_SETTING, 2, "not_prefix", json.dumps("$"))
+    assert await stored_prefixes(conn) == {1: "$"}
+
+    await conn.execute("DELETE FROM guild_settings WHERE guild_id = $1 AND key = $2", 1, "prefix")
+    assert await stored_prefixes(conn) == {}
+
+
+@requires_postgres
+@pytest.mark.asyncio
+async def test_null_prefix_removes_mirrored_row(conn):
+    await conn.execute(PREFIX_SYNC_SQL)
+
+    await conn.execute(UPSERT_SETTING, 1, "prefix", json.dumps("!"))
+    await conn.execute(UPSERT_SETTING, 1, "prefix", json.dumps(None))
+
+    assert await stored_prefixes(conn) == {}
+
+
+@pytest.mark.asyncio
+async def test_initialize_database_installs_prefix_sync_after_triggers():
+    mock_conn = MagicMock()
+    mock_conn.execute = AsyncMock()
+    mock_conn.close = AsyncMock()
+
+    with patch("database.connection.asyncpg.connect", new=AsyncMock(return_value=mock_conn)):
+        assert await initialize_database() is True
+
+    executed = [call.args[0] for call in mock_conn.execute.await_args_list]
+    assert executed.index(PREFIX_SYNC_SQL) > executed.index(TRIGGERS_SQL)
@@ -22,33 +22,33 @@ def mock_member():
 @pytest.mark.asyncio
 async def test_on_member_join_adds_to_cache(mock_member):
     redis_mock = AsyncMock()
-    with patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)), patch("builtins.print") as mock_print:
+    with patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)), patch("bot.log") as mock_log:
         await on_member_join(mock_member)
         redis_mock.sadd.assert_awaited_once_with("guild:999:members", 111)
-        mock_print.assert_called_once_with("Added member 111 to cache for guild 999")
+        mock_log.info.assert_called_once_with("Added member 111 to cache for guild 999")
 
 
 @pytest.mark.asyncio
 async def test_on_member_join_no_redis(mock_member):
-    with patch("bot.get_redis_client", new=AsyncMock(return_value=None)), patch("builtins.print") as mock_print:
+    with patch("bot.get_redis_client", new=AsyncMock(return_value=None)), patch("bot.log") as mock_log:
         await on_member_join(mock_member)
-        mock_print.assert_not_called()
+        mock_log.info.assert_not_called()
 
 
 @pytest.mark.asyncio
 async def test_on_member_remove_removes_from_cache(mock_member):
     redis_mock = AsyncMock()
-    with patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)), patch("builtins.print") as mock_print:
+    with patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)), patch("bot.log") as mock_log:
         await on_member_remove(mock_member)
         redis_mock.srem.assert_awaited_once_with("guild:999:members", 111)
-        mock_print.assert_called_once_with("Removed member 111 from cache for guild 999")
+        mock_log.info.assert_called_once_with("Removed member 111 from cache for guild 999")
 
 
 @pytest.mark.asyncio
 async def test_on_member_remove_no_redis(mock_member):
-    with patch("bot.get_redis_client", new=AsyncMock(return_value=None)), patch("builtins.print") as mock_print:
+    with patch("bot.get_redis_client", new=AsyncMock(return_value=None)), patch("bot.log") as mock_log:
         await on_member_remove(mock_member)
-        mock_print.assert_not_called()
+        mock_log.info.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -65,14 +65,14 @@ async def test_update_guild_member_cache_success():
     pipe_mock.execute = AsyncMock()
     redis_mock.pipeline.return_value = pipe_mock
 
-    with patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)), patch("builtins.print") as mock_print:
+    with patch("bot.get_redis_client", new=AsyncMock(return_value=redis_mock)), patch("bot.log") as mock_log:
         await update_guild_member_cache(guild)
 
         redis_mock.pipeline.assert_called_once()
         pipe_mock.delete.assert_called_once_with("guild:42:members")
         pipe_mock.sadd.assert_called_once_with("guild:42:members", "1", "2")
         pipe_mock.execute.assert_awaited_once()
-        mock_print.assert_called_once_with("Updated member cache for guild Guild (42) with 2 members.")
+        mock_log.info.assert_called_once_with("Updated member cache for guild Guild (42) with 2 members.")
 
 
 @pytest.mark.asyncio
@@ -93,9 +93,9 @@ async def test_update_all_guild_member_caches():
     with (
         patch("bot.bot", mock_bot),
         patch("bot.update_guild_member_cache", new=AsyncMock()) as mock_update,
-        patch("builtins.print") as mock_print,
+        patch("bot.log") as mock_log,
     ):
         await update_all_guild_member_caches()
         assert mock_update.await_count == 2
-        mock_print.assert_any_call("Starting to cache all guild members...")
-        mock_print.assert_any_call("Finished caching all guild members.")
+        mock_log.info.assert_any_call("Starting to cache all guild members...")
+        mock_log.info.assert_any_call("Finished caching all guild members.")
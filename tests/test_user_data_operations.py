@@ -0,0 +1,48 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from database.operations import get_user_data, unset_user_data_field
+
+
+@pytest.mark.asyncio
+async def test_get_user_data_returns_stored_data():
+    with patch("database.operations.execute_query", new=AsyncMock(return_value={"data": '{"note": "hi"}'})):
+        assert await get_user_data(1) == {"note": "hi"}
+
+
+@pytest.mark.asyncio
+async def test_get_user_data_missing_user_returns_empty_dict():
+    with patch("database.operations.execute_query", new=AsyncMock(return_value=None)):
+        assert await get_user_data(1) == {}
+
+
+@pytest.mark.asyncio
+async def test_get_user_data_propagates_query_errors():
+    with patch("database.operations.execute_query", new=AsyncMock(side_effect=RuntimeError("db down"))):
+        with pytest.raises(RuntimeError, match="db down"):
+            await get_user_data(1)
+
+
+@pytest.mark.asyncio
+async def test_unset_user_data_field_removes_key_in_one_query():
+    with patch("database.operations.execute_query", new=AsyncMock(return_value={"user_id": 1})) as mock_query:
+        assert await unset_user_data_field(1, "note") is True
+
+    mock_query.assert_awaited_once_with(
+        "UPDATE user_data SET data = data - $2 WHERE user_id = $1 AND data ? $2 RETURNING user_id",
+        1,
+        "note",
+        fetch_one=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_unset_user_data_field_missing_key_returns_false():
+    with patch("database.operations.execute_query", new=AsyncMock(return_value=None)):
+        assert await unset_user_data_field(1, "note") is False
+
+
+@pytest.mark.asyncio
+async def test_unset_user_data_field_query_error_returns_false():
+    with patch("database.operations.execute_query", new=AsyncMock(side_effect=RuntimeError("db down"))):
+        assert await unset_user_data_field(1, "note") is False